@@ -0,0 +1,286 @@
+# File: de-onboarding/benchmark.py
+# Benchmark the five sales engines on generated data, check totals, compare to a baseline
+import os  # For paths and environment
+import sys  # For the worker entry point and exit codes
+import json  # For worker results and the baseline
+import time  # For timing
+import shutil  # For removing CSV caches
+import argparse  # For command-line options
+import tempfile  # For generated inputs
+import resource  # For peak RSS
+import subprocess  # One clean process per engine run
+import tracemalloc  # For Python allocation peaks
+from contextlib import redirect_stdout  # For silencing engine prints
+from decimal import Decimal  # For exact expected totals
+import generate_data  # Inputs with known per-class totals
+
+ROOT = os.path.dirname(os.path.abspath(__file__))  # Directory of this file
+BASELINE_PATH = os.path.join(ROOT, "data", "benchmark_baseline.json")  # Default
+THRESHOLD = 0.25  # Allowed slowdown or memory growth before a run fails
+
+
+def run_ch01(csv_path):  # Streaming dict engine
+    """Run ch01 calculate_sales; return (valid rows, total sales)."""
+    import ch01_06_sales_analyzer as analyzer
+
+    results = analyzer.calculate_sales(analyzer.iter_csv(csv_path))
+    return results["valid_sales"], results["total_sales"]
+
+
+def run_ch02(csv_path):  # csv.DictReader engine
+    """Run ch02 load_and_validate_sales + process_sales."""
+    import sales_processor
+
+    config = sales_processor.read_config("data/config.yaml")  # Engine's own rules
+    sales, _ = sales_processor.load_and_validate_sales(csv_path, config)
+    results, valid_sales = sales_processor.process_sales(sales)
+    return valid_sales, results["total_sales"]
+
+
+def run_ch03(csv_path):  # pandas engine
+    """Run ch03 load_and_validate_sales + process_sales."""
+    import sales_processor
+
+    config = sales_processor.read_config("data/config.yaml")  # Engine's own rules
+    df, _, _ = sales_processor.load_and_validate_sales(csv_path, config)
+    results, valid_sales = sales_processor.process_sales(df)
+    return valid_sales, results["total_sales"]
+
+
+def run_ch05(csv_path):  # OOP pandas engine
+    """Run ch05 TransactionProcessor.process_data."""
+    import fetcher
+
+    config = fetcher.ConfigReader("data/config.yaml").config  # Engine's own rules
+    results, valid_sales = fetcher.TransactionProcessor(config).process_data(csv_path)
+    return valid_sales, results["total_sales"]
+
+
+def run_ch06(csv_path):  # Integrated pandas engine
+    """Run ch06 load_data + SalesProcessor with an empty mock API file."""
+    import main
+
+    config = main.load_config("data/config.yaml")  # Engine's own rules
+    api_path = os.path.join(os.path.dirname(csv_path), "empty_api.json")  # []
+    df = main.load_data(csv_path, api_path, fields=config.required_fields)
+    processor = main.SalesProcessor(df, config)  # Validate and aggregate
+    processor.validate_data()
+    return len(processor.df), processor.compute_metrics()["total_sales"]
+
+
+def peak_rss_mb():  # High-water mark of this process
+    """Return the peak resident memory of this process in MB."""
+    try:  # Linux: VmHWM is reset by exec, ru_maxrss keeps the parent's peak
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):  # "VmHWM:   123456 kB"
+                    return int(line.split()[1]) / 1024
+    except OSError:  # No procfs (macOS)
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+# Engine -> (directory, runner, classes of generated rows its rules accept)
+ENGINES = {
+    "ch01": (
+        "ch01_python_core_language_essentials",
+        run_ch01,
+        ("valid", "bad_prefix", "too_many"),
+    ),
+    "ch02": (
+        "ch02_python_data_handling_and_error_management/ch02_05_micro_projects",
+        run_ch02,
+        ("valid",),
+    ),
+    "ch03": (
+        "ch03_essential_data_libraries_numpy_and_pandas_basics/ch_03_04_micro_projects",
+        run_ch03,
+        ("valid", "bad_prefix"),
+    ),
+    "ch05": (
+        "ch05_object_oriented_programming_for_data_engineering/"
+        "ch05_04_micro_project_oop_based_transaction_data_fetcher",
+        run_ch05,
+        ("valid",),
+    ),
+    "ch06": (
+        "ch06_checkpoint_01_python_foundations_review/"
+        "ch06_02_micro_project_integrated_sales_data_tool",
+        run_ch06,
+        ("valid",),
+    ),
+}
+
+
+def worker(engine, csv_path, repeat):  # Runs inside the child process
+    """Time one engine on csv_path and print its measurements as JSON."""
+    directory, runner, _ = ENGINES[engine]  # Engine details
+    os.chdir(os.path.join(ROOT, directory))  # Engines open data/config.yaml
+    sys.path.insert(0, os.getcwd())  # Engine modules first
+    rows = sum(1 for _ in open(csv_path, "rb")) - 1  # Data rows
+    best = None  # Fastest run
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # No prints
+        for _ in range(repeat):  # Best of repeat runs
+            shutil.rmtree(csv_path + ".cache", ignore_errors=True)  # Cold load
+            start = time.perf_counter()  # Start timer
+            valid_sales, total_sales = runner(csv_path)  # Run engine
+            elapsed = time.perf_counter() - start  # Elapsed seconds
+            best = elapsed if best is None else min(best, elapsed)
+        peak_rss = peak_rss_mb()  # Before tracemalloc adds its own overhead
+
+        shutil.rmtree(csv_path + ".cache", ignore_errors=True)  # Cold load
+        tracemalloc.start()  # Traced run for Python allocations
+        runner(csv_path)
+        traced = tracemalloc.get_traced_memory()[1]  # Peak bytes
+        tracemalloc.stop()
+    shutil.rmtree(csv_path + ".cache", ignore_errors=True)  # Leave no cache behind
+    print(
+        json.dumps(
+            {
+                "valid_sales": int(valid_sales),
+                "total_sales": float(total_sales),
+                "seconds": best,
+                "rows_per_sec": rows / best,
+                "peak_rss_mb": peak_rss,
+                "tracemalloc_mb": traced / 1e6,
+            }
+        )
+    )  # Last line of output is the result
+
+
+def measure(engine, csv_path, repeat):  # Start a clean process per engine
+    """Return the worker's measurements for one engine and input."""
+    env = dict(os.environ, DE_LOG_MODE="production")  # No per-row logging
+    completed = subprocess.run(
+        [sys.executable, __file__, "--worker", engine, csv_path, str(repeat)],
+        capture_output=True,
+        text=True,
+        env=env,
+    )  # Separate process: same module names, fresh RSS
+    if completed.returncode != 0:  # Engine crashed
+        raise RuntimeError(f"{engine} failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])  # Result line
+
+
+def expected_totals(manifest, accepts):  # What an engine should report
+    """Return (valid rows, amount, allowed error) for the accepted classes."""
+    classes = manifest["classes"]  # Per-class rows and amounts
+    rows = sum(classes[name]["rows"] for name in accepts)  # Exact count
+    amount = sum(Decimal(classes[name]["amount"]) for name in accepts)  # Exact
+    tolerance = Decimal("0.01") + amount.copy_abs() * Decimal("1e-9")  # Float sums
+    return rows, amount, tolerance
+
+
+def check_result(result, manifest, accepts):  # Totals agree with the data
+    """Return an error message, or None if the engine's totals are right."""
+    rows, amount, tolerance = expected_totals(manifest, accepts)  # Expected
+    if result["valid_sales"] != rows:  # Row counts are always exact
+        return f"valid_sales {result['valid_sales']} != {rows}"
+    error = abs(Decimal(repr(result["total_sales"])) - amount)  # Amount error
+    if error > tolerance:  # Too far from the exact total
+        return f"total_sales {result['total_sales']} != {amount} (error {error})"
+    return None
+
+
+def compare(key, result, baseline, threshold):  # Regression check
+    """Return a message for each metric that regressed past threshold."""
+    old = baseline.get(key)  # Stored measurements
+    if old is None:  # New case, nothing to compare
+        return []
+    problems = []  # Regressions found
+    if result["rows_per_sec"] < old["rows_per_sec"] * (1 - threshold):  # Slower
+        problems.append(
+            f"{key}: {result['rows_per_sec']:,.0f} rows/sec, "
+            f"baseline {old['rows_per_sec']:,.0f}"
+        )
+    for metric in ("peak_rss_mb", "tracemalloc_mb"):  # More memory
+        if result[metric] > old[metric] * (1 + threshold) + 1:  # 1 MB slack
+            problems.append(
+                f"{key}: {metric} {result[metric]:.1f}, baseline {old[metric]:.1f}"
+            )
+    return problems
+
+
+def run_matrix(sizes, ratios, engines, repeat, threshold, baseline):  # All cases
+    """Run every engine on every (size, ratio) input; return (results, failures)."""
+    results = {}  # "engine/rows/ratio" -> measurements
+    failures = []  # Wrong totals and regressions
+    with tempfile.TemporaryDirectory() as tmp_dir:  # Generated inputs
+        with open(os.path.join(tmp_dir, "empty_api.json"), "w") as file:
+            file.write("[]\n")  # ch06 also loads a mock API file
+        for rows in sizes:  # Dataset sizes
+            for ratio in ratios:  # Invalid ratio, split over the failure classes
+                invalid = {
+                    name: ratio / (len(generate_data.CLASS_NAMES) - 1)
+                    for name in generate_data.CLASS_NAMES[1:]
+                }
+                manifest = generate_data.generate(
+                    tmp_dir,
+                    rows,
+                    invalid=invalid,
+                    config_path=os.path.join(ROOT, "data", "config.yaml"),
+                    files=("sales",),
+                )  # sales.csv with known totals
+                csv_path = os.path.join(tmp_dir, "sales.csv")  # Input file
+                for engine in engines:  # One process per engine
+                    key = f"{engine}/{rows}/{ratio}"  # Baseline key
+                    result = measure(engine, csv_path, repeat)  # Run
+                    results[key] = result
+                    error = check_result(result, manifest, ENGINES[engine][2])
+                    if error:  # Wrong totals
+                        failures.append(f"{key}: {error}")
+                    failures.extend(compare(key, result, baseline, threshold))
+                    print(
+                        f"{key:<22} {result['rows_per_sec']:>12,.0f} rows/sec "
+                        f"{result['peak_rss_mb']:>8.1f} MB RSS "
+                        f"{result['tracemalloc_mb']:>8.1f} MB traced "
+                        f"{'ok' if not error else 'WRONG TOTALS'}"
+                    )  # Report line
+    return results, failures
+
+
+def parse_args():  # Command-line options
+    """Return parsed command-line options."""
+    parser = argparse.ArgumentParser(description="Benchmark the sales engines")
+    parser.add_argument("--sizes", default="100000,1000000", help="rows per input")
+    parser.add_argument("--ratios", default="0,0.05", help="invalid-row ratios")
+    parser.add_argument("--engines", default=",".join(ENGINES), help="engines to run")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs, best kept")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="slack")
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    return parser.parse_args()
+
+
+def main():  # Main function
+    """Run the matrix, report, and exit 1 on wrong totals or regressions."""
+    args = parse_args()  # Options
+    baseline = {}  # Stored measurements
+    if os.path.exists(args.baseline) and not args.save:  # Compare with last save
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+    results, failures = run_matrix(
+        [int(size) for size in args.sizes.split(",")],
+        [float(ratio) for ratio in args.ratios.split(",")],
+        args.engines.split(","),
+        args.repeat,
+        args.threshold,
+        baseline,
+    )
+    if args.save:  # Store as the new baseline
+        with open(args.baseline, "w") as file:
+            json.dump(
+                {"python": sys.version.split()[0], "results": results}, file, indent=2
+            )
+        print(f"Baseline saved to {args.baseline}")  # Confirm
+    for failure in failures:  # Wrong totals first, then regressions
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)  # Non-zero exit for CI
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":  # Child process
+        worker(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        main()  # Run main function
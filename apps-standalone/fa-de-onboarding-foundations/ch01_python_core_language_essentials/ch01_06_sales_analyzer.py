@@ -1,5 +1,9 @@
 # File: de-onboarding/sales_analyzer.py
 # Sales Data Analyzer for processing sales.csv
+import logging  # For log levels
+import line_index  # For reading row slices through the offset index
+import money  # Integer-cent amounts
+from logging_utils import logger, rejects  # Leveled, lazily formatted logs
 
 
 def is_numeric(s):  # Check if string is a decimal number
@@ -16,43 +20,107 @@ def clean_string(s):  # Clean string by stripping whitespace
 
 
 def validate_sale(sale):  # Validate a sale dictionary
-    """Validate sale for non-empty product, numeric price/quantity, positive values."""
-    print(f"Validating sale: {sale}")  # Debug: print sale
+    """Validate sale for non-empty product, numeric price/quantity, positive values.
+
+    Prices with more than two decimals are rejected: totals are summed in cents.
+    """
+    logger.debug("Validating sale: %s", sale)  # Debug: formatted only if enabled
     # Check for missing or empty fields
     if not sale["product"] or sale["product"].strip() == "":
-        print(f"Invalid sale: missing product: {sale}")  # Log invalid
+        logger.debug("Invalid sale: missing product: %s", sale)  # Log invalid
+        rejects.record("missing_product", sale)  # Count reason
         return False
 
     # Validate price: numeric and positive
     price = clean_string(sale["price"])
     if not is_numeric(price) or float(price) <= 0:
-        print(f"Invalid sale: invalid price: {sale}")  # Log invalid
+        logger.debug("Invalid sale: invalid price: %s", sale)  # Log invalid
+        rejects.record("invalid_price", sale)  # Count reason
+        return False
+    if len(price.partition(".")[2]) > money.DECIMALS:  # Summed as whole cents
+        logger.debug("Invalid sale: sub-cent price: %s", sale)  # Log invalid
+        rejects.record("invalid_price_decimals", sale)  # Count reason
         return False
 
     # Validate quantity: integer and positive
     quantity = clean_string(sale["quantity"])
     if not quantity.isdigit() or int(quantity) <= 0:
-        print(f"Invalid sale: invalid quantity: {sale}")  # Log invalid
+        logger.debug("Invalid sale: invalid quantity: %s", sale)  # Log invalid
+        rejects.record("invalid_quantity", sale)  # Count reason
         return False
 
     return True  # Return True if all checks pass
 
 
-def parse_csv(csv_path):  # Read and parse CSV
+class Sale:  # Compact sale record
+    """Sale with price and quantity already parsed; __slots__ avoids a per-row dict."""
+
+    __slots__ = ("product", "price_cents", "quantity")  # No __dict__
+
+    def __init__(self, product, price_cents, quantity):  # Constructor
+        self.product = product  # Product name
+        self.price_cents = price_cents  # Integer price in cents
+        self.quantity = quantity  # Integer quantity
+
+    def __repr__(self):  # Readable debug output
+        return f"Sale({self.product!r}, {self.price_cents!r}, {self.quantity!r})"
+
+
+def parse_sale(fields):  # Validate positional fields and build a Sale
+    """Return a Sale from [product, price, quantity] strings, or None if invalid."""
+    product, price, quantity = fields  # Positional fields, no dict
+    logger.debug("Validating sale: %s", fields)  # Debug: formatted only if enabled
+    if not product or product.strip() == "":  # Same rule as validate_sale
+        logger.debug("Invalid sale: missing product: %s", fields)  # Log invalid
+        rejects.record("missing_product", fields)  # Count reason
+        return None
+
+    price = clean_string(price)  # Clean price string
+    if not is_numeric(price):  # Check format before parsing
+        logger.debug("Invalid sale: invalid price: %s", fields)  # Log invalid
+        rejects.record("invalid_price", fields)  # Count reason
+        return None
+    if float(price) <= 0:  # Check positive
+        logger.debug("Invalid sale: invalid price: %s", fields)  # Log invalid
+        rejects.record("invalid_price", fields)  # Count reason
+        return None
+    if len(price.partition(".")[2]) > money.DECIMALS:  # Same rule as validate_sale
+        logger.debug("Invalid sale: sub-cent price: %s", fields)  # Log invalid
+        rejects.record("invalid_price_decimals", fields)  # Count reason
+        return None
+    price = money.parse_cents(price)  # Parse price exactly once, as cents
+
+    quantity = clean_string(quantity)  # Clean quantity string
+    if not quantity.isdigit() or int(quantity) <= 0:  # Check format and value
+        logger.debug("Invalid sale: invalid quantity: %s", fields)  # Log invalid
+        rejects.record("invalid_quantity", fields)  # Count reason
+        return None
+
+    return Sale(product, price, int(quantity))  # Parsed values travel on
+
+
+def open_sales(csv_path, rows=None):  # Open whole file or a row slice
+    """Open CSV; rows=(start, stop) seeks via the line-offset index instead."""
+    if rows is None:  # Whole file
+        return open(csv_path, "r")
+    return line_index.open_rows(csv_path, rows[0], rows[1])  # O(1) seek
+
+
+def parse_csv(csv_path, rows=None):  # Read and parse CSV
     """Read sales CSV and return list of sale dictionaries."""
     sales = []  # List to store sales
     print(f"Opening CSV: {csv_path}")  # Debug: print path
-    file = open(csv_path, "r")  # Open file
+    file = open_sales(csv_path, rows)  # Open file
     lines = file.readlines()  # Read all lines
     file.close()  # Close file
 
     # Skip header
     for line in lines[1:]:  # Start from second line
-        print(f"Parsing line: {line.strip()}")  # Debug: print line
+        logger.debug("Parsing line: %s", line.strip())  # Debug: print line
         parts = line.strip().split(",")  # Split on comma
-        print(f"Fields: {len(parts)}")  # Debug: print number of fields
+        logger.debug("Fields: %d", len(parts))  # Debug: print number of fields
         if len(parts) != 3:  # Check for correct number of fields
-            print(f"Invalid line format: {line.strip()}")  # Log invalid
+            logger.debug("Invalid line format: %s", line.strip())  # Log invalid
             continue
         sale = {
             "product": parts[0],
@@ -61,41 +129,98 @@ def parse_csv(csv_path):  # Read and parse CSV
         }  # Create sale dictionary
         sales.append(sale)  # Add to list
 
-    print(f"Parsed sales: {sales}")  # Debug: print sales
+    logger.debug("Parsed sales: %s", sales)  # Debug: print sales
     return sales  # Return list
 
 
+def iter_fields(csv_path, rows=None):  # Stream CSV as field lists
+    """Yield [product, price, quantity] string lists one line at a time."""
+    logger.debug("Opening CSV: %s", csv_path)  # Debug: print path
+    debug = logger.isEnabledFor(logging.DEBUG)  # Check level once, not per row
+    with open_sales(csv_path, rows) as file:  # Close file even if caller stops
+        next(file, None)  # Skip header
+        for line in file:  # Read one line at a time, never the whole file
+            text = line.strip()  # Strip once, reused for parsing and logs
+            parts = text.split(",")  # Split on comma
+            if debug:
+                logger.debug("Parsing line: %s", text)  # Debug: print line
+                logger.debug("Fields: %d", len(parts))  # Debug: number of fields
+            if len(parts) != 3:  # Check for correct number of fields
+                logger.debug("Invalid line format: %s", text)  # Log invalid
+                rejects.record("invalid_line_format", text)  # Count reason
+                continue
+            yield parts  # Hand over one row, nothing is kept
+
+
+def iter_csv(csv_path, rows=None):  # Stream and parse CSV
+    """Yield sale dictionaries one line at a time (constant memory)."""
+    for parts in iter_fields(csv_path, rows):  # Same parsing as iter_fields
+        yield {
+            "product": parts[0],
+            "price": parts[1],
+            "quantity": parts[2],
+        }  # Hand over one sale, nothing is kept
+
+
 def calculate_sales(sales):  # Process sales and compute metrics
-    """Calculate total sales and unique products."""
-    total_sales = 0.0  # Initialize total
+    """Calculate total sales and unique products from any iterable of sales."""
+    total_cents = 0  # Initialize total, exact integer cents
     unique_products = set()  # Set for unique products
     valid_sales = 0  # Count valid sales
     invalid_sales = 0  # Count invalid sales
+    debug = logger.isEnabledFor(logging.DEBUG)  # Check level once, not per row
 
     for sale in sales:  # Iterate over sales
         if validate_sale(sale):  # Validate sale
-            price = float(sale["price"])  # Convert price
+            price = money.parse_cents(sale["price"])  # Convert price to cents
             quantity = int(sale["quantity"])  # Convert quantity
-            amount = price * quantity  # Calculate amount
-            total_sales += amount  # Add to total
+            amount = price * quantity  # Calculate amount in cents
+            total_cents += amount  # Add to total
             unique_products.add(sale["product"])  # Add product to set
             valid_sales += 1  # Increment valid count
-            print(f"Valid sale, amount: {amount}")  # Debug: print amount
+            if debug:
+                logger.debug("Valid sale, amount: %s", money.to_decimal(amount))
         else:
             invalid_sales += 1  # Increment invalid count
 
+    rejects.log_summary()  # One line of per-reason counts
     return {
-        "total_sales": total_sales,
+        "total_sales": money.to_float(total_cents),  # Converted once, at the end
         "unique_products": list(unique_products),
         "valid_sales": valid_sales,
         "invalid_sales": invalid_sales,
     }  # Return results
 
 
+def calculate_sale_records(rows):  # Lean version of calculate_sales
+    """Calculate the calculate_sales metrics from [product, price, quantity] lists."""
+    total_cents = 0  # Initialize total, exact integer cents
+    unique_products = set()  # Set for unique products
+    valid_sales = 0  # Count valid sales
+    invalid_sales = 0  # Count invalid sales
+
+    for fields in rows:  # No dict per row
+        sale = parse_sale(fields)  # Validate and parse once
+        if sale is None:  # Invalid row
+            invalid_sales += 1  # Increment invalid count
+            continue
+        total_cents += sale.price_cents * sale.quantity  # Reuse parsed values
+        unique_products.add(sale.product)  # Add product to set
+        valid_sales += 1  # Increment valid count
+
+    rejects.log_summary()  # One line of per-reason counts
+    return {
+        "total_sales": money.to_float(total_cents),  # Converted once, at the end
+        "unique_products": list(unique_products),
+        "valid_sales": valid_sales,
+        "invalid_sales": invalid_sales,
+    }  # Same shape as calculate_sales
+
+
 def main():  # Main function
     """Main function to analyze sales data."""
     csv_path = "data/sales.csv"  # CSV path
-    sales = parse_csv(csv_path)  # Parse CSV
+    sales = iter_csv(csv_path)  # Stream CSV, rows are folded one by one
     results = calculate_sales(sales)  # Calculate metrics
 
     # Output report
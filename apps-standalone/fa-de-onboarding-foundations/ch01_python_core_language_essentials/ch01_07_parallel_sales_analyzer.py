@@ -0,0 +1,176 @@
+# File: de-onboarding/parallel_sales_analyzer.py
+# Multi-core Sales Data Analyzer: splits sales.csv into byte-range shards
+import os  # For file size and CPU count
+import sys  # For command-line flag
+import time  # For benchmark timing
+import tempfile  # For benchmark input file
+from multiprocessing import Pool  # For process pool
+import ch01_06_sales_analyzer as analyzer  # Reuse parsing and validation
+import line_index  # For evenly sized shards from a saved index
+import money  # Integer-cent amounts
+import logging_utils  # For quiet mode and reject counts
+
+
+def find_shards(csv_path, num_shards):  # Split file into byte ranges
+    """Return (start, end) byte ranges that begin and end on line boundaries."""
+    offsets = line_index.load_index(csv_path)  # Saved index, if still valid
+    if offsets is not None:  # Equal row counts per shard, no pre-scan
+        return line_index.split_ranges(offsets, num_shards)
+
+    size = os.path.getsize(csv_path)  # Total bytes
+    with open(csv_path, "rb") as file:  # Binary mode for exact offsets
+        header_end = len(file.readline())  # First row starts after header
+        body = size - header_end  # Bytes holding sales rows
+        starts = [header_end]  # First shard starts after header
+        for i in range(1, num_shards):  # Pick evenly spaced cut points
+            file.seek(header_end + body * i // num_shards - 1)  # Byte before cut
+            file.readline()  # Move to the start of the next full line
+            cut = file.tell()  # Line boundary at or after the cut
+            if starts[-1] < cut < size:  # Skip empty or duplicate shards
+                starts.append(cut)
+
+    ends = starts[1:] + [size]  # Each shard ends where the next begins
+    shards = list(zip(starts, ends))  # Pair starts with ends
+    return shards  # Return list of ranges
+
+
+def process_shard(task):  # Parse, validate and aggregate one shard
+    """Return partial totals for the rows inside one byte range."""
+    csv_path, start, end = task  # Unpack task tuple
+    total_cents = 0  # Shard total, exact integer cents
+    unique_products = set()  # Shard products
+    valid_sales = 0  # Shard valid count
+    invalid_sales = 0  # Shard invalid count
+    logging_utils.rejects.counts.clear()  # Count this shard's reasons only
+
+    with open(csv_path, "rb") as file:  # Binary mode to track offsets
+        file.seek(start)  # Jump straight to the shard
+        position = start  # Current byte offset
+        for raw_line in file:  # Read one line at a time
+            if position >= end:  # Next shard owns the rest
+                break
+            position += len(raw_line)  # Advance offset
+            parts = raw_line.decode("utf-8").strip().split(",")  # Split fields
+            if len(parts) != 3:  # Same format rule as parse_csv
+                logging_utils.rejects.record("invalid_line_format", parts)
+                continue
+            sale = analyzer.parse_sale(parts)  # Parse once, no dict per row
+            if sale is None:  # Invalid row
+                invalid_sales += 1  # Increment invalid count
+                continue
+            total_cents += sale.price_cents * sale.quantity  # Reuse parsed values
+            unique_products.add(sale.product)  # Add product to set
+            valid_sales += 1  # Increment valid count
+
+    shard_rejects = logging_utils.rejects.counts.copy()  # Per-reason counts
+    logging_utils.rejects.counts.clear()  # Merged back by merge_partials
+    return {
+        "total_cents": total_cents,
+        "unique_products": unique_products,
+        "valid_sales": valid_sales,
+        "invalid_sales": invalid_sales,
+        "rejects": shard_rejects,
+    }  # Return partial result
+
+
+def merge_partials(partials):  # Combine shard results
+    """Merge partial results into the dict returned by calculate_sales."""
+    total_cents = 0  # Merged total, exact integer cents
+    unique_products = set()  # Merged products
+    valid_sales = 0  # Merged valid count
+    invalid_sales = 0  # Merged invalid count
+    for partial in partials:  # Shards are merged in file order
+        total_cents += partial["total_cents"]  # Add shard total
+        unique_products |= partial["unique_products"]  # Union of products
+        valid_sales += partial["valid_sales"]  # Add valid count
+        invalid_sales += partial["invalid_sales"]  # Add invalid count
+        logging_utils.rejects.counts.update(partial["rejects"])  # Add reasons
+
+    return {
+        "total_sales": money.to_float(total_cents),  # Converted once, at the end
+        "unique_products": list(unique_products),
+        "valid_sales": valid_sales,
+        "invalid_sales": invalid_sales,
+    }  # Same shape as calculate_sales
+
+
+def calculate_sales_parallel(csv_path, workers=None):  # Sharded engine
+    """Calculate sales metrics using one process per shard."""
+    workers = workers or os.cpu_count() or 1  # Default to all cores
+    shards = find_shards(csv_path, workers * 4)  # Extra shards balance load
+    tasks = [(csv_path, start, end) for start, end in shards]  # Worker inputs
+    if workers == 1:  # No pool needed for a single worker
+        partials = [process_shard(task) for task in tasks]  # Run in-process
+    else:
+        with Pool(workers) as pool:  # Start process pool
+            partials = pool.map(process_shard, tasks)  # Keeps shard order
+    results = merge_partials(partials)  # Merge partials
+    logging_utils.rejects.log_summary()  # One line of per-reason counts
+    return results  # Return merged results
+
+
+def write_benchmark_csv(csv_path, rows):  # Build a large input file
+    """Write a CSV with the given number of rows by repeating data/sales.csv."""
+    with open("data/sales.csv", "r") as file:  # Read sample rows
+        lines = file.readlines()
+    header, body = lines[0], lines[1:]  # Split header from rows
+    with open(csv_path, "w") as file:  # Write benchmark file
+        file.write(header)  # Write header once
+        block = "".join(body) * 10000  # Write in large blocks
+        block_rows = len(body) * 10000  # Rows per block
+        for _ in range(rows // block_rows):  # Full blocks
+            file.write(block)
+        file.write("".join(body * ((rows % block_rows) // len(body))))  # Rest
+
+
+def benchmark(rows=3000000):  # Compare sequential and sharded engines
+    """Print rows/sec for calculate_sales and each worker count."""
+    with tempfile.TemporaryDirectory() as tmp_dir:  # Clean up afterwards
+        csv_path = os.path.join(tmp_dir, "sales.csv")  # Benchmark file path
+        write_benchmark_csv(csv_path, rows)  # Create input
+        print(f"Benchmark file: {rows} rows")  # Debug
+        logging_utils.configure_logging("production")  # No per-row logs
+
+        start = time.perf_counter()  # Start timer
+        expected = analyzer.calculate_sales(
+            analyzer.iter_csv(csv_path)
+        )  # Sequential streaming engine
+        baseline = time.perf_counter() - start  # Elapsed seconds
+        print(f"sequential: {rows / baseline:,.0f} rows/sec")  # Report
+
+        workers = 1  # Start with one worker
+        while workers <= (os.cpu_count() or 1):  # Double up to all cores
+            start = time.perf_counter()  # Start timer
+            results = calculate_sales_parallel(csv_path, workers)  # Run engine
+            elapsed = time.perf_counter() - start  # Elapsed seconds
+            same = (
+                results["valid_sales"] == expected["valid_sales"]
+                and results["invalid_sales"] == expected["invalid_sales"]
+                and results["total_sales"] == expected["total_sales"]
+            )  # Integer cents: totals match exactly
+            print(
+                f"{workers} workers: {rows / elapsed:,.0f} rows/sec, "
+                f"speedup {baseline / elapsed:.2f}x, matches: {same}"
+            )  # Report
+            workers *= 2  # Next worker count
+
+
+def main():  # Main function
+    """Analyze sales data with the sharded engine."""
+    csv_path = "data/sales.csv"  # CSV path
+    results = calculate_sales_parallel(csv_path)  # Calculate metrics
+
+    # Output report
+    print("\nSales Report:")  # Print header
+    print(f"Total Sales: ${round(results['total_sales'], 2)}")  # Total sales
+    print(f"Unique Products: {results['unique_products']}")  # Products
+    print(f"Valid Sales: {results['valid_sales']}")  # Valid count
+    print(f"Invalid Sales: {results['invalid_sales']}")  # Invalid count
+    print("Processing completed")  # Confirm completion
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:  # Run with --benchmark to compare engines
+        benchmark()  # Run benchmark
+    else:
+        main()  # Run main function
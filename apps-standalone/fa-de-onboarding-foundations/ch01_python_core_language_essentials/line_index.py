@@ -0,0 +1,132 @@
+# File: de-onboarding/line_index.py
+# Line-offset index sidecar: seek to any CSV row without re-scanning the file
+import io  # For in-memory text streams
+import os  # For file size and mtime
+import sys  # For command-line arguments
+import random  # For random samples
+import struct  # For the sidecar header
+from array import array  # Compact uint64 offsets
+
+MAGIC = b"LIDX0001"  # Identifies index files
+HEADER = struct.Struct("<8sQQQ")  # Magic, CSV size, CSV mtime_ns, row count
+BLOCK_SIZE = 1 << 20  # Read CSV in 1 MB blocks
+
+
+def index_path(csv_path):  # Sidecar location
+    """Return the sidecar path that stores the index for csv_path."""
+    return csv_path + ".idx"  # e.g. data/sales.csv.idx
+
+
+def build_index(csv_path):  # Scan once and persist offsets
+    """Build and save the line-offset index, returning the offsets array."""
+    stat = os.stat(csv_path)  # Size and mtime identify the CSV version
+    offsets = array("Q")  # Start offset of each data row, plus end sentinel
+    with open(csv_path, "rb") as file:  # Binary mode for exact offsets
+        header_end = len(file.readline())  # Rows start after the header
+        if header_end < stat.st_size:  # File has at least one row
+            offsets.append(header_end)
+        position = header_end  # Offset of the current block
+        block = file.read(BLOCK_SIZE)  # First block
+        while block:  # Scan block by block
+            newline = block.find(b"\n")  # First line ending in block
+            while newline != -1:  # Each line ending starts a new row
+                if position + newline + 1 < stat.st_size:  # Not the last byte
+                    offsets.append(position + newline + 1)
+                newline = block.find(b"\n", newline + 1)  # Next line ending
+            position += len(block)  # Advance offset
+            block = file.read(BLOCK_SIZE)  # Next block
+    row_count = len(offsets)  # Number of data rows
+    offsets.append(stat.st_size)  # Sentinel: end of the last row
+
+    with open(index_path(csv_path), "wb") as file:  # Write sidecar
+        file.write(HEADER.pack(MAGIC, stat.st_size, stat.st_mtime_ns, row_count))
+        offsets.tofile(file)  # Raw uint64 array
+    return offsets  # Return offsets
+
+
+def load_index(csv_path):  # Read sidecar if still valid
+    """Return the saved offsets, or None if missing, truncated or stale.
+
+    Stale means the CSV size or mtime changed since the index was built.
+    """
+    path = index_path(csv_path)  # Sidecar path
+    if not os.path.exists(path):  # No index yet
+        return None
+    stat = os.stat(csv_path)  # Current CSV version
+    with open(path, "rb") as file:  # Read sidecar
+        header = file.read(HEADER.size)  # Fixed-size header
+        if len(header) < HEADER.size:  # Cut short while being written
+            return None
+        magic, size, mtime_ns, row_count = HEADER.unpack(header)
+        if (magic, size, mtime_ns) != (MAGIC, stat.st_size, stat.st_mtime_ns):
+            return None  # CSV changed since the index was built
+        offsets = array("Q")  # Offsets buffer
+        try:
+            offsets.fromfile(file, row_count + 1)  # Rows plus sentinel
+        except (EOFError, ValueError):  # Fewer offsets than the header says
+            return None
+    return offsets  # Return offsets
+
+
+def get_index(csv_path):  # Load or build
+    """Return a valid index for csv_path, building it if needed."""
+    offsets = load_index(csv_path)  # Try the sidecar first
+    if offsets is None:  # Missing or stale
+        offsets = build_index(csv_path)  # Rebuild once
+    return offsets  # Return offsets
+
+
+def row_count(offsets):  # Rows covered by an index
+    """Return the number of data rows in the index."""
+    return len(offsets) - 1  # Minus the sentinel
+
+
+def read_row(csv_path, n, offsets=None):  # O(1) seek to row n
+    """Return data row n (0-based, header excluded) as a string."""
+    if offsets is None:  # No index given: use the saved one
+        offsets = get_index(csv_path)
+    with open(csv_path, "rb") as file:  # Binary mode for seeking
+        file.seek(offsets[n])  # Jump to the row
+        raw = file.read(offsets[n + 1] - offsets[n])  # Read just this row
+    return raw.decode("utf-8").rstrip("\r\n")  # Return row text
+
+
+def open_rows(csv_path, start, stop, offsets=None):  # Slice as a file
+    """Return a text stream with the header and rows start..stop-1."""
+    if offsets is None:  # No index given: use the saved one
+        offsets = get_index(csv_path)
+    stop = min(stop, row_count(offsets))  # Clamp to last row
+    start = min(start, stop)  # Empty slice if start is past the end
+    with open(csv_path, "rb") as file:  # Binary mode for seeking
+        header = file.readline()  # Keep header for csv/pandas readers
+        file.seek(offsets[start])  # Jump to first row
+        body = file.read(offsets[stop] - offsets[start])  # Read slice
+    return io.StringIO((header + body).decode("utf-8"))  # File-like object
+
+
+def sample_rows(csv_path, k, seed=None, offsets=None):  # Random sample
+    """Return k random data rows without reading the rest of the file."""
+    if offsets is None:  # No index given: use the saved one
+        offsets = get_index(csv_path)
+    picks = random.Random(seed).sample(range(row_count(offsets)), k)  # Rows
+    return [read_row(csv_path, n, offsets) for n in sorted(picks)]  # In order
+
+
+def split_ranges(offsets, parts):  # Even work split
+    """Return up to parts (start, end) byte ranges with equal row counts."""
+    rows = row_count(offsets)  # Total rows
+    cuts = sorted({rows * i // parts for i in range(parts + 1)})  # Row cuts
+    return [
+        (offsets[cuts[i]], offsets[cuts[i + 1]]) for i in range(len(cuts) - 1)
+    ]  # Byte ranges
+
+
+def main():  # Build index from the command line
+    """Build the index for each CSV path given on the command line."""
+    for csv_path in sys.argv[1:] or ["data/sales.csv"]:  # Default sample file
+        offsets = build_index(csv_path)  # Build and save
+        print(f"Indexed {row_count(offsets)} rows: {index_path(csv_path)}")
+
+
+if __name__ == "__main__":
+    main()  # Run main function
@@ -0,0 +1,67 @@
+# File: de-onboarding/bench_records.py
+# Compare dict-per-row loading with compact Sale records (time and allocations)
+import os  # For file paths
+import sys  # For command-line arguments
+import time  # For timing
+import tempfile  # For benchmark input file
+import tracemalloc  # For allocation peaks
+import logging_utils  # For quiet mode
+import sales_processor  # Both loading paths
+
+
+def write_benchmark_csv(csv_path, rows):  # Build a large input file
+    """Write a CSV with the given number of rows by repeating data/sales.csv."""
+    with open("data/sales.csv", "r") as file:  # Read sample rows
+        lines = file.readlines()
+    header, body = lines[0], lines[1:]  # Split header from rows
+    block = "".join(body) * 10000  # Write in large blocks
+    block_rows = len(body) * 10000  # Rows per block
+    with open(csv_path, "w") as file:  # Write benchmark file
+        file.write(header)  # Write header once
+        for _ in range(rows // block_rows):  # Full blocks
+            file.write(block)
+        file.write("".join(body * ((rows % block_rows) // len(body))))  # Rest
+
+
+def run_dicts(csv_path, config):  # csv.DictReader + validate_sale path
+    """Load and process sales as dicts."""
+    sales, invalid_count = sales_processor.load_and_validate_sales(csv_path, config)
+    return sales_processor.process_sales(sales)[0]  # Return results
+
+
+def run_records(csv_path, config):  # csv.reader + utils.Sale path
+    """Load and process sales as compact records."""
+    sales, invalid_count = sales_processor.load_sale_records(csv_path, config)
+    return sales_processor.process_sale_records(sales)[0]  # Return results
+
+
+def measure(name, func, csv_path, config):  # Time one path, then trace it
+    """Print wall time and tracemalloc peak for one loading path."""
+    start = time.perf_counter()  # Start timer
+    results = func(csv_path, config)  # Untraced run for timing
+    elapsed = time.perf_counter() - start  # Elapsed seconds
+
+    tracemalloc.start()  # Trace allocations in a second run
+    func(csv_path, config)  # Traced run
+    peak = tracemalloc.get_traced_memory()[1]  # Peak bytes
+    tracemalloc.stop()  # Stop tracing
+    print(f"{name}: {elapsed:.2f}s, peak {peak / 1e6:.1f} MB")  # Report
+    return results  # Return results for comparison
+
+
+def main():  # Main function
+    """Run both paths on N rows (default 10,000,000)."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000  # Row count
+    logging_utils.configure_logging("production")  # No per-row logs
+    config = sales_processor.read_config("data/config.yaml")  # Read config
+    with tempfile.TemporaryDirectory() as tmp_dir:  # Clean up afterwards
+        csv_path = os.path.join(tmp_dir, "sales.csv")  # Benchmark file path
+        write_benchmark_csv(csv_path, rows)  # Create input
+        print(f"Benchmark file: {rows} rows")  # Debug
+        dicts = measure("dict rows", run_dicts, csv_path, config)  # Old path
+        records = measure("Sale records", run_records, csv_path, config)  # New
+    print(f"Same totals: {dicts['total_sales'] == records['total_sales']}")
+
+
+if __name__ == "__main__":
+    main()  # Run main function
@@ -0,0 +1,54 @@
+# File: de-onboarding/config_rules.py
+# Parse config.yaml once into immutable rules; reload only when the file changes
+import os  # For file size and mtime
+from collections import namedtuple  # Immutable record with named fields
+import yaml  # For YAML parsing
+
+_FIELDS = "min_price max_quantity required_fields product_prefix max_decimals source"
+
+
+class SalesRules(namedtuple("SalesRules", _FIELDS)):  # Read-only config
+    """Validation rules with typed fields; rules["key"] still works like a dict."""
+
+    __slots__ = ()  # No per-instance dict, attributes cannot be added
+
+    def __getitem__(self, key):  # Dict-style access for older callers
+        """Return a rule by name, or a tuple item by position."""
+        if isinstance(key, str):  # rules["min_price"]
+            return getattr(self, key)
+        return super().__getitem__(key)  # rules[0]
+
+    @classmethod
+    def from_dict(cls, config):  # Convert and precompute once
+        """Build rules from a parsed config dictionary."""
+        return cls(
+            min_price=float(config["min_price"]),  # Threshold as float
+            max_quantity=int(config["max_quantity"]),  # Limit as int
+            required_fields=tuple(config["required_fields"]),  # Immutable list
+            product_prefix=str(config["product_prefix"]),  # Prefix string
+            max_decimals=int(config["max_decimals"]),  # Decimal limit as int
+            source=dict(config),  # Parsed YAML, for logging
+        )
+
+
+_cache = {}  # Absolute path -> (size, mtime_ns, rules)
+
+
+def load_rules(config_path):  # Cached YAML load
+    """Return SalesRules for config_path, re-parsing only if the file changed."""
+    path = os.path.abspath(config_path)  # Same file, same cache entry
+    stat = os.stat(path)  # Size and mtime identify the file version
+    cached = _cache.get(path)  # Previous load, if any
+    if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):  # Unchanged
+        return cached[2]  # No YAML parsing
+    with open(path, "r") as file:  # Missing or changed: parse again
+        rules = SalesRules.from_dict(yaml.safe_load(file))
+    _cache[path] = (stat.st_size, stat.st_mtime_ns, rules)  # Remember version
+    return rules  # Return rules
+
+
+def as_rules(config):  # Accept rules or a plain dict
+    """Return config as SalesRules, converting a plain dictionary if needed."""
+    if isinstance(config, SalesRules):  # Already converted
+        return config
+    return SalesRules.from_dict(config)  # Convert once per call site
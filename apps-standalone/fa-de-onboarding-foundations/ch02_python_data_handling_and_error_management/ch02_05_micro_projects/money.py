@@ -0,0 +1,74 @@
+# File: de-onboarding/money.py
+# Fixed-point money: prices as integer cents, exact sums, decimals only at export
+import sys  # For command-line arguments
+import time  # For benchmark timing
+from decimal import Decimal  # For exact export values
+import numpy as np  # For vectorized conversion
+
+CENTS = 100  # Cents per currency unit
+DECIMALS = 2  # Decimal places a cent amount holds exactly
+
+
+def parse_cents(text):  # "24.99" -> 2499 in one pass, no float
+    """Return a decimal price string as integer cents; a third decimal rounds half up.
+
+    text must already be validated as digits or digits.digits (is_numeric).
+    """
+    whole, _, fraction = text.strip().partition(".")  # "24", ".", "99"
+    cents = int(whole or "0") * CENTS + int((fraction + "00")[:2])  # 2400 + 99
+    if len(fraction) > 2 and fraction[2] >= "5":  # "24.995" -> 2500
+        cents += 1
+    return cents  # Return integer cents
+
+
+def to_cents(prices):  # Whole column -> int64 cents
+    """Return validated prices (numbers or decimal strings) as int64 cents.
+
+    Floats are scaled and rounded half up, like parse_cents for strings, so
+    24.995 and "24.995" both give 2500; strings are split at the decimal point.
+    """
+    if hasattr(prices, "to_numpy"):  # pandas Series
+        prices = prices.to_numpy()
+    prices = np.asarray(prices)  # Lists, arrays
+    if prices.dtype.kind in "iuf":  # Numbers: 24.99 -> 2499
+        scaled = np.round(prices * CENTS, 6)  # 2499.4999999999995 -> 2499.5
+        return np.floor(scaled + 0.5).astype(np.int64)  # Half up
+    prices = np.strings.strip(prices.astype(str))  # Strings: "24.99" -> 2499
+    whole, _, fraction = np.strings.partition(prices, ".")  # Split on decimal
+    whole = np.where(whole == "", "0", whole).astype(np.int64)  # ".5" -> 0
+    fraction = np.strings.ljust(fraction.astype("U3"), 3, "0").astype(np.int64)
+    return whole * CENTS + fraction // 10 + (fraction % 10 >= 5)  # Half up
+
+
+def to_float(cents):  # Export: cents -> float
+    """Return cents as a float amount; its repr is the exact two-decimal value."""
+    return cents / CENTS  # 249995 -> 2499.95, never 2499.9500000000003
+
+
+def to_decimal(cents):  # Export: cents -> Decimal
+    """Return cents as an exact Decimal amount with two decimal places."""
+    return Decimal(int(cents)).scaleb(-2)  # 249995 -> Decimal("2499.95")
+
+
+def benchmark(rows=5000000):  # Compare with float amounts
+    """Print the time and result of float-plus-round and integer-cent totals."""
+    rng = np.random.default_rng(0)  # Reproducible data
+    prices = rng.integers(1, 100000, rows) / CENTS  # 0.01 .. 999.99
+    quantities = rng.integers(1, 100, rows)  # 1 .. 99
+    print(f"Benchmark: {rows} rows")  # Debug
+
+    start = time.perf_counter()  # Start timer
+    float_total = np.round(prices * quantities, 2).sum()  # Per-row rounding
+    float_time = time.perf_counter() - start  # Elapsed seconds
+
+    start = time.perf_counter()  # Start timer
+    cents_total = (to_cents(prices) * quantities).sum()  # Exact int64 sum
+    cents_time = time.perf_counter() - start  # Elapsed seconds
+
+    print(f"float + round: {float_time:.3f}s, total {float_total!r}")  # Report
+    print(f"int64 cents: {cents_time:.3f}s, total {to_decimal(cents_total)}")
+    print(f"Float error: {abs(Decimal(float_total) - to_decimal(cents_total))}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000000)  # Row count
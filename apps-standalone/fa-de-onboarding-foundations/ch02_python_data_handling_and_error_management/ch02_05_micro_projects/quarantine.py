@@ -0,0 +1,66 @@
+# File: de-onboarding/quarantine.py
+# Side file for rejected rows: line number, reason code and the raw fields
+import os  # For file paths
+import csv  # For CSV writing and reading
+
+HEADER = ["line_no", "reason"]  # Followed by the source columns
+BATCH_ROWS = 10000  # Rows buffered in memory before one writerows call
+FILE_BUFFER = 1 << 20  # 1 MB file buffer
+
+
+def quarantine_path(csv_path):  # Side file location
+    """Return the quarantine path for csv_path (data/sales.rejects.csv)."""
+    return os.path.splitext(csv_path)[0] + ".rejects.csv"
+
+
+class QuarantineSink:  # Buffered writer for rejected rows
+    """Collect rejected rows and write them to a CSV side file in large batches."""
+
+    def __init__(self, path):  # Constructor
+        self.path = path  # Quarantine file path
+        self.file = open(path, "w", newline="", buffering=FILE_BUFFER)  # Output
+        self.writer = csv.writer(self.file)  # Quotes fields with commas
+        self.batch = []  # Rows waiting to be written
+        self.count = 0  # Rows quarantined so far
+
+    def begin(self, columns):  # Called once the source header is known
+        """Write the header: line_no, reason, then the source columns."""
+        self.writer.writerow(HEADER + list(columns))  # Header row
+
+    def add(self, line_no, reason, fields):  # Called once per rejected row
+        """Queue one rejected row; writes happen in batches of BATCH_ROWS."""
+        self.batch.append((line_no, reason, *fields))  # No I/O here
+        if len(self.batch) >= BATCH_ROWS:  # Batch full
+            self.flush()
+
+    def flush(self):  # Write queued rows
+        """Write all queued rows in one call."""
+        self.writer.writerows(self.batch)  # One call per batch
+        self.count += len(self.batch)  # Update count
+        self.batch = []  # Start a new batch
+
+    def close(self):  # Finish the file
+        """Write remaining rows and close the file."""
+        self.flush()  # Last partial batch
+        self.file.close()  # Flush file buffer
+
+    def __enter__(self):  # Support with-statements
+        return self
+
+    def __exit__(self, exc_type, exc, tb):  # Always close
+        self.close()
+
+
+def read_columns(path):  # Source columns of a quarantine file
+    """Return the source column names stored after line_no and reason."""
+    with open(path, "r", newline="") as file:  # Open side file
+        return next(csv.reader(file), HEADER)[len(HEADER) :]  # Drop our columns
+
+
+def read_quarantine(path):  # Iterate a quarantine file
+    """Yield (line_no, reason, fields) for each quarantined row."""
+    with open(path, "r", newline="") as file:  # Open side file
+        reader = csv.reader(file)  # Parse rows
+        next(reader, None)  # Skip header
+        for row in reader:  # One rejected row per line
+            yield int(row[0]), int(row[1]), row[len(HEADER) :]
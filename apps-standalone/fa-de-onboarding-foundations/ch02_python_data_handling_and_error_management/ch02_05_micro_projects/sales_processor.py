@@ -1,49 +1,136 @@
 import csv  # For CSV parsing
-import yaml  # For YAML parsing
-import json  # For JSON output
+import os  # For replacing the quarantine file
+import sys  # For command-line flag
+import config_rules  # Cached, typed config.yaml rules
+import json_export  # For streaming JSON output
+import logging  # For log levels
+import money  # Integer-cent amounts
 import utils  # Import custom utils module
+import line_index  # For reading row slices through the offset index
+import checkpoint  # For incremental runs
+import quarantine  # For the rejected-row side file
+from logging_utils import logger, rejects  # Leveled, lazily formatted logs
 
 
 # Define function to read YAML configuration
 def read_config(config_path):  # Takes config file path
-    """Read YAML configuration."""
+    """Read YAML configuration as cached config_rules.SalesRules."""
     print(f"Opening config: {config_path}")  # Debug: print path
-    file = open(config_path, "r")  # Open YAML
-    config = yaml.safe_load(file)  # Parse YAML
-    file.close()  # Close file
-    print(f"Loaded config: {config}")  # Debug: print config
-    return config  # Return config dictionary
+    config = config_rules.load_rules(config_path)  # Parsed once per file version
+    print(f"Loaded config: {config.source}")  # Debug: print config
+    return config  # Return rules (config["key"] still works)
 
 
 # Define function to load and validate sales
-def load_and_validate_sales(csv_path, config):  # Takes CSV path and config
-    """Load sales CSV and validate."""
+def load_and_validate_sales(csv_path, config, rows=None, sink=None):  # CSV, config
+    """Load sales CSV and validate; rows=(start, stop) reads only that slice.
+
+    Rejected rows go to sink (a quarantine.QuarantineSink) when one is given.
+    """
     print(f"Loading CSV: {csv_path}")  # Debug: print path
-    file = open(csv_path, "r")  # Open CSV
+    if rows is None:  # Whole file
+        file = open(csv_path, "r")  # Open CSV
+    else:  # Seek straight to the slice via the line-offset index
+        file = line_index.open_rows(csv_path, rows[0], rows[1])
     reader = csv.DictReader(file)  # Create DictReader
     valid_sales = []  # List for valid sales
     invalid_count = 0  # Count invalid sales
 
     # Check for required columns
-    required_fields = config["required_fields"]  # Get required fields
+    config = config_rules.as_rules(config)  # Typed rules, converted once
+    required_fields = config.required_fields  # Get required fields
     missing_fields = [f for f in required_fields if f not in reader.fieldnames]
     if missing_fields:  # Check for missing columns
         print(f"Invalid CSV: missing columns {missing_fields}")  # Log error
         file.close()  # Close file
         return [], 1  # Return empty list and increment invalid count
+    if sink is not None:  # Quarantine keeps the source columns
+        sink.begin(reader.fieldnames)
 
+    debug = logger.isEnabledFor(logging.DEBUG)  # Check level once, not per row
     for row in reader:  # Loop through rows
-        print(f"Processing row: {row}")  # Debug: print row
+        if debug:
+            logger.debug("Processing row: %s", row)  # Debug: print row
         if utils.validate_sale(row, config):  # Validate row
             valid_sales.append(row)  # Append valid sale
         else:
             invalid_count += 1  # Increment invalid count
+            if sink is not None:  # Keep the row with its reason and line number
+                reason = utils.check_fields(
+                    row["product"], row["price"], row["quantity"], config
+                )[0]
+                if reason == utils.REASON_VALID:  # Failed another required field
+                    reason = utils.REASON_MISSING_FIELD
+                sink.add(reader.line_num, reason, [row[f] for f in reader.fieldnames])
 
     file.close()  # Close file
-    print(f"Valid sales: {valid_sales}")  # Debug: print valid sales
+    logger.debug("Valid sales: %s", valid_sales)  # Debug: print valid sales
+    rejects.log_summary()  # One line of per-reason counts
     return valid_sales, invalid_count  # Return valid sales and invalid count
 
 
+# Define function to load sales as compact records
+def load_sale_records(csv_path, config, rows=None, sink=None):  # CSV, config
+    """Load sales CSV as utils.Sale records using positional csv.reader rows."""
+    print(f"Loading CSV: {csv_path}")  # Debug: print path
+    if rows is None:  # Whole file
+        file = open(csv_path, "r")  # Open CSV
+    else:  # Seek straight to the slice via the line-offset index
+        file = line_index.open_rows(csv_path, rows[0], rows[1])
+    sales, invalid_count = read_sale_records(file, config, sink)  # Parse rows
+    file.close()  # Close file
+    return sales, invalid_count  # Return valid records and invalid count
+
+
+# Define function to read sale records from an open file
+def read_sale_records(file, config, sink=None):  # Takes text stream and config
+    """Read utils.Sale records from a CSV text stream (header first).
+
+    Rejected rows go to sink (a quarantine.QuarantineSink) when one is given.
+    """
+    reader = csv.reader(file)  # Rows are lists, not dicts
+    header = next(reader, [])  # Header row
+    valid_sales = []  # List for valid Sale records
+    invalid_count = 0  # Count invalid sales
+
+    # Check for required columns
+    config = config_rules.as_rules(config)  # Typed rules, converted once
+    required_fields = config.required_fields  # Get required fields
+    missing_fields = [f for f in required_fields if f not in header]
+    if missing_fields:  # Check for missing columns
+        print(f"Invalid CSV: missing columns {missing_fields}")  # Log error
+        return [], 1  # Return empty list and increment invalid count
+
+    # Resolve column positions once instead of a dict lookup per row
+    product_i, price_i, quantity_i = (
+        header.index(f) for f in ("product", "price", "quantity")
+    )
+    width = len(header)  # Short rows are padded like DictReader does
+    if sink is not None:  # Quarantine keeps the source columns
+        sink.begin(header)
+    debug = logger.isEnabledFor(logging.DEBUG)  # Check level once, not per row
+    for row in reader:  # Loop through rows
+        if not row:  # DictReader skips blank lines too
+            continue
+        if debug:
+            logger.debug("Processing row: %s", row)  # Debug: print row
+        if len(row) < width:  # Missing trailing fields count as empty
+            row += [""] * (width - len(row))
+        sale, reason = utils.parse_sale_reason(
+            (row[product_i], row[price_i], row[quantity_i]), config
+        )
+        if sale is None:  # Invalid row
+            invalid_count += 1  # Increment invalid count
+            if sink is not None:  # Keep the row with its reason and line number
+                sink.add(reader.line_num, reason, row)
+        else:
+            valid_sales.append(sale)  # Append valid record
+
+    logger.debug("Valid sales: %s", valid_sales)  # Debug: print valid sales
+    rejects.log_summary()  # One line of per-reason counts
+    return valid_sales, invalid_count  # Return valid records and invalid count
+
+
 # Define function to process sales
 def process_sales(sales):  # Takes list of sales
     """Process sales: compute total and unique products."""
@@ -51,17 +138,38 @@ def process_sales(sales):  # Takes list of sales
         print("No valid sales data")  # Log empty
         return {"total_sales": 0.0, "unique_products": []}, 0
 
-    total_sales = 0.0  # Initialize total
+    total_cents = 0  # Initialize total, exact integer cents
     unique_products = set()  # Set for unique products
     for sale in sales:  # Loop through sales
-        price = float(sale["price"])  # Convert price
+        price = money.parse_cents(sale["price"])  # Convert price to cents
         quantity = int(sale["quantity"])  # Convert quantity
-        amount = price * quantity  # Compute amount
-        total_sales += amount  # Add to total
+        amount = price * quantity  # Compute amount in cents
+        total_cents += amount  # Add to total
         unique_products.add(sale["product"])  # Add product to set
 
     results = {
-        "total_sales": total_sales,  # Total sales
+        "total_sales": money.to_float(total_cents),  # Converted once, at the end
+        "unique_products": list(unique_products),  # Convert set to list
+    }
+    print(f"Processed results: {results}")  # Debug: print results
+    return results, len(sales)  # Return results and valid count
+
+
+# Define function to process compact sale records
+def process_sale_records(sales):  # Takes list of utils.Sale records
+    """Process Sale records: compute total and unique products without re-parsing."""
+    if not sales:  # Check for empty sales
+        print("No valid sales data")  # Log empty
+        return {"total_sales": 0.0, "unique_products": []}, 0
+
+    total_cents = 0  # Initialize total, exact integer cents
+    unique_products = set()  # Set for unique products
+    for sale in sales:  # Loop through records
+        total_cents += sale.price_cents * sale.quantity  # Already parsed
+        unique_products.add(sale.product)  # Add product to set
+
+    results = {
+        "total_sales": money.to_float(total_cents),  # Converted once, at the end
         "unique_products": list(unique_products),  # Convert set to list
     }
     print(f"Processed results: {results}")  # Debug: print results
@@ -72,12 +180,74 @@ def process_sales(sales):  # Takes list of sales
 def export_results(results, json_path):  # Takes results and file path
     """Export results to JSON."""
     print(f"Writing to: {json_path}")  # Debug: print path
-    file = open(json_path, "w")  # Open JSON file
-    json.dump(results, file, indent=2)  # Write JSON
-    file.close()  # Close file
+    json_export.export_json(results, json_path)  # Compact, streamed; .gz compresses
     print(f"Exported results to {json_path}")  # Confirm export
 
 
+# Define function for incremental runs over an append-only CSV
+def process_incremental(csv_path, config):  # Takes CSV path and config
+    """Process only rows appended since the last run; return the running state."""
+    state = checkpoint.load_state(csv_path)  # Resume from the last offset
+    start = end = state["offset"]  # First new byte; end of the last merged chunk
+    chunks = checkpoint.iter_delta(csv_path, state)  # Bounded chunks
+    for count, (stream, end) in enumerate(chunks, 1):
+        sales, invalid_count = read_sale_records(stream, config)  # Parse chunk
+        product_cents = {}  # Product -> amount in cents for the chunk's rows
+        for sale in sales:  # Loop through new records
+            amount = sale.price_cents * sale.quantity  # Compute amount in cents
+            product_cents[sale.product] = product_cents.get(sale.product, 0) + amount
+        checkpoint.merge(state, product_cents, len(sales), invalid_count)  # Merge
+        if count % checkpoint.SAVE_EVERY == 0:  # Bounded rework after a crash
+            checkpoint.save_state(csv_path, state, end)  # Persist offset and totals
+    if end != state["offset"]:  # Chunks merged since the last save
+        checkpoint.save_state(csv_path, state, end)  # Final offset and totals
+    print(f"Processed bytes {start}..{state['offset']} of {csv_path}")  # Debug
+    return state  # Return running state
+
+
+# Define function to re-validate quarantined rows
+def reprocess_quarantine(csv_path, config):  # Takes source CSV path and config
+    """Re-validate only the quarantined rows of csv_path with the current config.
+
+    Returns (recovered Sale records, rows still invalid); rows that are still
+    invalid stay in the quarantine file with their updated reason codes.
+    """
+    path = quarantine.quarantine_path(csv_path)  # Side file from the last run
+    print(f"Reprocessing quarantine: {path}")  # Debug: print path
+    if not os.path.exists(path):  # Nothing was quarantined
+        print("No quarantine file")  # Log missing
+        return [], 0
+
+    config = config_rules.as_rules(config)  # Typed rules, converted once
+    columns = quarantine.read_columns(path)  # Source header
+    if not {"product", "price", "quantity"}.issubset(columns):  # Nothing written
+        print("No quarantined rows")  # Source CSV lacked required columns
+        return [], 0
+    product_i, price_i, quantity_i = (
+        columns.index(f) for f in ("product", "price", "quantity")
+    )
+    other_i = [
+        columns.index(f)
+        for f in config.required_fields
+        if f in columns and f not in ("product", "price", "quantity")
+    ]  # Other required columns must stay non-empty too
+    recovered = []  # Rows valid under the current config
+    with quarantine.QuarantineSink(path + ".tmp") as sink:  # Rows still invalid
+        sink.begin(columns)  # Same columns as before
+        for line_no, _, fields in quarantine.read_quarantine(path):  # Old rows
+            sale_fields = (fields[product_i], fields[price_i], fields[quantity_i])
+            sale, reason = utils.parse_sale_reason(sale_fields, config)  # Re-validate
+            if sale is not None and any(not fields[i].strip() for i in other_i):
+                sale, reason = None, utils.REASON_MISSING_FIELD  # Like validate_sale
+            if sale is None:  # Still invalid, keep with the new reason
+                sink.add(line_no, reason, fields)
+            else:
+                recovered.append(sale)  # Valid now
+    os.replace(path + ".tmp", path)  # Quarantine now holds only invalid rows
+    rejects.log_summary()  # One line of per-reason counts
+    return recovered, sink.count  # Return recovered records and remaining count
+
+
 # Define main function
 def main():  # No parameters
     """Main function to process sales data."""
@@ -86,10 +256,9 @@ def main():  # No parameters
     json_path = "data/sales_results.json"  # JSON output path
 
     config = read_config(config_path)  # Read config
-    sales, invalid_count = load_and_validate_sales(
-        csv_path, config
-    )  # Load and validate
-    results, valid_count = process_sales(sales)  # Process sales
+    with quarantine.QuarantineSink(quarantine.quarantine_path(csv_path)) as sink:
+        sales, invalid_count = load_sale_records(csv_path, config, sink=sink)
+    results, valid_count = process_sale_records(sales)  # Process sales
     export_results(results, json_path)  # Export results
 
     # Output report
@@ -102,5 +271,44 @@ def main():  # No parameters
     print("Processing completed")  # Confirm completion
 
 
+# Define main function for incremental mode
+def main_incremental():  # No parameters
+    """Report running totals after processing newly appended rows."""
+    config = read_config("data/config.yaml")  # Read config
+    state = process_incremental("data/sales.csv", config)  # Process delta
+
+    # Output report
+    print("\nSales Report (incremental):")  # Print header
+    print(
+        f"Total Records Processed: {state['valid_sales'] + state['invalid_sales']}"
+    )  # Total records
+    print(f"Valid Sales: {state['valid_sales']}")  # Valid count
+    print(f"Invalid Sales: {state['invalid_sales']}")  # Invalid count
+    print(f"Total Sales: ${money.to_float(state['total_cents'])}")  # Total sales
+    print(f"Unique Products: {list(state['product_cents'])}")  # Products
+    print(f"Top Products: {checkpoint.top_products(state)}")  # Top products
+    print("Processing completed")  # Confirm completion
+
+
+# Define main function for reprocess mode
+def main_reprocess():  # No parameters
+    """Re-validate only the quarantined rows, e.g. after a config change."""
+    config = read_config("data/config.yaml")  # Read current config
+    sales, invalid_count = reprocess_quarantine("data/sales.csv", config)
+    results, valid_count = process_sale_records(sales)  # Process recovered
+
+    # Output report
+    print("\nQuarantine Report:")  # Print header
+    print(f"Recovered Sales: {valid_count}")  # Rows valid now
+    print(f"Still Invalid: {invalid_count}")  # Rows left in quarantine
+    print(f"Recovered Total: ${round(results['total_sales'], 2)}")  # Total
+    print("Processing completed")  # Confirm completion
+
+
 if __name__ == "__main__":
-    main()  # Run main function
+    if "--incremental" in sys.argv:  # Only rows appended since the last run
+        main_incremental()  # Run incremental mode
+    elif "--reprocess" in sys.argv:  # Only rows from the quarantine file
+        main_reprocess()  # Run reprocess mode
+    else:
+        main()  # Run main function
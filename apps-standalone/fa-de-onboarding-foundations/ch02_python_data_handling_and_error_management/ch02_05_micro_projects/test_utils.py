@@ -0,0 +1,50 @@
+# File: de-onboarding/test_utils.py
+# Check that validate_sales_batch gives the same reason as check_fields, row for row
+import numpy as np  # For random rows
+import utils  # Scalar and batch validators
+from config_rules import SalesRules  # Rules without a config file
+
+config = {
+    "min_price": 10.0,
+    "max_quantity": 100,
+    "required_fields": ["product", "price", "quantity"],
+    "product_prefix": "Halal",
+    "max_decimals": 2,
+}
+
+
+def random_rows(count, seed=0):  # Prices near min_price, odd formats mixed in
+    """Return product, price and quantity string lists for count rows."""
+    rng = np.random.default_rng(seed)  # Reproducible
+    products = rng.choice(["Halal A", " Halal B ", "Mouse", ""], count).tolist()
+    mills = rng.integers(0, 20000, count)  # 0.000 .. 19.999
+    places = rng.integers(0, 5, count)  # 0 to 4 decimals
+    prices = [
+        f"{m / 1000:.{p}f}" if p else f"{m // 1000}" for m, p in zip(mills, places)
+    ]  # "9.995", "10.00", "12"
+    odd = [" 10.0 ", "abc", "", "-1.00", ".50", "1e2", "10.", "1.2.3"]  # Formats
+    for i in range(0, count, 97):  # Every 97th price is an odd one
+        prices[i] = odd[i % len(odd)]
+    quantities = rng.choice(["1", "50", "101", "0", "2.0", "1e2", " 3 "], count)
+    return products, prices, quantities.tolist()
+
+
+def test_batch_matches_scalar():  # Same reason code for every row
+    """Check parity for max_decimals up to 4 and fractional min_price."""
+    products, prices, quantities = random_rows(20000)
+    for max_decimals in (1, 2, 3, 4):
+        for min_price in (10.0, 9.995, 0.0):
+            rules = SalesRules.from_dict(
+                dict(config, max_decimals=max_decimals, min_price=min_price)
+            )
+            batch = utils.validate_sales_batch(products, prices, quantities, rules)
+            scalar = [
+                utils.check_fields(product, price, quantity, rules)[0]
+                for product, price, quantity in zip(products, prices, quantities)
+            ]
+            assert batch.tolist() == scalar, (max_decimals, min_price)
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()  # Run without pytest
+    print("validate_sales_batch matches check_fields")
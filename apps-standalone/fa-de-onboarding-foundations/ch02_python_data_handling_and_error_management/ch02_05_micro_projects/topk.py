@@ -0,0 +1,78 @@
+# File: de-onboarding/topk.py
+# Top-k products without a full sort: argpartition for arrays, bounded heap for streams
+import sys  # For command-line arguments
+import time  # For benchmark timing
+import heapq  # For the bounded heap
+import numpy as np  # For argpartition
+
+TOP_K = 3  # Products reported by default
+
+
+def rank_key(item):  # Deterministic order
+    """Sort key for (product, amount): highest amount first, then product name."""
+    return -item[1], str(item[0])  # Ties broken alphabetically
+
+
+def top_k_items(items, k=TOP_K):  # Streaming: O(n log k), k items in memory
+    """Return the k best (product, amount) pairs of an iterable as an ordered dict."""
+    if k <= 0:  # Nothing requested
+        return {}
+    return dict(heapq.nsmallest(k, items, key=rank_key))  # Bounded heap of size k
+
+
+def top_k(sums, k=TOP_K):  # Batch: O(n) selection, then sort k candidates
+    """Return the k products with the largest sums, highest first, as a dict.
+
+    sums is a dict or pandas Series of product -> amount, e.g. the per-product
+    totals from groupby, merge_partials or a checkpoint.
+    """
+    if hasattr(sums, "to_numpy"):  # pandas Series
+        names = sums.index  # Product names, looked up only for candidates
+        values = sums.to_numpy(dtype=float)  # Amounts
+    else:  # dict
+        names = list(sums)  # Product names
+        values = np.fromiter(sums.values(), dtype=float, count=len(names))
+    if k <= 0 or not len(names):  # Nothing to rank
+        return {}
+    if k < len(values):  # Select the k largest without sorting the rest
+        best = np.argpartition(-values, k - 1)[:k]  # Unordered k largest
+        cutoff = values[best].min()  # k-th largest amount
+        above = np.flatnonzero(values > cutoff)  # Fewer than k, all kept
+        tied = np.flatnonzero(values == cutoff)  # Every product at cutoff
+        labels = map(str, np.asarray(names, dtype=object)[tied])  # One lookup
+        first = heapq.nsmallest(k - len(above), zip(labels, tied))  # Heap of size k
+        candidates = np.concatenate([above, [i for _, i in first]]).astype(np.intp)
+    else:  # Fewer products than k
+        candidates = np.arange(len(values))
+    ranked = sorted(
+        ((names[i], values[i].item()) for i in candidates), key=rank_key
+    )  # Only the candidates are sorted
+    return dict(ranked[:k])  # Highest first
+
+
+def benchmark(products=5000000, k=TOP_K):  # Compare with sort_values().head()
+    """Print the time of a full sort and of top_k on random product sums."""
+    import pandas as pd  # Only needed for the comparison
+
+    rng = np.random.default_rng(0)  # Reproducible sums
+    sums = pd.Series(
+        rng.random(products).round(2) * 1000,
+        index=[f"Halal Product {i}" for i in range(products)],
+    )  # Product -> amount
+    print(f"Benchmark: {products} products, k={k}")  # Debug
+
+    start = time.perf_counter()  # Start timer
+    old = sums.sort_values(ascending=False).head(k)  # Full sort
+    sort_time = time.perf_counter() - start  # Elapsed seconds
+
+    start = time.perf_counter()  # Start timer
+    new = top_k(sums, k)  # Selection
+    select_time = time.perf_counter() - start  # Elapsed seconds
+
+    print(f"sort_values: {sort_time:.3f}s, top_k: {select_time:.3f}s")  # Report
+    print(f"Speedup: {sort_time / select_time:.0f}x")  # Ratio
+    print(f"Same amounts: {list(old) == list(new.values())}")  # Check
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000000)  # Product count
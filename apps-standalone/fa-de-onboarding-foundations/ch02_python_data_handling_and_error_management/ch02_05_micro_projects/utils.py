@@ -1,3 +1,9 @@
+import numpy as np  # For the batch validator
+import money  # Integer-cent prices
+from config_rules import as_rules  # Typed rules from config.yaml
+from logging_utils import logger, rejects  # Leveled, lazily formatted logs
+
+
 def clean_string(s):  # Clean string
     """Strip whitespace from string."""
     return s.strip()  # Return cleaned string
@@ -11,41 +17,164 @@ def is_numeric(s, max_decimals=2):  # Check if string is numeric
     return len(parts[1]) <= max_decimals  # Check decimal places
 
 
+# Reason codes shared by the scalar and batch validators (uint8 in batches)
+REASON_VALID = 0  # Row passes every rule
+REASON_MISSING_FIELD = 1  # Empty or missing product/price/quantity
+REASON_BAD_PREFIX = 2  # Product lacks the configured prefix
+REASON_BAD_PRICE_FORMAT = 3  # Price is not digits.digits within price_decimals
+REASON_BELOW_MIN_PRICE = 4  # Price below min_price or not positive
+REASON_BAD_QUANTITY_FORMAT = 5  # Quantity is not a whole number
+REASON_QUANTITY_TOO_HIGH = 6  # Quantity above max_quantity
+REASON_NAMES = (
+    "valid",
+    "missing_field",
+    "bad_prefix",
+    "bad_price_format",
+    "below_min_price",
+    "bad_quantity_format",
+    "quantity_too_high",
+)  # Index is the reason code
+
+
+def price_decimals(rules):  # Decimal places a valid price may have
+    """Return max_decimals, capped at the places integer cents hold exactly."""
+    return min(rules.max_decimals, money.DECIMALS)  # "9.995" would round per unit
+
+
+def check_fields(product, price, quantity, rules):  # Scalar rules, no logging
+    """Return (reason, price, quantity); rules is a config_rules.SalesRules."""
+    for value in (product, price, quantity):  # Check for missing or empty fields
+        if not value or value.strip() == "":
+            return REASON_MISSING_FIELD, None, None
+
+    if not clean_string(product).startswith(rules.product_prefix):  # Prefix
+        return REASON_BAD_PREFIX, None, None
+
+    price = clean_string(price)  # Clean price string
+    if not is_numeric(price, price_decimals(rules)):  # Check format
+        return REASON_BAD_PRICE_FORMAT, None, None
+    price = money.parse_cents(price)  # Parse price exactly once, as cents
+    if price < rules.min_price * money.CENTS or price <= 0:  # Value, positivity
+        return REASON_BELOW_MIN_PRICE, None, None
+
+    quantity = clean_string(quantity)  # Clean quantity string
+    if not quantity.isdigit():  # Check format
+        return REASON_BAD_QUANTITY_FORMAT, None, None
+    quantity = int(quantity)  # Parse quantity exactly once
+    if quantity > rules.max_quantity:  # Check limit
+        return REASON_QUANTITY_TOO_HIGH, None, None
+
+    return REASON_VALID, price, quantity  # Parsed values for the caller
+
+
 def validate_sale(sale, config):  # Validate a sale dictionary
     """Validate sale based on config rules."""
-    required_fields = config["required_fields"]  # Get required fields
-    min_price = config["min_price"]  # Get minimum price
-    max_quantity = config["max_quantity"]  # Get maximum quantity
-    prefix = config["product_prefix"]  # Get product prefix
-    max_decimals = config["max_decimals"]  # Get max decimal places
-
-    print(f"Validating sale: {sale}")  # Debug: print sale
+    rules = as_rules(config)  # No-op for SalesRules, converts a plain dict
+    logger.debug("Validating sale: %s", sale)  # Debug: formatted only if enabled
     # Check for missing or empty fields
-    for field in required_fields:  # Loop through required fields
+    for field in rules.required_fields:  # Loop through required fields
         if not sale[field] or sale[field].strip() == "":  # Check if field is empty
-            print(f"Invalid sale: missing {field}: {sale}")  # Log invalid
+            logger.debug("Invalid sale: missing %s: %s", field, sale)  # Log invalid
+            rejects.record("missing_field", sale)  # Count reason
             return False
 
-    # Validate product: non-empty and matches prefix
-    product = clean_string(sale["product"])  # Clean product string
-    if not product.startswith(prefix):  # Check prefix
-        print(f"Invalid sale: product lacks '{prefix}' prefix: {sale}")  # Log invalid
+    # Validate prefix, price and quantity with the shared rules
+    reason = check_fields(sale["product"], sale["price"], sale["quantity"], rules)[0]
+    if reason != REASON_VALID:  # Log and count why the row failed
+        logger.debug("Invalid sale: %s: %s", REASON_NAMES[reason], sale)
+        rejects.record(REASON_NAMES[reason], sale)  # Count reason
         return False
 
-    # Validate price: numeric, meets minimum, and positive
-    price = clean_string(sale["price"])  # Clean price string
-    if (
-        not is_numeric(price, max_decimals)
-        or float(price) < min_price
-        or float(price) <= 0
-    ):  # Check format, value, and positivity
-        print(f"Invalid sale: invalid price: {sale}")  # Log invalid
-        return False
+    return True  # Return True if all checks pass
 
-    # Validate quantity: integer and within limit
-    quantity = clean_string(sale["quantity"])  # Clean quantity string
-    if not quantity.isdigit() or int(quantity) > max_quantity:  # Check format and limit
-        print(f"Invalid sale: invalid quantity: {sale}")  # Log invalid
-        return False
 
-    return True  # Return True if all checks pass
+def validate_sales_batch(products, prices, quantities, config):  # Columns in
+    """Return a uint8 reason-code array for whole columns in one NumPy pass."""
+    rules = as_rules(config)  # Attribute access, converted once per batch
+    products = _as_str_array(products)  # Column of product strings
+    prices = _as_str_array(prices)  # Column of price strings
+    quantities = _as_str_array(quantities)  # Column of quantity strings
+
+    product = np.strings.strip(products)  # Clean strings, vectorized
+    price = np.strings.strip(prices)
+    quantity = np.strings.strip(quantities)
+
+    missing = (product == "") | (price == "") | (quantity == "")  # Empty fields
+    bad_prefix = ~np.strings.startswith(product, rules.product_prefix)
+
+    whole, dot, decimals = np.strings.partition(price, ".")  # Split on decimal
+    price_ok = (
+        (dot == ".")
+        & np.strings.isdecimal(whole)
+        & np.strings.isdecimal(decimals)
+        & (np.strings.str_len(decimals) <= price_decimals(rules))
+    )  # Same format rule as is_numeric
+    price_cents = np.zeros(len(price), dtype=np.int64)  # Cents, 0 where malformed
+    price_cents[price_ok] = money.to_cents(price[price_ok])  # Same as parse_cents
+    below_min = (price_cents < rules.min_price * money.CENTS) | (price_cents <= 0)
+
+    quantity_ok = np.strings.isdecimal(quantity)  # Checked as text: "1e2" fails
+    quantity_value = np.zeros(len(quantity), dtype=np.int64)  # Parsed quantities
+    quantity_value[quantity_ok] = quantity[quantity_ok].astype(np.int64)  # No float
+    too_high = quantity_value > rules.max_quantity
+
+    # First failing rule wins, in the same order as check_fields
+    return np.select(
+        [missing, bad_prefix, ~price_ok, below_min, ~quantity_ok, too_high],
+        [
+            REASON_MISSING_FIELD,
+            REASON_BAD_PREFIX,
+            REASON_BAD_PRICE_FORMAT,
+            REASON_BELOW_MIN_PRICE,
+            REASON_BAD_QUANTITY_FORMAT,
+            REASON_QUANTITY_TOO_HIGH,
+        ],
+        REASON_VALID,
+    ).astype(np.uint8)
+
+
+def reason_counts(codes):  # Summarize a reason-code array
+    """Return {reason name: count} for the invalid codes in the array."""
+    counts = np.bincount(codes, minlength=len(REASON_NAMES))  # One pass
+    return {
+        REASON_NAMES[code]: int(counts[code])
+        for code in range(1, len(REASON_NAMES))
+        if counts[code]
+    }  # Skip valid rows and zero counts
+
+
+def _as_str_array(values):  # Normalize a column
+    """Convert a column to a NumPy string array, treating None as empty."""
+    values = np.asarray(values, dtype=object)  # Keep None visible
+    values[np.equal(values, None)] = ""  # Short CSV rows give None
+    return values.astype(str)  # Fixed-width unicode array
+
+
+class Sale:  # Compact sale record
+    """Sale with price and quantity already parsed; __slots__ avoids a per-row dict."""
+
+    __slots__ = ("product", "price_cents", "quantity")  # No __dict__
+
+    def __init__(self, product, price_cents, quantity):  # Constructor
+        self.product = product  # Product name
+        self.price_cents = price_cents  # Integer price in cents
+        self.quantity = quantity  # Integer quantity
+
+    def __repr__(self):  # Readable debug output
+        return f"Sale({self.product!r}, {self.price_cents!r}, {self.quantity!r})"
+
+
+def parse_sale(fields, config):  # Validate positional fields and build a Sale
+    """Return a Sale from (product, price, quantity) strings, or None if invalid."""
+    return parse_sale_reason(fields, config)[0]  # Drop the reason code
+
+
+def parse_sale_reason(fields, config):  # parse_sale plus the reason code
+    """Return (Sale or None, reason code) for (product, price, quantity) strings."""
+    logger.debug("Validating sale: %s", fields)  # Debug: formatted only if enabled
+    reason, price, quantity = check_fields(*fields, as_rules(config))  # Parse once
+    if reason != REASON_VALID:  # Log and count why the row failed
+        logger.debug("Invalid sale: %s: %s", REASON_NAMES[reason], fields)
+        rejects.record(REASON_NAMES[reason], fields)  # Count reason
+        return None, reason
+    return Sale(fields[0], price, quantity), reason  # Parsed values travel on
@@ -0,0 +1,109 @@
+# File: de-onboarding/checkpoint.py
+# Incremental runs over append-only CSVs: byte-offset checkpoint + running totals
+import io  # For in-memory text streams
+import os  # For atomic replace
+import json  # For the state file
+import zlib  # For a cheap fingerprint of already processed bytes
+import money  # Integer-cent totals
+import topk  # For top products without a full sort
+
+TAIL_BYTES = 4096  # Bytes before the offset that must not change between runs
+CHUNK_BYTES = 4 * 2**20  # Appended bytes parsed at a time
+SAVE_EVERY = 16  # Chunks merged between checkpoint writes (64 MiB of rows)
+
+
+def state_path(csv_path):  # Checkpoint location
+    """Return the path of the checkpoint file for csv_path."""
+    return csv_path + ".ckpt.json"  # e.g. data/sales.csv.ckpt.json
+
+
+def _tail_crc(file, offset):  # Fingerprint processed data
+    """Return the CRC32 of the bytes just before offset."""
+    start = max(0, offset - TAIL_BYTES)  # At most TAIL_BYTES back
+    file.seek(start)  # Jump to fingerprint start
+    return zlib.crc32(file.read(offset - start))  # Checksum
+
+
+def new_state(header, offset, tail_crc):  # Empty running totals
+    """Return a state that starts right after the header."""
+    return {
+        "offset": offset,  # Next unprocessed byte
+        "tail_crc": tail_crc,  # Fingerprint of bytes before offset
+        "header": header,  # Header line, prepended to every delta
+        "total_cents": 0,  # Running total in integer cents
+        "product_cents": {},  # Product -> running amount in cents
+        "valid_sales": 0,  # Running valid count
+        "invalid_sales": 0,  # Running invalid count
+    }
+
+
+def load_state(csv_path):  # Resume or start over
+    """Return the saved state, or a fresh one if missing or the CSV was rewritten."""
+    with open(csv_path, "rb") as file:  # Binary mode for exact offsets
+        header = file.readline()  # Header bytes
+        size = os.fstat(file.fileno()).st_size  # Current file size
+        path = state_path(csv_path)  # Checkpoint path
+        if os.path.exists(path):  # Previous run left a checkpoint
+            with open(path, "r") as state_file:
+                state = json.load(state_file)
+            if (
+                "total_cents" in state  # Older checkpoints kept float totals
+                and state["header"] == header.decode("utf-8")
+                and state["offset"] <= size
+                and _tail_crc(file, state["offset"]) == state["tail_crc"]
+            ):  # Same file, only appended to
+                return state
+            print(f"Checkpoint does not match {csv_path}, starting over")  # Reset
+        offset = len(header)  # Rows start after the header
+        return new_state(header.decode("utf-8"), offset, _tail_crc(file, offset))
+
+
+def iter_delta(csv_path, state, chunk_bytes=CHUNK_BYTES):  # New rows, in chunks
+    """Yield (stream, end) for complete lines appended since offset, chunk by chunk.
+
+    Each stream is the header plus whole lines from about chunk_bytes of the
+    file; end is the offset right after them. A partial last line waits for
+    the next run.
+    """
+    offset = state["offset"]  # Next unprocessed byte
+    carry = b""  # Start of a line cut by the chunk boundary
+    with open(csv_path, "rb") as file:  # Binary mode for exact offsets
+        file.seek(offset)  # Skip processed rows
+        while True:
+            data = file.read(chunk_bytes)  # One bounded chunk
+            if not data:  # End of file
+                return
+            data = carry + data  # Finish the cut line
+            end = data.rfind(b"\n") + 1  # Last complete line
+            carry = data[end:]  # Rest goes with the next chunk
+            if end:  # At least one complete line
+                offset += end
+                text = state["header"] + data[:end].decode("utf-8")  # Readable CSV
+                yield io.StringIO(text), offset  # Stream and new offset
+
+
+def merge(state, product_cents, valid_sales, invalid_sales):  # Add one delta
+    """Merge per-product amounts (integer cents) and counts from new rows into state."""
+    totals = state["product_cents"]  # Running per-product amounts
+    for product, cents in product_cents.items():  # Add each product
+        totals[product] = totals.get(product, 0) + int(cents)
+    state["total_cents"] += int(sum(product_cents.values()))  # Running total
+    state["valid_sales"] += valid_sales  # Running valid count
+    state["invalid_sales"] += invalid_sales  # Running invalid count
+
+
+def save_state(csv_path, state, end):  # Commit progress
+    """Move the checkpoint to end and write it atomically."""
+    with open(csv_path, "rb") as file:  # Fingerprint the new tail
+        state["tail_crc"] = _tail_crc(file, end)
+    state["offset"] = end  # Next run starts here
+    path = state_path(csv_path)  # Checkpoint path
+    with open(path + ".tmp", "w") as file:  # Write next to the target
+        json.dump(state, file, separators=(",", ":"))  # Compact: one line
+    os.replace(path + ".tmp", path)  # Never leaves a half-written checkpoint
+
+
+def top_products(state, n=topk.TOP_K):  # Largest running amounts
+    """Return the n products with the highest running sales, as float amounts."""
+    ranked = topk.top_k_items(state["product_cents"].items(), n)  # Exact ranking
+    return {product: money.to_float(cents) for product, cents in ranked.items()}
@@ -0,0 +1,84 @@
+# File: de-onboarding/logging_utils.py (from Chapter 1)
+# One logging surface for the pipelines: levels, lazy formatting, quiet mode
+import os  # For environment settings
+import sys  # For stdout handler
+import time  # For sampling window
+import logging  # Standard logging levels and lazy %-formatting
+from collections import Counter  # For per-reason counts
+
+# DE_LOG_MODE=debug prints every row like before; production skips per-row logs
+LOG_MODE = os.environ.get("DE_LOG_MODE", "debug")
+# DE_LOG_SAMPLE=N logs at most N rejected rows per second in production mode
+SAMPLE_PER_SECOND = int(os.environ.get("DE_LOG_SAMPLE", "0"))
+LEVELS = {"debug": logging.DEBUG, "production": logging.INFO}  # Mode to level
+
+
+class StdoutHandler(logging.StreamHandler):  # Follows redirect_stdout like print
+    """StreamHandler that writes to whatever sys.stdout is when a record is logged."""
+
+    @property
+    def stream(self):  # Looked up on every emit
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):  # StreamHandler.__init__ sets it; ignored
+        pass
+
+
+def get_logger(name="de_onboarding"):  # Shared logger
+    """Return the pipeline logger, writing plain messages to stdout."""
+    logger = logging.getLogger(name)  # Same object on every call
+    if not logger.handlers:  # Configure only once
+        handler = StdoutHandler()  # Same stream as print, even when redirected
+        handler.setFormatter(logging.Formatter("%(message)s"))  # Keep old output
+        logger.addHandler(handler)  # Attach handler
+        logger.propagate = False  # Avoid duplicate lines via root logger
+        logger.setLevel(LEVELS.get(LOG_MODE, logging.DEBUG))  # Level from environment
+        if LOG_MODE not in LEVELS:  # Typo must not break every importing script
+            logger.warning(
+                "Unknown DE_LOG_MODE %r, using 'debug' (expected one of: %s)",
+                LOG_MODE,
+                ", ".join(LEVELS),
+            )
+    return logger  # Return logger
+
+
+def configure_logging(mode):  # Switch mode at runtime
+    """Set mode to 'debug' (per-row logs) or 'production' (summaries only)."""
+    if mode not in LEVELS:  # Clear message instead of a KeyError
+        raise ValueError(
+            f"Unknown log mode {mode!r}, expected one of: {', '.join(LEVELS)}"
+        )
+    get_logger().setLevel(LEVELS[mode])  # Update level
+
+
+class RejectSummary:  # Count invalid rows instead of printing each one
+    """Count rejected rows per reason, logging a sampled few in production."""
+
+    def __init__(self, logger, sample_per_second=0):  # Constructor
+        self.logger = logger  # Where summaries go
+        self.sample_per_second = sample_per_second  # Detail logs per second
+        self.counts = Counter()  # Reason -> rejected rows
+        self.window = 0  # Current one-second window
+        self.sampled = 0  # Detail logs written in this window
+
+    def record(self, reason, row):  # Called once per rejected row
+        """Count a rejected row; log it only if the sampling budget allows."""
+        self.counts[reason] += 1  # No string is built here
+        if self.sample_per_second and not self.logger.isEnabledFor(logging.DEBUG):
+            window = int(time.monotonic())  # Current second
+            if window != self.window:  # New second, new budget
+                self.window, self.sampled = window, 0
+            if self.sampled < self.sample_per_second:  # Budget left
+                self.sampled += 1  # Use one slot
+                self.logger.info("Rejected (%s): %s", reason, row)  # Sampled detail
+
+    def log_summary(self):  # Called once per run
+        """Log the per-reason counts and reset them."""
+        if self.counts:  # Only when something was rejected
+            self.logger.info("Invalid rows by reason: %s", dict(self.counts))
+        self.counts.clear()  # Ready for the next run
+
+
+logger = get_logger()  # Module-level logger for pipeline code
+rejects = RejectSummary(logger, SAMPLE_PER_SECOND)  # Shared reject counter
@@ -1,88 +1,175 @@
 import pandas as pd  # For DataFrame operations
 import numpy as np  # For numerical computations
-import yaml  # For YAML parsing
-import json  # For JSON export
-import matplotlib.pyplot as plt  # For plotting
-import utils  # Import custom utils module
+import config_rules  # Cached, typed config.yaml rules
+import json_export  # For streaming JSON export
+import topk  # For top products without a full sort
+import money  # Integer-cent amounts
+import sales_plot  # Aggregated bar charts, matplotlib loaded on demand
+import rule_kernels  # Vectorized validation rules
+import schema_loader  # Typed, column-projected CSV loading
+import csv_cache  # Memory-mapped columns for repeat loads
+import checkpoint  # For incremental runs
+import line_index  # For reading row slices through the offset index
+from logging_utils import logger  # Leveled, lazily formatted logs
 import os  # For file existence check
+import sys  # For command-line flag
+
+CHUNK_ROWS = 100000  # Rows per chunk in the chunked engine
 
 
 # Define function to read YAML configuration
 def read_config(config_path):  # Takes config file path
-    """Read YAML configuration."""
+    """Read YAML configuration as cached config_rules.SalesRules."""
     print(f"Opening config: {config_path}")  # Debug: print path
-    file = open(config_path, "r")  # Open YAML
-    config = yaml.safe_load(file)  # Parse YAML
-    file.close()  # Close file
-    print(f"Loaded config: {config}")  # Debug: print config
-    return config  # Return config dictionary
+    config = config_rules.load_rules(config_path)  # Parsed once per file version
+    print(f"Loaded config: {config.source}")  # Debug: print config
+    return config  # Return rules (config["key"] still works)
 
 
 # Define function to load and validate sales data
-def load_and_validate_sales(csv_path, config):  # Takes CSV path and config
-    """Load sales CSV and validate using Pandas."""
+def load_and_validate_sales(csv_path, config, rows=None):  # Takes CSV path and config
+    """Load sales CSV and validate using Pandas; rows=(start, stop) reads a slice."""
     print(f"Loading CSV: {csv_path}")  # Debug: print path
-    # Load CSV and coerce price to numeric, invalids become NaN
-    df = pd.read_csv(csv_path)
+    fields = config_rules.as_rules(config).required_fields  # Columns to load
+    if rows is None:  # Whole file, memory-mapped after the first load
+        df = csv_cache.load_csv(csv_path, fields)
+    else:  # Seek straight to the slice via the line-offset index
+        df = schema_loader.load_csv(
+            line_index.open_rows(csv_path, rows[0], rows[1]), fields
+        )
+    return validate_sales_frame(df, config)  # Validate loaded rows
+
+
+# Define function to validate a loaded sales DataFrame
+def validate_sales_frame(df, config):  # Takes raw DataFrame and config
+    """Validate raw sales rows; returns (df, valid count, total records)."""
+    config = config_rules.as_rules(config)  # Typed rules, converted once
+    # Coerce price to numeric, invalids become NaN
     df["price"] = pd.to_numeric(df["price"], errors="coerce")
-    print("Initial DataFrame:")
-    print(df)
+    logger.debug("Initial DataFrame:\n%s", df)  # Frame is rendered only if enabled
 
     # Check for missing required columns
-    missing_fields = [f for f in config["required_fields"] if f not in df.columns]
+    missing_fields = [f for f in config.required_fields if f not in df.columns]
     if missing_fields:
         print(f"Missing columns: {missing_fields}")
         return pd.DataFrame(), 0, 0
 
     # Drop rows with missing required fields (including NaN price)
-    df = df.dropna(subset=config["required_fields"])
+    df = df.dropna(subset=list(config.required_fields))
 
     # Early return if DataFrame is empty after dropping required fields
     if df.empty:
         print("No data available after dropping missing required fields.")
         return df, 0, 0
 
-    df = df[df["quantity"].apply(utils.is_integer)]  # Ensure quantity is integer
-    df["quantity"] = df["quantity"].astype(int)
-    df = df[df["quantity"] <= config["max_quantity"]]
-    df = df[df["price"] > 0]
-    df = df[df["price"] >= config["min_price"]]
+    quantity = rule_kernels.as_numeric(df["quantity"])  # Numeric, NaN for text
+    valid = (
+        rule_kernels.integer_mask(df["quantity"])  # Ensure quantity is integer
+        & rule_kernels.range_mask(quantity, maximum=config.max_quantity)
+        & rule_kernels.positive_mask(df["price"])
+        & rule_kernels.range_mask(df["price"], minimum=config.min_price)
+        & rule_kernels.decimals_mask(df["price"], config.max_decimals)  # Exact cents
+    )  # Whole-column masks instead of per-row .apply
+    df = df[valid].assign(quantity=quantity[valid].astype(int))
     total_records = len(df)
-    print("Validated DataFrame:")
-    print(df)
+    logger.debug("Validated DataFrame:\n%s", df)
     return df, len(df), total_records
 
 
 # Define function to process sales data
-def process_sales(df):  # Takes DataFrame
-    """Process sales: compute total and top products using Pandas/NumPy."""
+def process_sales(df, k=topk.TOP_K):  # Takes DataFrame and top product count
+    """Process sales: compute total and top k products using Pandas/NumPy."""
     if df.empty:  # Check for empty DataFrame
         print("No valid sales data")  # Log empty
         return {"total_sales": 0.0, "unique_products": [], "top_products": {}}, 0
 
-    # Compute amount
-    df["amount"] = (df["price"] * df["quantity"]).round(2)  # Price * quantity, rounded
-    print("DataFrame with Amount:")  # Debug
-    print(df)  # Show DataFrame with amount
+    # Compute amount in integer cents: exact sums, no per-row rounding
+    cents = pd.Series(
+        money.to_cents(df["price"]) * df["quantity"].to_numpy(), index=df.index
+    )  # int64 price cents * quantity
+    df["amount"] = money.to_float(cents)  # Float amounts for display and plots
+    logger.debug("DataFrame with Amount:\n%s", df)  # Show DataFrame with amount
 
     # Compute metrics using NumPy
-    total_sales = float(np.sum(df["amount"].values))  # Total sales
+    total_cents = int(np.sum(cents.values))  # Total sales in cents
     unique_products = df["product"].unique().tolist()  # Unique products
-    sales_by_product = df.groupby("product")["amount"].sum().round(2)
-    # Use OrderedDict to preserve order
-    from collections import OrderedDict
-
-    top_products = OrderedDict(
-        sales_by_product.sort_values(ascending=False).head(3).items()
-    )
+    sales_by_product = cents.groupby(df["product"], observed=True).sum()  # Cents
+    top_products = topk.top_k(money.to_float(sales_by_product), k)  # Ties by name
 
     valid_sales = len(df)  # Count valid sales
     print(f"Valid sales: {valid_sales} records")  # Log valid count
 
     return {
-        "total_sales": round(total_sales, 2),  # Convert to float for JSON
+        "total_sales": money.to_float(total_cents),  # Converted once, for JSON
         "unique_products": unique_products,  # List of products
-        "top_products": dict(top_products),  # Top 3 products, ordered
+        "top_products": top_products,  # Top k products, ordered
+    }, valid_sales  # Return results and count
+
+
+# Define function to reduce one validated chunk to mergeable totals
+def summarize_chunk(df, rows_read):  # Takes validated DataFrame and rows read
+    """Return a partial: amount total, per-product sums (integer cents) and counts."""
+    if df.empty:  # Nothing valid in this chunk
+        product_cents = {}
+    else:
+        cents = pd.Series(
+            money.to_cents(df["price"]) * df["quantity"].to_numpy(), index=df.index
+        )  # Same integer cents as batch
+        product_cents = (
+            cents.groupby(df["product"], observed=True, sort=False).sum().to_dict()
+        )
+    return {
+        "total_cents": int(sum(product_cents.values())),  # Chunk total
+        "product_cents": product_cents,  # Product -> cents, first-seen order
+        "valid_sales": len(df),  # Valid rows in chunk
+        "rows_read": rows_read,  # Rows in chunk, valid or not
+    }
+
+
+# Define function to load sales chunk by chunk
+def load_sales_partials(csv_path, config, chunksize=CHUNK_ROWS):  # Chunked engine
+    """Yield one partial per chunk; memory stays bounded by chunksize rows."""
+    print(f"Loading CSV in chunks of {chunksize}: {csv_path}")  # Debug: print path
+    fields = config_rules.as_rules(config).required_fields  # Columns to load
+    chunks = schema_loader.load_csv(csv_path, fields, chunksize=chunksize)
+    for chunk in chunks:  # One typed chunk at a time
+        rows_read = len(chunk)  # Rows before validation
+        df, _, _ = validate_sales_frame(chunk, config)  # Same rules as batch
+        yield summarize_chunk(df, rows_read)  # Drop rows, keep totals
+
+
+# Define function to merge partials
+def merge_partials(partials):  # Takes iterable of partials
+    """Merge partials in file order into a single partial."""
+    merged = {"total_cents": 0, "product_cents": {}, "valid_sales": 0, "rows_read": 0}
+    totals = merged["product_cents"]  # Product -> cents
+    for partial in partials:  # Chunks in file order
+        merged["total_cents"] += partial["total_cents"]  # Add chunk total
+        for product, cents in partial["product_cents"].items():  # Add products
+            totals[product] = totals.get(product, 0) + cents
+        merged["valid_sales"] += partial["valid_sales"]  # Add valid count
+        merged["rows_read"] += partial["rows_read"]  # Add rows read
+    return merged  # Return merged partial
+
+
+# Define function to process merged partials
+def process_partials(partial, k=topk.TOP_K):  # Takes merged partial
+    """Build the same results as process_sales from a merged partial."""
+    if not partial["valid_sales"]:  # No valid rows in any chunk
+        print("No valid sales data")  # Log empty
+        return {"total_sales": 0.0, "unique_products": [], "top_products": {}}, 0
+
+    # Same ordering as process_sales: groupby sorts products by name
+    sales_by_product = money.to_float(pd.Series(partial["product_cents"]).sort_index())
+    top_products = topk.top_k(sales_by_product, k)  # Same ranking as batch
+
+    valid_sales = partial["valid_sales"]  # Count valid sales
+    print(f"Valid sales: {valid_sales} records")  # Log valid count
+
+    return {
+        "total_sales": money.to_float(partial["total_cents"]),  # Exact total
+        "unique_products": list(partial["product_cents"]),  # First-seen order
+        "top_products": top_products,  # Top k products, ordered
     }, valid_sales  # Return results and count
 
 
@@ -91,9 +178,7 @@ def export_results(results, json_path):  # Takes results and file path
     """Export results to JSON."""
     print(f"Writing to: {json_path}")  # Debug: print path
     print(f"Results: {results}")  # Debug: print results
-    file = open(json_path, "w")  # Open JSON file
-    json.dump(results, file, indent=2)  # Write JSON
-    file.close()  # Close file
+    json_export.export_json(results, json_path)  # Compact, streamed; .gz compresses
     print(f"Exported results to {json_path}")  # Confirm export
 
 
@@ -104,20 +189,38 @@ def plot_sales(df, plot_path):  # Takes DataFrame and plot path
         print("No data to plot")  # Log empty
         return
 
-    plt.figure(figsize=(8, 6))  # Set figure size
-    plt.bar(df["product"], df["amount"])  # Bar plot
-    plt.title("Sales by Product")  # Title
-    plt.xlabel("Product")  # X-axis label
-    plt.ylabel("Sales Amount ($)")  # Y-axis label
-    plt.xticks(rotation=45)  # Rotate x labels
-    plt.grid(True)  # Add grid
-    plt.tight_layout()  # Adjust layout
-    plt.savefig(plot_path, dpi=100)  # Save plot with high resolution
-    plt.close()  # Close figure
+    totals = sales_plot.aggregate_amounts(df)  # Top products plus "Other"
+    sales_plot.plot_amounts(totals, plot_path, "Sales by Product")  # Draw bars
     print(f"Plot saved to {plot_path}")  # Confirm save
     print(f"File exists: {os.path.exists(plot_path)}")  # Confirm file creation
 
 
+# Define function for incremental runs over an append-only CSV
+def process_incremental(csv_path, config):  # Takes CSV path and config
+    """Process only rows appended since the last run; return the running state."""
+    state = checkpoint.load_state(csv_path)  # Resume from the last offset
+    start = end = state["offset"]  # First new byte; end of the last merged chunk
+    fields = config_rules.as_rules(config).required_fields  # Columns to load
+    chunks = checkpoint.iter_delta(csv_path, state)  # Bounded chunks
+    for count, (stream, end) in enumerate(chunks, 1):
+        df = schema_loader.load_csv(stream, fields)  # Parse chunk only
+        rows_read = len(df)  # New rows, valid or not
+        df, _, _ = validate_sales_frame(df, config)  # Validate chunk
+        partial = summarize_chunk(df, rows_read)  # Same reduction as chunked engine
+        checkpoint.merge(
+            state,
+            partial["product_cents"],
+            partial["valid_sales"],
+            rows_read - partial["valid_sales"],
+        )  # Merge chunk into running totals
+        if count % checkpoint.SAVE_EVERY == 0:  # Bounded rework after a crash
+            checkpoint.save_state(csv_path, state, end)  # Persist offset and totals
+    if end != state["offset"]:  # Chunks merged since the last save
+        checkpoint.save_state(csv_path, state, end)  # Final offset and totals
+    print(f"Processed bytes {start}..{state['offset']} of {csv_path}")  # Debug
+    return state  # Return running state
+
+
 # Define main function
 def main():  # No parameters
     """Main function to process sales data."""
@@ -127,10 +230,23 @@ def main():  # No parameters
     plot_path = "data/sales_trend.png"  # Plot output path
 
     config = read_config(config_path)  # Read config
-    df, valid_sales, total_records = load_and_validate_sales(
-        csv_path, config
-    )  # Load and validate
-    results, valid_sales = process_sales(df)  # Process
+    if "--chunked" in sys.argv:  # Bounded memory: merge per-chunk partials
+        partial = merge_partials(load_sales_partials(csv_path, config))
+        results, valid_sales = process_partials(partial)  # Process
+        total_records = partial["rows_read"]  # Rows in every chunk, valid or not
+        df = pd.DataFrame(
+            {
+                "product": list(partial["product_cents"]),
+                "amount": [
+                    money.to_float(c) for c in partial["product_cents"].values()
+                ],
+            }
+        )  # One bar per product instead of per row
+    else:
+        df, valid_sales, total_records = load_and_validate_sales(
+            csv_path, config
+        )  # Load and validate
+        results, valid_sales = process_sales(df)  # Process
     export_results(results, json_path)  # Export results
     plot_sales(df, plot_path)  # Generate plot
 
@@ -145,5 +261,27 @@ def main():  # No parameters
     print("Processing completed")  # Confirm completion
 
 
+# Define main function for incremental mode
+def main_incremental():  # No parameters
+    """Report running totals after processing newly appended rows."""
+    config = read_config("data/config.yaml")  # Read config
+    state = process_incremental("data/sample.csv", config)  # Process delta
+
+    # Output report
+    print("\nSales Report (incremental):")  # Print header
+    print(
+        f"Total Records Processed: {state['valid_sales'] + state['invalid_sales']}"
+    )  # Total records
+    print(f"Valid Sales: {state['valid_sales']}")  # Valid count
+    print(f"Invalid Sales: {state['invalid_sales']}")  # Invalid count
+    print(f"Total Sales: ${money.to_float(state['total_cents'])}")  # Total sales
+    print(f"Unique Products: {list(state['product_cents'])}")  # Products
+    print(f"Top Products: {checkpoint.top_products(state)}")  # Top products
+    print("Processing completed")  # Confirm completion
+
+
 if __name__ == "__main__":
-    main()  # Run main function
+    if "--incremental" in sys.argv:  # Only rows appended since the last run
+        main_incremental()  # Run incremental mode
+    else:
+        main()  # Run main function
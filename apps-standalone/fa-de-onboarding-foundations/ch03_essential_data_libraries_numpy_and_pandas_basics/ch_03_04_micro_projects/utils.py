@@ -1,3 +1,7 @@
+from config_rules import as_rules  # Typed rules from config.yaml
+from logging_utils import logger, rejects  # Leveled, lazily formatted logs
+
+
 def is_decimal_string(s, max_decimals=2):  # Check if string is a decimal number
     """Check if string is a decimal number with up to max_decimals."""
     parts = s.split(".")  # Split on decimal point
@@ -35,23 +39,26 @@ def is_integer(x):  # Check if value is an integer
 
 def validate_sale(sale, config):  # Validate a sale dictionary
     """Validate sale based on config rules."""
-    required_fields = config["required_fields"]  # Get required fields
-    min_price = config["min_price"]  # Get minimum price
-    max_quantity = config["max_quantity"]  # Get maximum quantity
-    prefix = config["product_prefix"]  # Get product prefix
-    max_decimals = config["max_decimals"]  # Get max decimal places
-
-    print(f"Validating sale: {sale}")  # Debug: print sale
+    rules = as_rules(config)  # No-op for SalesRules, converts a plain dict
+    required_fields = rules.required_fields  # Get required fields
+    min_price = rules.min_price  # Get minimum price
+    max_quantity = rules.max_quantity  # Get maximum quantity
+    prefix = rules.product_prefix  # Get product prefix
+    max_decimals = rules.max_decimals  # Get max decimal places
+
+    logger.debug("Validating sale: %s", sale)  # Debug: formatted only if enabled
     # Check for missing or empty fields
     for field in required_fields:  # Loop through required fields
         if not sale[field] or sale[field].strip() == "":  # Check if field is empty
-            print(f"Invalid sale: missing {field}: {sale}")  # Log invalid
+            logger.debug("Invalid sale: missing %s: %s", field, sale)  # Log invalid
+            rejects.record("missing_field", sale)  # Count reason
             return False
 
     # Validate product: non-empty and matches prefix
     product = clean_string(sale["product"])  # Clean product string
     if not product.startswith(prefix):  # Check prefix
-        print(f"Invalid sale: product lacks '{prefix}' prefix: {sale}")  # Log invalid
+        logger.debug("Invalid sale: product lacks '%s' prefix: %s", prefix, sale)
+        rejects.record("bad_prefix", sale)  # Count reason
         return False
 
     # Validate price: numeric, meets minimum, and positive
@@ -61,13 +68,15 @@ def validate_sale(sale, config):  # Validate a sale dictionary
         or float(price) < min_price
         or float(price) <= 0
     ):  # Check format, value, and positivity
-        print(f"Invalid sale: invalid price: {sale}")  # Log invalid
+        logger.debug("Invalid sale: invalid price: %s", sale)  # Log invalid
+        rejects.record("invalid_price", sale)  # Count reason
         return False
 
     # Validate quantity: integer and within limit
     quantity = clean_string(sale["quantity"])  # Clean quantity string
     if not quantity.isdigit() or int(quantity) > max_quantity:  # Check format and limit
-        print(f"Invalid sale: invalid quantity: {sale}")  # Log invalid
+        logger.debug("Invalid sale: invalid quantity: %s", sale)  # Log invalid
+        rejects.record("invalid_quantity", sale)  # Count reason
         return False
 
     return True  # Return True if all checks pass
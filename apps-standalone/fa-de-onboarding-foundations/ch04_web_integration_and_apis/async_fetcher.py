@@ -0,0 +1,149 @@
+# File: de-onboarding/async_fetcher.py
+# Concurrent GETs with asyncio: bounded fan-out, per-host limits, ordered or as completed
+import os  # For benchmark output path
+import sys  # For command-line arguments
+import time  # For benchmark timing
+import asyncio  # Event loop, semaphores, as_completed
+import tempfile  # For benchmark output
+from contextlib import redirect_stdout  # For silencing imports in the benchmark
+from concurrent.futures import ThreadPoolExecutor  # Blocking requests off the loop
+from urllib.parse import urlsplit  # For per-host limits
+import requests  # For request exceptions
+import http_client  # Pooled sessions with timeouts and retries
+
+CONCURRENCY = 20  # Requests in flight at once
+PER_HOST = 10  # Requests in flight (and pooled connections) per host
+
+
+def get_json(session, url):  # Runs in a worker thread
+    """Return the JSON body of a successful GET, or None."""
+    try:
+        response = http_client.request("get", url, session=session)
+    except requests.RequestException:  # No response after retries
+        return None
+    if response.status_code != 200:
+        return None
+    try:
+        return response.json()
+    except ValueError:  # 200 with a non-JSON body: one failed URL, not the batch
+        return None
+
+
+async def iter_fetch(urls, concurrency=CONCURRENCY, per_host=PER_HOST):  # Unordered
+    """Yield (index, data) for each url as soon as its response arrives.
+
+    data is the JSON body, or None when the request failed. At most concurrency
+    requests are in flight, and at most per_host to any one host.
+    """
+    urls = list(urls)  # Index -> URL
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)  # Global bound
+    host_limits = {}  # Host -> Semaphore(per_host)
+    session = http_client.make_session(pool_size=per_host)  # Keep-alive per host
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor, session:
+
+        async def fetch(index, url):  # One request
+            host = urlsplit(url).netloc  # "127.0.0.1:8000"
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+            async with host_limit, limit:  # Host slot first, so other hosts can run
+                data = await loop.run_in_executor(executor, get_json, session, url)
+            return index, data
+
+        tasks = [asyncio.ensure_future(fetch(i, url)) for i, url in enumerate(urls)]
+        try:
+            for task in asyncio.as_completed(tasks):  # Completion order
+                yield await task
+        finally:  # Consumer stopped early: drop queued requests
+            for task in tasks:
+                task.cancel()
+
+
+async def fetch_many(urls, concurrency=CONCURRENCY, per_host=PER_HOST, ordered=True):
+    """Return the JSON bodies of urls, in input order or in completion order."""
+    urls = list(urls)
+    results = [None] * len(urls) if ordered else []  # Slot per URL or arrival list
+    async for index, data in iter_fetch(urls, concurrency, per_host):
+        if ordered:
+            results[index] = data  # Same position as its URL
+        else:
+            results.append(data)  # As it arrived
+    return results
+
+
+def fetch_all(urls, concurrency=CONCURRENCY, per_host=PER_HOST, ordered=True):
+    """Fetch urls concurrently from synchronous code; None marks a failed request."""
+    return asyncio.run(fetch_many(urls, concurrency, per_host, ordered))
+
+
+def fetch_posts(base_url, post_ids, **options):  # GET /posts/{id} for many ids
+    """Return the fetched posts in post_ids order, ready for validate_data."""
+    results = fetch_all([f"{base_url}/posts/{i}" for i in post_ids], **options)
+    posts = [post for post in results if post]  # Drop failed requests
+    print(f"DEBUG: Fetched {len(posts)} of {len(results)} posts")  # Debug
+    return posts
+
+
+def fetch_comments(base_url, post_ids, **options):  # GET /comments?postId=
+    """Return the comments of all post_ids as one flat list, ready for save_to_csv."""
+    urls = [f"{base_url}/comments?postId={i}" for i in post_ids]
+    results = fetch_all(urls, **options)
+    comments = [comment for page in results if page for comment in page]
+    failed = sum(page is None for page in results)  # Requests without a response
+    print(f"DEBUG: Fetched {len(comments)} comments, {failed} requests failed")
+    return comments
+
+
+def benchmark(posts=200, latency=0.02, concurrency=CONCURRENCY, per_host=PER_HOST):
+    """Print throughput of sequential requests and of the concurrent fetcher.
+
+    Both sides use http_client without the disk cache, so only the
+    concurrency differs.
+    """
+    import stub_server  # Local server with injected latency
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        import ch04_06_post_manager as post_manager  # utils prints on import
+
+    server, base_url = stub_server.start(posts=posts, latency=latency)
+    config = post_manager.read_config("data/config.yaml")  # Validation rules
+    ids = range(1, posts + 1)  # Every post
+    print(f"Benchmark: {posts} posts + comments, {latency * 1000:.0f} ms latency")
+
+    session = http_client.get_session()  # Shared keep-alive session, no cache
+    start = time.perf_counter()  # Start timer
+    sequential = [get_json(session, f"{base_url}/posts/{i}") for i in ids]
+    for i in ids:
+        get_json(session, f"{base_url}/comments?postId={i}")
+    sequential_time = time.perf_counter() - start  # Elapsed seconds
+
+    start = time.perf_counter()  # Start timer
+    options = {"concurrency": concurrency, "per_host": per_host}  # One host here
+    fetched = fetch_posts(base_url, ids, **options)  # Ordered
+    comments = fetch_comments(base_url, ids, **options)
+    concurrent_time = time.perf_counter() - start  # Elapsed seconds
+    stub_server.stop(server)
+
+    requests_made = 2 * posts  # Posts and comment pages
+    print(
+        f"Sequential requests: {sequential_time:.2f}s, "
+        f"{requests_made / sequential_time:.0f} requests/s"
+    )  # Report
+    print(
+        f"Concurrent ({min(concurrency, per_host)} in flight): "
+        f"{concurrent_time:.2f}s, "
+        f"{requests_made / concurrent_time:.0f} requests/s"
+    )  # Report
+    print(f"Same posts in same order: {fetched == sequential}")  # Check
+
+    with tempfile.TemporaryDirectory() as out_dir:  # Feed the existing pipeline
+        csv_path = os.path.join(out_dir, "comments.csv")
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            valid_posts = post_manager.validate_data(fetched, config)
+            post_manager.save_to_csv(comments, csv_path)
+        saved = os.path.exists(csv_path)  # Written by save_to_csv
+    print(f"Valid posts: {len(valid_posts)}, comments saved: {saved}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200)  # Post count
@@ -0,0 +1,216 @@
+# File: de-onboarding/bulk_writer.py
+# Bulk POST/PUT/PATCH/DELETE: worker threads, token-bucket rate limit, Retry-After
+import sys  # For command-line arguments
+import time  # For the token bucket and timing
+import random  # For backoff jitter
+import threading  # For the bucket lock
+from collections import Counter, deque  # For retry counters and the result window
+from concurrent.futures import ThreadPoolExecutor, wait  # Concurrent writes
+from email.utils import parsedate_to_datetime  # For HTTP-date Retry-After
+import requests  # For request exceptions
+import http_client  # Pooled sessions
+
+CONCURRENCY = 8  # Writes in flight at once
+RATE = 50  # Writes per second, sustained
+BURST = 10  # Writes allowed back to back after an idle period
+MAX_ATTEMPTS = 5  # Tries per operation, the first one included
+IDEMPOTENT = ("put", "delete")  # Safe to resend after a 5xx or lost connection
+
+
+class TokenBucket:  # Shared by all worker threads
+    """Allow rate operations per second with bursts of up to capacity."""
+
+    def __init__(self, rate=RATE, capacity=BURST):  # Constructor
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity  # Most tokens held at once
+        self.tokens = capacity  # Start full
+        self.updated = time.monotonic()  # Last refill
+        self.lock = threading.Lock()  # Guards tokens and updated
+
+    def acquire(self):  # Blocks until a token is free
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now > self.updated:  # Refill for the time passed (not paused)
+                    self.tokens += (now - self.updated) * self.rate
+                    self.tokens = min(self.tokens, self.capacity)
+                    self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (self.updated - now) + (1 - self.tokens) / self.rate
+            time.sleep(wait_time)  # Outside the lock
+
+    def pause(self, seconds):  # Server asked everybody to wait
+        """Stop handing out tokens for seconds, then resume at rate, not burst."""
+        with self.lock:
+            self.updated = max(self.updated, time.monotonic() + seconds)
+            self.tokens = 0  # No burst right after the pause
+
+
+def retry_after(response):  # Seconds the server asked us to wait
+    """Return the Retry-After delay of a response in seconds, or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():  # "1"
+        return int(value)
+    try:  # "Wed, 21 Oct 2015 07:28:00 GMT"
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):  # Unparseable: fall back to backoff
+        return None
+
+
+def backoff(attempt):  # No Retry-After given
+    """Return an exponential delay with jitter for the given attempt (1-based)."""
+    return http_client.BACKOFF * 2 ** (attempt - 1) + random.uniform(
+        0, http_client.JITTER
+    )
+
+
+def send(session, bucket, method, url, payload, max_attempts, stats, previous):
+    """Run one operation; return (status_code, data), status None if no response.
+
+    data is None for a failed operation or a success whose body is not JSON.
+
+    Waits for the previous change to the same URL first, so updates to one
+    resource keep their input order. 429 is retried for every method (the
+    server refused it); 5xx and lost connections only for PUT and DELETE.
+    """
+    if previous is not None:  # Earlier change to the same resource
+        wait([previous])
+    for attempt in range(1, max_attempts + 1):
+        if bucket:
+            bucket.acquire()  # Rate limit across all workers
+        try:
+            response = http_client.request(method, url, json=payload, session=session)
+        except requests.RequestException:  # No response
+            if method not in IDEMPOTENT or attempt == max_attempts:
+                stats["failed"] += 1
+                return None, None
+            stats["retries"] += 1
+            time.sleep(backoff(attempt))
+            continue
+        status = response.status_code
+        transient = status in http_client.RETRY_STATUSES and (
+            status == 429 or method in IDEMPOTENT
+        )  # Worth another attempt
+        if not transient or attempt == max_attempts:
+            if not 200 <= status < 300:
+                stats["failed"] += 1
+                return status, None
+            try:
+                return status, response.json() if response.content else {}
+            except ValueError:  # 2xx with a non-JSON body: keep the other results
+                return status, None
+        stats["throttled" if status == 429 else "retries"] += 1
+        delay = retry_after(response)  # Server-chosen wait
+        if delay is not None and bucket:  # Everybody waits, not just this worker
+            bucket.pause(delay)
+        else:
+            time.sleep(delay if delay is not None else backoff(attempt))
+
+
+def iter_writes(
+    base_url,
+    operations,
+    concurrency=CONCURRENCY,
+    rate=RATE,
+    burst=BURST,
+    max_attempts=MAX_ATTEMPTS,
+    stats=None,
+):  # Ordered generator
+    """Yield (status_code, data) for each (method, path, payload), in input order.
+
+    path is appended to base_url ("" for base_url itself). At most concurrency
+    writes run at once, limited to rate per second (None: unlimited).
+    PUT/PATCH/DELETE on one URL run one after another in input order; POSTs
+    and other URLs run concurrently. Only a few times concurrency results are
+    held, so operations can be a generator. stats, if a Counter, receives
+    throttled/retries/failed counts.
+    """
+    stats = stats if stats is not None else Counter()  # Throwaway counters
+    bucket = TokenBucket(rate, burst) if rate else None  # Shared limit
+    session = http_client.make_session(pool_size=concurrency, retries=0)  # Own retries
+    latest = {}  # URL -> future of its latest PUT/PATCH/DELETE
+    pending = deque()  # (url, future) in input order
+    with ThreadPoolExecutor(max_workers=concurrency) as executor, session:
+        for method, path, payload in operations:
+            url = base_url + path  # "https://host/posts" + "/1"
+            future = executor.submit(
+                send,
+                session,
+                bucket,
+                method,
+                url,
+                payload,
+                max_attempts,
+                stats,
+                latest.get(url) if method != "post" else None,
+            )  # Queued in input order, so the previous one on url started first
+            if method != "post":  # Creates are independent; changes are ordered
+                latest[url] = future
+            pending.append((url, future))
+            if len(pending) >= concurrency * 4:  # Bounded window
+                yield finish(pending, latest)
+        while pending:
+            yield finish(pending, latest)
+
+
+def finish(pending, latest):  # Oldest result
+    """Pop the oldest pending operation and return its result."""
+    url, future = pending.popleft()
+    result = future.result()  # Waits if still running
+    if latest.get(url) is future:  # Nothing newer on this URL
+        del latest[url]
+    return result
+
+
+def write_all(base_url, operations, **options):  # List form
+    """Run operations with iter_writes; return the list of (status_code, data)."""
+    return list(iter_writes(base_url, operations, **options))
+
+
+def benchmark(count=2000, latency=0.01, limit=300):  # Sustained writes per second
+    """Print writes/s for one-by-one writes and for bulk writes against a stub.
+
+    The stub allows limit requests per second and answers the rest with 429.
+    """
+    import stub_server  # Local server with latency and throttling
+
+    server, base_url = stub_server.start(latency=latency, rate_limit=limit)
+    methods = ("post", "put", "patch", "delete")
+    operations = [
+        (methods[i % 4], "/posts" if i % 4 == 0 else f"/posts/{i % 100 + 1}", {"n": i})
+        for i in range(count)
+    ]  # Mixed writes, several per resource
+    print(
+        f"Benchmark: {count} writes, {latency * 1000:.0f} ms latency, "
+        f"server limit {limit}/s"
+    )  # Debug
+
+    start = time.perf_counter()  # One blocking call after another
+    for method, path, payload in operations[: count // 4]:  # Fewer: it is slow
+        http_client.request(method, base_url + path, json=payload)
+    sequential_rate = (count // 4) / (time.perf_counter() - start)  # Writes/s
+    print(f"One by one: {sequential_rate:.0f} writes/s")  # Report
+    time.sleep(1)  # Fresh rate-limit window
+
+    for rate in (limit * 0.9, None):  # Under the limit, then unlimited
+        stats = Counter()
+        start = time.perf_counter()  # Start timer
+        results = write_all(base_url, operations, rate=rate, stats=stats)
+        elapsed = time.perf_counter() - start  # Elapsed seconds
+        ok = sum(1 for status, _ in results if status and status < 300)  # Succeeded
+        label = f"rate {rate:.0f}/s" if rate else "no client limit"
+        print(
+            f"Bulk, {CONCURRENCY} workers, {label}: {count / elapsed:.0f} writes/s, "
+            f"{ok}/{count} ok, {stats['throttled']} throttled (429)"
+        )  # Report
+        time.sleep(1)  # Fresh rate-limit window
+    stub_server.stop(server)
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)  # Write count
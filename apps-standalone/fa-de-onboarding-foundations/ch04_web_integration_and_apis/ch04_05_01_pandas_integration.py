@@ -1,4 +1,4 @@
-import requests  # Import requests
+import http_cache  # Import cached client
 import pandas as pd  # Import Pandas
 import utils  # Import utils
 import yaml  # Import YAML
@@ -9,14 +9,13 @@ with open("data/config.yaml", "r") as file:
 
 # Fetch and validate posts
 url = "https://jsonplaceholder.typicode.com/posts"
-response = requests.get(url)
-if response.status_code == 200:
-    posts = response.json()
+status_code, posts = http_cache.request("get", url)  # Revalidated, not re-downloaded
+if status_code == 200:
     valid_posts = [p for p in posts if utils.validate_post(p, config)]
     print(f"DEBUG: Valid posts: {len(valid_posts)}")  # Debug
 else:
     valid_posts = []
-    print("DEBUG: Fetch failed:", response.status_code)
+    print("DEBUG: Fetch failed:", status_code)
 
 print("--------")
 
@@ -1,8 +1,15 @@
-import requests  # For API requests
+import requests  # For request exceptions
 import pandas as pd  # For DataFrame operations
 import yaml  # For YAML parsing
 import os  # For file existence check
+import sys  # For command-line flags
+import logging  # For the debug-level check
 import utils
+import http_client  # Pooled session with timeouts and retries
+import http_cache  # On-disk GET cache with ETag revalidation
+import pagination  # Page-by-page ingestion with a resumable cursor
+import post_validator  # Columnar validation with the same rules
+from logging_utils import logger, rejects  # Leveled, lazily formatted logs
 
 
 # Define function to read YAML configuration
@@ -19,25 +26,19 @@ def read_config(config_path):  # Takes config file path
 def fetch_data(url, method="get", data=None):  # Takes URL, method, and optional data
     """Perform HTTP request (GET, POST, PUT, PATCH, DELETE)."""
     print(f"DEBUG: Performing {method.upper()} request to: {url}")  # Debug
-    if method == "get":
-        response = requests.get(url)
-    elif method == "post":
-        response = requests.post(url, json=data)
-    elif method == "put":
-        response = requests.put(url, json=data)
-    elif method == "patch":
-        response = requests.patch(url, json=data)
-    elif method == "delete":
-        response = requests.delete(url)
-    else:
+    if method not in http_client.METHODS:
         print(f"DEBUG: Invalid method: {method}")
         return None
-    print(f"DEBUG: Status Code: {response.status_code}")  # Debug
-    if response.status_code in (200, 201, 204):
-        data = response.json() if response.content else {}
-        print(f"DEBUG: Response Data: {data}")  # Debug
+    try:  # GETs come from the cache while fresh; writes invalidate it
+        status_code, data = http_cache.request(method, url, json=data)
+    except requests.RequestException as e:  # No response after retries
+        print(f"DEBUG: Request failed: {e}")  # Log failure
+        return None
+    print(f"DEBUG: Status Code: {status_code}")  # Debug
+    if status_code in (200, 201, 204):
+        logger.debug("DEBUG: Response Data: %s", data)  # Rendered only if enabled
         return data
-    print(f"DEBUG: Request failed: {response.status_code}")  # Log failure
+    print(f"DEBUG: Request failed: {status_code}")  # Log failure
     return None
 
 
@@ -60,19 +61,21 @@ def validate_data(posts, config):  # Takes posts and config
         min_id = config["min_id"]
 
         # Check required fields
-        for field in required_fields:
-            if field not in post or not post[field]:
-                print(
-                    f"DEBUG: Invalid: missing or empty {field}: {post}"
-                )  # Log invalid
-                error_summary["missing_field"] += 1
-                invalid_count += 1
-                continue
+        missing = [f for f in required_fields if f not in post or not post[f]]
+        if missing:  # One reason per post, then skip the remaining checks
+            logger.debug(
+                "DEBUG: Invalid: missing or empty %s: %s", missing[0], post
+            )  # Log invalid
+            rejects.record("missing_field", post)  # Count reason
+            error_summary["missing_field"] += 1
+            invalid_count += 1
+            continue
 
         # Validate userId
         user_id = post["userId"]
         if not utils.is_integer(user_id) or int(user_id) < min_user_id:
-            print(f"DEBUG: Invalid: invalid userId: {post}")  # Log invalid
+            logger.debug("DEBUG: Invalid: invalid userId: %s", post)  # Log invalid
+            rejects.record("invalid_user_id", post)  # Count reason
             error_summary["invalid_user_id"] += 1
             invalid_count += 1
             continue
@@ -80,7 +83,8 @@ def validate_data(posts, config):  # Takes posts and config
         # Validate id
         post_id = post["id"]
         if not utils.is_integer(post_id) or int(post_id) < min_id:
-            print(f"DEBUG: Invalid: invalid id: {post}")  # Log invalid
+            logger.debug("DEBUG: Invalid: invalid id: %s", post)  # Log invalid
+            rejects.record("invalid_id", post)  # Count reason
             error_summary["invalid_id"] += 1
             invalid_count += 1
             continue
@@ -89,25 +93,33 @@ def validate_data(posts, config):  # Takes posts and config
         title = utils.clean_string(post["title"])
         body = utils.clean_string(post["body"])
         if not title or not body:
-            print(f"DEBUG: Invalid: empty title or body: {post}")  # Log invalid
+            logger.debug("DEBUG: Invalid: empty title or body: %s", post)
+            rejects.record("empty_title_or_body", post)  # Count reason
             error_summary["empty_title_or_body"] += 1
             invalid_count += 1
             continue
 
         valid_posts.append(post)
 
-    print(f"DEBUG: Valid posts: {len(valid_posts)}")  # Debug
+    print_summary(len(valid_posts), invalid_count, error_summary)  # Report
+    return valid_posts
+
+
+# Define function to print validation counts
+def print_summary(valid_count, invalid_count, error_summary):  # Takes counts
+    """Print valid/invalid counts and errors per reason."""
+    print(f"DEBUG: Valid posts: {valid_count}")  # Debug
     print(f"DEBUG: Invalid posts: {invalid_count}")  # Debug
     print("DEBUG: Validation Errors:")
     for error_type, count in error_summary.items():
         print(f"  {error_type}: {count}")
-    return valid_posts
+    rejects.log_summary()  # Sampled details are logged as rows are rejected
 
 
 # Define function to save to CSV
 def save_to_csv(posts, csv_path):  # Takes posts and CSV path
-    """Save valid posts to CSV."""
-    if not posts:  # Check for empty data
+    """Save valid posts (list of dicts or DataFrame) to CSV."""
+    if posts is None or len(posts) == 0:  # Check for empty data
         print("DEBUG: No valid posts to save")  # Log empty
         return
     df = pd.DataFrame(posts)  # Convert to DataFrame
@@ -128,9 +140,20 @@ def main():  # No parameters
     config = read_config(config_path)  # Read config
 
     # GET: Fetch posts
-    posts = fetch_data(f"{base_url}/posts", method="get")
+    if "--stream" in sys.argv:  # One page in memory, rows appended as they arrive
+        summary = pagination.ingest_posts(f"{base_url}/posts", config, csv_path)
+        posts = None  # Report below is for the in-memory path
+        print(f"DEBUG: Streamed {summary['pages']} pages: {summary}")  # Debug
+    else:
+        posts = fetch_data(f"{base_url}/posts", method="get")
     if posts:
-        valid_posts = validate_data(posts, config)
+        if logger.isEnabledFor(logging.DEBUG):  # One log line per invalid post
+            valid_posts = validate_data(posts, config)
+        else:  # Production: boolean masks over one DataFrame, same counts
+            valid_posts, error_summary = post_validator.validate_frame(posts, config)
+            print_summary(
+                len(valid_posts), len(posts) - len(valid_posts), error_summary
+            )
         save_to_csv(valid_posts, csv_path)
 
     # POST: Create a new post
@@ -178,6 +201,7 @@ def main():  # No parameters
         print(f"DEBUG: Valid Posts: {len(valid_posts)}")
         print(f"DEBUG: Invalid Posts: {len(posts) - len(valid_posts)}")
         print("DEBUG: Processing completed")
+    print(f"DEBUG: HTTP cache: {http_cache.get_cache().summary()}")  # Hits/misses
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
-import requests  # Import requests
+import http_client  # Import pooled client
+import bulk_writer  # Import bulk writer
 
 
 def manage_api_data(
@@ -6,39 +7,32 @@ def manage_api_data(
 ):  # Takes URL and payloads
     """Perform GET, POST, PUT, PATCH, DELETE requests."""
     # GET
-    response_get = requests.get(url)
+    response_get = http_client.request("get", url)
     if response_get.status_code == 200:
         print(f"DEBUG: GET Fetched {len(response_get.json())} records")
     else:
         print(f"DEBUG: GET Failed: {response_get.status_code}")
 
-    # POST
-    response_post = requests.post(url, json=new_post)
-    if response_post.status_code == 201:
-        print("DEBUG: POST Created post")
-    else:
-        print(f"DEBUG: POST Failed: {response_post.status_code}")
-
-    # PUT
-    response_put = requests.put(f"{url}/1", json=updated_post)
-    if response_put.status_code == 200:
-        print("DEBUG: PUT Updated post")
-    else:
-        print(f"DEBUG: PUT Failed: {response_put.status_code}")
-
-    # PATCH
-    response_patch = requests.patch(f"{url}/1", json=partial_update)
-    if response_patch.status_code == 200:
-        print("DEBUG: PATCH Partially updated post")
-    else:
-        print(f"DEBUG: PATCH Failed: {response_patch.status_code}")
-
-    # DELETE
-    response_delete = requests.delete(f"{url}/1")
-    if response_delete.status_code == 200:
-        print("DEBUG: DELETE Successful")
-    else:
-        print(f"DEBUG: DELETE Failed: {response_delete.status_code}")
+    # POST, PUT, PATCH, DELETE: one bulk call, statuses in input order
+    operations = [
+        ("post", "", new_post),
+        ("put", "/1", updated_post),
+        ("patch", "/1", partial_update),
+        ("delete", "/1", None),
+    ]
+    messages = {
+        "post": (201, "POST Created post"),
+        "put": (200, "PUT Updated post"),
+        "patch": (200, "PATCH Partially updated post"),
+        "delete": (200, "DELETE Successful"),
+    }  # Expected status and message per method
+    results = bulk_writer.write_all(url, operations)
+    for (method, _, _), (status, _) in zip(operations, results):
+        expected, message = messages[method]
+        if status == expected:
+            print(f"DEBUG: {message}")
+        else:
+            print(f"DEBUG: {method.upper()} Failed: {status}")
 
 
 # Test
@@ -1,4 +1,6 @@
 import requests  # Import requests
+import http_client  # Import pooled client
+import bulk_writer  # Import bulk writer
 import pandas as pd  # Import Pandas
 import yaml  # Import YAML
 import utils  # Import utils
@@ -10,17 +12,11 @@ def read_config(config_path):  # Model
 
 
 def fetch_data(url, method="get", data=None):  # Model
-    if method == "get":
-        response = requests.get(url)
-    elif method == "post":
-        response = requests.post(url, json=data)
-    elif method == "put":
-        response = requests.put(url, json=data)
-    elif method == "patch":
-        response = requests.patch(url, json=data)
-    elif method == "delete":
-        response = requests.delete(url)
-    else:
+    if method not in http_client.METHODS:
+        return None
+    try:
+        response = http_client.request(method, url, json=data)
+    except requests.RequestException:
         return None
     if response.status_code in (200, 201, 204):
         return response.json() if response.content else {}
@@ -46,14 +42,16 @@ def manage_posts(
     if posts:
         valid_posts = validate_data(posts, config)
         save_to_csv(valid_posts, csv_path)
-    # POST
-    created_post = fetch_data(url, method="post", data=new_post)
-    # PUT
-    updated_result = fetch_data(f"{url}/1", method="put", data=updated_post)
-    # PATCH
-    patched_result = fetch_data(f"{url}/1", method="patch", data=partial_update)
-    # DELETE
-    delete_result = fetch_data(f"{url}/1", method="delete")
+    # POST, PUT, PATCH, DELETE: concurrent, rate limited, results in this order
+    operations = [
+        ("post", "", new_post),
+        ("put", "/1", updated_post),
+        ("patch", "/1", partial_update),
+        ("delete", "/1", None),
+    ]
+    created_post, updated_result, patched_result, delete_result = [
+        data for _, data in bulk_writer.write_all(url, operations)
+    ]
     print(f"DEBUG: Processed {len(valid_posts if posts else [])} valid posts")
 
 
@@ -0,0 +1,212 @@
+# File: de-onboarding/http_cache.py
+# On-disk GET cache: fresh for a TTL, then revalidated with ETag/Last-Modified
+import os  # For cache paths
+import sys  # For command-line arguments
+import json  # For cache entries
+import time  # For TTL and timing
+import shutil  # For dropping invalidated resources
+import hashlib  # For cache file names
+import tempfile  # For the benchmark cache directory
+from collections import Counter  # For hit/miss counters
+from urllib.parse import urlsplit  # For resource paths
+import http_client  # Pooled session with timeouts and retries
+
+CACHE_DIR = "data/.http_cache"  # One directory per host and resource path
+TTL = 300  # Seconds an entry is served without asking the server
+
+
+def digest(text):  # Short stable file name
+    """Return a filesystem-safe hash of text."""
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def parse(text):  # Body text -> data
+    """Return the JSON value of a response body, or {} for an empty body."""
+    return json.loads(text) if text else {}
+
+
+class HttpCache:  # One cache directory, shared by all callers in a process
+    """Cache successful GET bodies on disk and revalidate them when stale.
+
+    Entries are grouped by resource (scheme, host and path), so a write to
+    /posts/1 can drop /posts/1 and the /posts collection (with any query
+    string) of that host in one step.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=TTL):  # Constructor
+        self.cache_dir = cache_dir  # Where entries live
+        self.ttl = ttl  # Freshness lifetime in seconds
+        # fresh/revalidated hits, misses, invalidated entries, bytes and seconds
+        self.stats = Counter()
+
+    def resource_dir(self, url):  # http://host/posts/1?x -> cache_dir/<hash>
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/") or "/"  # "/posts/" and "/posts" match
+        resource = f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}"
+        return os.path.join(self.cache_dir, digest(resource))  # Query ignored
+
+    def entry_path(self, url):  # Full URL, query included
+        return os.path.join(self.resource_dir(url), digest(url) + ".json")
+
+    def load(self, url):  # Read an entry
+        """Return the cached entry for url, or None if missing or unreadable."""
+        try:
+            with open(self.entry_path(url), "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):  # Missing or half-written entry
+            return None
+
+    def write(self, entry):  # Atomic replace
+        path = self.entry_path(entry["url"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w") as file:
+            json.dump(entry, file)
+        os.replace(path + ".tmp", path)  # Readers never see a partial file
+
+    def store(self, url, response):  # 200: new body
+        """Save a 200 response body with its validators."""
+        self.write(
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "stored": time.time(),  # Start of the TTL
+                "body": response.text,  # Raw JSON text
+            }
+        )
+
+    def touch(self, entry, response):  # 304: same body, new TTL
+        entry["stored"] = time.time()
+        entry["etag"] = response.headers.get("ETag", entry["etag"])
+        self.write(entry)
+
+    def invalidate(self, url):  # After a successful write
+        """Drop cached entries of url's resource and of its parent collection."""
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/")  # "/posts/1"
+        for resource in {path, path.rsplit("/", 1)[0]}:  # "/posts/1", "/posts"
+            directory = self.resource_dir(f"{parts.scheme}://{parts.netloc}{resource}")
+            if os.path.isdir(directory):
+                self.stats["invalidated"] += len(os.listdir(directory))
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def get(self, url, session=None):  # Cached GET
+        """Return (status_code, text) for url, from disk when possible."""
+        entry = self.load(url)
+        if entry and time.time() - entry["stored"] < self.ttl:  # Fresh: no request
+            self.stats["fresh"] += 1
+            self.stats["bytes_saved"] += len(entry["body"])
+            return 200, entry["body"]
+        headers = {}  # Conditional request if we hold a copy
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        start = time.perf_counter()  # Time the round trip
+        response = (session or http_client.get_session()).get(
+            url, headers=headers, timeout=http_client.TIMEOUT
+        )
+        elapsed = time.perf_counter() - start  # Seconds
+        if response.status_code == 304 and entry:  # Unchanged: reuse body
+            self.touch(entry, response)
+            self.stats["revalidated"] += 1
+            self.stats["revalidate_seconds"] += elapsed
+            self.stats["bytes_saved"] += len(entry["body"])
+            return 200, entry["body"]
+        self.stats["misses"] += 1
+        self.stats["miss_seconds"] += elapsed
+        self.stats["bytes_downloaded"] += len(response.content)
+        if response.status_code == 200:  # Only successful bodies are cached
+            self.store(url, response)
+        return response.status_code, response.text
+
+    def request(self, method, url, json=None, session=None):  # Any method
+        """Return (status_code, data) like fetch_data expects; GETs use the cache.
+
+        data is the parsed JSON body ({} when empty) for 2xx responses, else None.
+        Raises requests.RequestException when no response arrived after retries.
+        """
+        if method == "get":
+            status_code, text = self.get(url, session)
+        else:
+            response = http_client.request(method, url, json=json, session=session)
+            status_code, text = response.status_code, response.text
+            if 200 <= status_code < 300:  # Server state changed
+                self.invalidate(url)
+        if not 200 <= status_code < 300:
+            return status_code, None
+        return status_code, parse(text)
+
+    def summary(self):  # One line for reports
+        """Return hit/miss counts, bytes not downloaded and time saved."""
+        stats = self.stats
+        hits = stats["fresh"] + stats["revalidated"]  # Served from disk
+        miss_time = stats["miss_seconds"] / stats["misses"] if stats["misses"] else 0
+        saved = stats["fresh"] * miss_time + stats["revalidated"] * miss_time
+        saved -= stats["revalidate_seconds"]  # 304s still cost a round trip
+        return (
+            f"hits {hits} (fresh {stats['fresh']}, revalidated {stats['revalidated']}), "
+            f"misses {stats['misses']}, invalidated {stats['invalidated']}, "
+            f"{stats['bytes_saved'] / 1024:.1f} KB not downloaded, "
+            f"~{max(saved, 0):.2f}s saved"
+        )
+
+
+_cache = None  # Shared cache, created on first use
+
+
+def get_cache():  # Process-wide cache
+    """Return the shared cache in CACHE_DIR."""
+    global _cache
+    if _cache is None:  # First request
+        _cache = HttpCache()
+    return _cache  # Return cache
+
+
+def request(method, url, json=None):  # Used by fetch_data
+    """Send method to url through the shared cache; return (status_code, data)."""
+    return get_cache().request(method, url, json=json)
+
+
+def benchmark(runs=5, posts=1000, latency=0.05):  # Repeat runs of main()
+    """Print time and bytes for repeated GET /posts with and without the cache."""
+    import stub_server  # Local server with ETags
+
+    server, base_url = stub_server.start(posts=posts, latency=latency)
+    url = f"{base_url}/posts"  # Full collection each run
+    print(f"Benchmark: {runs} runs of GET /posts ({posts} posts)")  # Debug
+
+    start = time.perf_counter()  # Start timer
+    for _ in range(runs):
+        http_client.request("get", url).json()  # Full download every run
+    plain_time = time.perf_counter() - start  # Elapsed seconds
+    plain_bytes = server.bytes_sent  # Body bytes sent
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = HttpCache(cache_dir, ttl=0)  # Always revalidate: worst case
+        start = time.perf_counter()  # Start timer
+        for _ in range(runs):
+            cache.request("get", url)  # 200 once, then 304s
+        etag_time = time.perf_counter() - start  # Elapsed seconds
+        etag_bytes = server.bytes_sent - plain_bytes  # Body bytes sent
+        print(f"ETag only (ttl=0): {cache.summary()}")  # Report
+
+        cache.ttl = TTL  # Entry is fresh now
+        start = time.perf_counter()  # Start timer
+        for _ in range(runs):
+            cache.request("get", url)  # No request at all
+        fresh_time = time.perf_counter() - start  # Elapsed seconds
+        print(f"Then fresh (ttl={TTL}): {cache.summary()}")  # Report
+
+        cache.request("put", f"{url}/1", json={"title": "changed"})  # Invalidates
+        cache.request("get", url)  # Full download again
+        print(f"After PUT /posts/1: {cache.summary()}")  # Report
+    stub_server.stop(server)
+
+    print(f"No cache: {plain_time:.2f}s, {plain_bytes / 1024:.0f} KB")  # Report
+    print(f"ETag revalidation: {etag_time:.2f}s, {etag_bytes / 1024:.0f} KB")
+    print(f"Fresh TTL hits: {fresh_time:.2f}s, 0 KB")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)  # Run count
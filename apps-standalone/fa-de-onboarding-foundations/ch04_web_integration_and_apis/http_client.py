@@ -0,0 +1,103 @@
+# File: de-onboarding/http_client.py
+# One pooled requests.Session per process: keep-alive, timeouts, retry with backoff
+import sys  # For command-line arguments
+import time  # For benchmark timing
+import requests  # HTTP client
+from requests.adapters import HTTPAdapter  # Connection pool per host
+from urllib3.util.retry import Retry  # Retry policy used by the adapter
+
+METHODS = ("get", "post", "put", "patch", "delete")  # Supported verbs
+POOL_SIZE = 10  # Keep-alive connections kept per host
+TIMEOUT = (3.05, 10)  # (connect, read) seconds; never wait forever
+RETRIES = 3  # Attempts after the first one
+BACKOFF = 0.5  # Sleeps of 0.5, 1, 2 s between attempts
+JITTER = 0.25  # Up to this many random seconds added to each sleep
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Throttled or transient server errors
+
+_session = None  # Shared session, created on first use
+
+
+def make_session(pool_size=POOL_SIZE, retries=RETRIES, backoff=BACKOFF, jitter=JITTER):
+    """Return a Session whose adapter pools connections and retries with backoff.
+
+    Status retries apply to idempotent methods (GET, PUT, DELETE, ...), honouring
+    Retry-After; POST and PATCH are retried only when the connection failed,
+    because a 5xx may come after the change was applied.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        backoff_jitter=jitter,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,  # Return the last response, callers check status
+    )  # Exponential backoff with jitter
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )  # Keep-alive pool
+    session = requests.Session()  # Reuses TCP/TLS connections
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session  # Return session
+
+
+def get_session():  # Process-wide session
+    """Return the shared session, creating it with the default settings."""
+    global _session
+    if _session is None:  # First request
+        _session = make_session()
+    return _session  # Return session
+
+
+def request(method, url, json=None, timeout=TIMEOUT, session=None):  # One call
+    """Send method to url on the shared (or given) session; return the response.
+
+    Raises requests.RequestException when no response arrived after retries.
+    """
+    session = session or get_session()  # Pooled connections
+    return session.request(method.upper(), url, json=json, timeout=timeout)
+
+
+def benchmark(count=500):  # Compare with module-level requests calls
+    """Print per-request latency and connections for plain requests vs a Session."""
+    import stub_server  # Local server, no network needed
+
+    server, base_url = stub_server.start(posts=10)  # Small responses
+    url = f"{base_url}/posts/1"  # One post per request
+    print(f"Benchmark: {count} GET requests to {url}")  # Debug
+
+    start = time.perf_counter()  # Start timer
+    for _ in range(count):
+        requests.get(url, timeout=TIMEOUT)  # New connection every time
+    plain_time = time.perf_counter() - start  # Elapsed seconds
+    plain_connections = server.connections  # One per request
+
+    start = time.perf_counter()  # Start timer
+    session = make_session()  # Fresh pool
+    for _ in range(count):
+        request("get", url, session=session)  # Reused connection
+    session_time = time.perf_counter() - start  # Elapsed seconds
+    session_connections = server.connections - plain_connections
+    stub_server.stop(server)
+
+    print(
+        f"requests.get: {plain_time / count * 1000:.2f} ms/request, "
+        f"{plain_connections} connections"
+    )  # Report
+    print(
+        f"Session: {session_time / count * 1000:.2f} ms/request, "
+        f"{session_connections} connections"
+    )  # Report
+    print(f"Saved: {(plain_time - session_time) / count * 1000:.2f} ms/request")
+
+    server, base_url = stub_server.start(posts=10, fail_every=3)  # Every 3rd: 503
+    url = f"{base_url}/posts/1"
+    plain_ok = sum(requests.get(url, timeout=TIMEOUT).ok for _ in range(30))
+    session = make_session(backoff=0.01, jitter=0.01)  # Short sleeps for the demo
+    session_ok = sum(request("get", url, session=session).ok for _ in range(30))
+    stub_server.stop(server)
+    print(f"With 1 in 3 responses 503: requests.get {plain_ok}/30 ok, ", end="")
+    print(f"Session with retries {session_ok}/30 ok")  # Report
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500)  # Request count
@@ -0,0 +1,213 @@
+# File: de-onboarding/pagination.py
+# Page-by-page ingestion: fetch a page, validate it, append it to the CSV, save a cursor
+import os  # For file sizes and cursor removal
+import sys  # For command-line arguments
+import json  # For the cursor file
+import time  # For timing
+from urllib.parse import urlencode  # For page query strings
+import requests  # For request exceptions
+import pandas as pd  # Same CSV writer as save_to_csv
+import utils  # For validate_post
+import http_client  # Pooled session with timeouts and retries
+from logging_utils import rejects  # Per-reason reject counts
+
+PAGE_SIZE = 100  # Items per request
+STYLES = ("page", "range")  # _page/_limit or _start/_end
+
+
+def page_params(page, page_size, style="page"):  # Query for one page
+    """Return json-server query parameters for page (1-based)."""
+    if style == "page":
+        return {"_page": page, "_limit": page_size}
+    start = (page - 1) * page_size  # First index of the page
+    return {"_start": start, "_end": start + page_size}
+
+
+def iter_pages(url, page_size=PAGE_SIZE, first_page=1, style="page"):  # Generator
+    """Yield (page, items) as each page arrives, until a short or empty page.
+
+    Raises requests.RequestException (HTTPError for a non-200 status) when a
+    page cannot be fetched, so the caller can resume from that page later.
+    """
+    page = first_page  # 1-based
+    separator = "&" if "?" in url else "?"  # Keep existing query parameters
+    while True:
+        query = urlencode(page_params(page, page_size, style))
+        response = http_client.request("get", f"{url}{separator}{query}")
+        response.raise_for_status()  # Never skip a page silently
+        items = response.json()  # One page only
+        if items:
+            yield page, items
+        if len(items) < page_size:  # Last page
+            return
+        page += 1
+
+
+def cursor_path(csv_path):  # Cursor location
+    """Return the path of the page cursor for csv_path."""
+    return csv_path + ".cursor.json"  # e.g. data/posts.csv.cursor.json
+
+
+def load_cursor(csv_path, url, page_size, style):  # Resume or start over
+    """Return the saved cursor if it belongs to this download, else None."""
+    path = cursor_path(csv_path)
+    if not os.path.exists(path) or not os.path.exists(csv_path):
+        return None
+    with open(path, "r") as file:
+        cursor = json.load(file)
+    same_download = [cursor["url"], cursor["page_size"], cursor["style"]] == [
+        url,
+        page_size,
+        style,
+    ]  # Same collection and page layout
+    if same_download and os.path.getsize(csv_path) >= cursor["csv_bytes"]:
+        return cursor  # CSV still holds every saved page
+    print(f"Cursor does not match {csv_path}, starting over")  # Reset
+    return None
+
+
+def save_cursor(csv_path, cursor):  # Commit progress
+    """Write the cursor atomically."""
+    path = cursor_path(csv_path)
+    with open(path + ".tmp", "w") as file:
+        json.dump(cursor, file)
+    os.replace(path + ".tmp", path)  # Never a half-written cursor
+
+
+def ingest_posts(url, config, csv_path, page_size=PAGE_SIZE, style="page"):
+    """Stream url page by page into csv_path; return a summary dict.
+
+    Each page is validated with utils.validate_post and appended, so memory
+    holds one page and rows reach disk while later pages download. After every
+    page a cursor (next page, CSV size, header) is saved; a rerun after a
+    failure truncates any partial page and continues from the cursor. The
+    cursor is removed once the last page is written. The first valid page
+    fixes the header; fields first seen on later pages are not written, and
+    the summary's "dropped" counts their rows per column.
+    """
+    cursor = load_cursor(csv_path, url, page_size, style)
+    if cursor is None:  # Fresh download: empty CSV, header with the first rows
+        cursor = {
+            "url": url,
+            "page_size": page_size,
+            "style": style,
+            "next_page": 1,  # First page not yet on disk
+            "csv_bytes": 0,  # CSV size after the last complete page
+            "columns": None,  # Header, fixed by the first valid page
+            "fetched": 0,  # Items downloaded
+            "valid": 0,  # Rows written
+            "dropped": {},  # Column not in the header -> rows that had it
+        }
+        open(csv_path, "w").close()  # Truncate
+    else:  # Drop rows written after the last saved cursor
+        with open(csv_path, "r+b") as file:
+            file.truncate(cursor["csv_bytes"])
+        print(f"DEBUG: Resuming {url} at page {cursor['next_page']}")  # Debug
+
+    start = time.perf_counter()  # Start timer
+    first_write = None  # Seconds until the first rows were on disk
+    try:
+        for page, items in iter_pages(url, page_size, cursor["next_page"], style):
+            valid = [post for post in items if utils.validate_post(post, config)]
+            if valid:
+                df = pd.DataFrame(valid)  # One page only
+                if cursor["columns"] is None:  # First valid page decides the header
+                    cursor["columns"] = list(df.columns)
+                extra = df.columns.difference(cursor["columns"])  # Not in the header
+                if len(extra):  # Would be lost by reindex: count and report them
+                    dropped = cursor.setdefault("dropped", {})  # Older cursors
+                    for column, rows in df[extra].notna().sum().items():
+                        dropped[column] = dropped.get(column, 0) + int(rows)
+                    print(f"DEBUG: Page {page} columns not in header: {list(extra)}")
+                with open(csv_path, "a", newline="") as file:
+                    df.reindex(columns=cursor["columns"]).to_csv(
+                        file, header=cursor["csv_bytes"] == 0, index=False
+                    )  # Header only at the top of the file
+                cursor["csv_bytes"] = os.path.getsize(csv_path)
+                if first_write is None:
+                    first_write = time.perf_counter() - start
+            cursor["next_page"] = page + 1  # Page is on disk
+            cursor["fetched"] += len(items)
+            cursor["valid"] += len(valid)
+            save_cursor(csv_path, cursor)
+        complete = True
+    except requests.RequestException as e:  # Cursor keeps the failed page
+        print(f"DEBUG: Page {cursor['next_page']} failed: {e}; rerun to resume")
+        complete = False
+    rejects.log_summary()  # Reasons for the invalid rows
+    if complete:
+        os.remove(cursor_path(csv_path))  # Next run starts a fresh download
+    print(f"DEBUG: Saved {cursor['valid']} of {cursor['fetched']} rows to {csv_path}")
+    return {
+        "complete": complete,
+        "pages": cursor["next_page"] - 1,
+        "fetched": cursor["fetched"],
+        "valid": cursor["valid"],
+        "dropped": cursor.get("dropped", {}),
+        "seconds": time.perf_counter() - start,
+        "first_write_seconds": first_write,
+    }
+
+
+def benchmark(posts=200000, page_size=1000):  # Compare with one big GET
+    """Print time, time to first row and Python peak memory of GET-all vs pages.
+
+    GET-all downloads the collection in one response, then runs validate_data
+    and save_to_csv from ch04_06_post_manager on the whole list.
+    """
+    import subprocess  # Server in its own process, outside tracemalloc
+    import tempfile  # For output files
+    import tracemalloc  # Python allocation peaks
+    from contextlib import redirect_stdout  # For silencing per-call prints
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        import ch04_06_post_manager as post_manager  # utils prints on import
+
+    server = subprocess.Popen(
+        [sys.executable, "stub_server.py", str(posts)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )  # "Serving N posts at http://127.0.0.1:port/posts"
+    url = server.stdout.readline().split()[-1]  # Posts URL
+    config = post_manager.read_config("data/config.yaml")  # Validation rules
+    print(f"Benchmark: {posts} posts, pages of {page_size}")  # Debug
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        tracemalloc.start()  # Python allocations only
+        start = time.perf_counter()  # Start timer
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # All at once
+            fetched = http_client.request("get", url).json()  # One big response
+            valid = post_manager.validate_data(fetched, config)
+            post_manager.save_to_csv(valid, os.path.join(out_dir, "all.csv"))
+        list_time = time.perf_counter() - start  # First row lands at the end
+        list_peak = tracemalloc.get_traced_memory()[1] / 2**20  # MB
+        del fetched, valid
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # By page
+            summary = ingest_posts(
+                url, config, os.path.join(out_dir, "paged.csv"), page_size
+            )
+        paged_peak = tracemalloc.get_traced_memory()[1] / 2**20  # MB
+        tracemalloc.stop()
+        with open(os.path.join(out_dir, "all.csv")) as all_file, open(
+            os.path.join(out_dir, "paged.csv")
+        ) as paged_file:
+            same = all_file.read() == paged_file.read()  # Identical output
+    server.terminate()
+    server.communicate()  # Reap the server and close its pipe
+
+    print(
+        f"GET all + save_to_csv: {list_time:.2f}s, first row at {list_time:.2f}s, "
+        f"peak {list_peak:.1f} MB"
+    )  # Report
+    print(
+        f"ingest_posts: {summary['seconds']:.2f}s, first row at "
+        f"{summary['first_write_seconds']:.2f}s, peak {paged_peak:.1f} MB"
+    )  # Report
+    print(f"Same CSV: {same}")  # Check
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)  # Post count
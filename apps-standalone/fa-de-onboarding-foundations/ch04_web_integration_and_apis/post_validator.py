@@ -0,0 +1,178 @@
+# File: de-onboarding/post_validator.py
+# Columnar post validation: one DataFrame, boolean masks, same rules as validate_post
+import os  # For silencing prints in the benchmark
+import sys  # For command-line arguments
+import time  # For benchmark timing
+import numpy as np  # For masks
+import pandas as pd  # For the posts frame
+from logging_utils import rejects  # Per-reason reject counts
+
+# Reasons in the order they are checked; a post counts only for its first failure
+REASONS = ("missing_field", "invalid_user_id", "invalid_id", "empty_title_or_body")
+
+
+def present_mask(column):  # field in post and post[field]
+    """Return True where a value is present and truthy (None, "", 0 are not).
+
+    Missing keys become NaN in the frame, so an explicit NaN counts as missing.
+    """
+    values = column.to_numpy(dtype=object)  # Python objects, truthiness in C
+    if pd.api.types.infer_dtype(values, skipna=False) in ("integer", "string"):
+        return values.astype(bool)  # No missing values to look for
+    return ~pd.isna(values) & values.astype(bool)
+
+
+def value_types(values):  # One pass over Python objects
+    """Return an object array with the type of each value."""
+    return np.fromiter(map(type, values), dtype=object, count=len(values))
+
+
+def integer_mask(column, minimum):  # utils.is_integer(x) and int(x) >= minimum
+    """Return True where a value is an int (or digit string) of at least minimum."""
+    values = column.to_numpy(dtype=object)  # Python objects
+    if pd.api.types.infer_dtype(values, skipna=False) == "integer":  # Only ints
+        return values.astype(np.float64) >= minimum  # One comparison
+    types = value_types(values)  # Mixed column: exact per-value types
+    numbers = (types == int) | (types == bool)  # isinstance(x, int)
+    strings = np.flatnonzero(types == str)  # Digit strings like "-3" also count
+    result = np.zeros(len(values), dtype=bool)
+    result[numbers] = values[numbers].astype(np.float64) >= minimum
+    text = values[strings].astype(str)  # numpy unicode array
+    digits = np.strings.isdigit(np.strings.lstrip(text, "-"))  # is_integer check
+    parsed = pd.to_numeric(text[digits], errors="coerce")  # "--1", "²" -> NaN
+    result[strings[digits]] = parsed >= minimum  # NaN compares False
+    return result
+
+
+def nonempty_mask(column):  # utils.clean_string(x) != ""
+    """Return True where a value is a string that is not blank after strip()."""
+    values = column.to_numpy(dtype=object)  # Python objects
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":  # Only str
+        strings = np.arange(len(values))  # Every value
+    else:  # Non-strings clean to ""
+        strings = np.flatnonzero(value_types(values) == str)
+    result = np.zeros(len(values), dtype=bool)
+    stripped = map(str.strip, values[strings])  # C-level calls, no copy of bodies
+    result[strings] = np.fromiter(map(bool, stripped), dtype=bool, count=len(strings))
+    return result
+
+
+def column_or_missing(df, field):  # df[field], or all-missing if no post has it
+    """Return the field's column, or an all-None column when the key is absent."""
+    if field in df:
+        return df[field]
+    return pd.Series(None, index=df.index, dtype=object)  # Absent key is missing
+
+
+def validate_frame(posts, config):  # Vectorized validate_data
+    """Return (valid_df, error_summary) for a list of post dicts or a DataFrame.
+
+    Applies the rules of utils.validate_post as boolean masks: required fields
+    present and truthy, userId >= min_user_id, id >= min_id, non-blank title
+    and body. error_summary counts each invalid post under its first failure;
+    the counts are added to rejects, so call rejects.log_summary() to log them.
+    """
+    if isinstance(posts, pd.DataFrame):
+        df = posts
+    else:  # Normalise once; object dtype keeps ints, strings and None as sent
+        df = pd.DataFrame(posts, dtype=object)
+    size = len(df)  # Post count
+    valid = np.ones(size, dtype=bool)  # Still valid after the checks so far
+    for field in config["required_fields"]:
+        valid &= present_mask(column_or_missing(df, field))
+    failures = {"missing_field": ~valid}  # Reason -> mask of posts failing it
+    user_id, post_id, title, body = (
+        column_or_missing(df, field) for field in ("userId", "id", "title", "body")
+    )  # Keys no post sent fail their checks instead of raising KeyError
+    checks = (
+        ("invalid_user_id", lambda: integer_mask(user_id, config["min_user_id"])),
+        ("invalid_id", lambda: integer_mask(post_id, config["min_id"])),
+        (
+            "empty_title_or_body",
+            lambda: nonempty_mask(title) & nonempty_mask(body),
+        ),
+    )  # Evaluated in order, like the early returns of validate_post
+    for reason, check in checks:
+        passed = check() if size else valid  # Empty frame: nothing to check
+        failures[reason] = valid & ~passed  # Only posts valid so far
+        valid &= passed
+    error_summary = {reason: int(failures[reason].sum()) for reason in REASONS}
+    rejects.counts.update({k: v for k, v in error_summary.items() if v})  # Totals
+    return df[valid], error_summary  # Values kept exactly as sent
+
+
+def make_posts(count, seed=0):  # Synthetic posts with every failure kind
+    """Return count posts, about 10% invalid, as API-shaped dicts."""
+    rng = np.random.default_rng(seed)  # Reproducible
+    kinds = rng.choice(8, size=count, p=[0.9, 0.02, 0.02, 0.02, 0.01, 0.01, 0.01, 0.01])
+    posts = []
+    for i, kind in enumerate(kinds.tolist()):
+        post = {"userId": i % 10 + 1, "id": i + 1, "title": f"post {i}", "body": "x"}
+        if kind == 1:  # Missing key
+            del post["body"]
+        elif kind == 2:  # Falsy userId counts as missing
+            post["userId"] = 0
+        elif kind == 3:  # Negative userId as a string
+            post["userId"] = "-4"
+        elif kind == 4:  # Negative id
+            post["id"] = -i
+        elif kind == 5:  # Blank title
+            post["title"] = "   "
+        elif kind == 6:  # Digit-string userId is valid
+            post["userId"] = str(i % 10 + 1)
+        elif kind == 7:  # Float id is not an integer
+            post["id"] = float(i + 1)
+        posts.append(post)
+    return posts
+
+
+def benchmark(count=1000000):  # Compare with the scalar validate_data
+    """Print scalar and columnar validation times and check they agree.
+
+    Both sides end with a DataFrame of valid posts, which save_to_csv needs;
+    the masks are also timed alone on an existing frame.
+    """
+    import io  # For capturing the printed summary
+    from contextlib import redirect_stdout  # For silencing per-post prints
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        import ch04_06_post_manager as post_manager  # utils prints examples
+
+    config = post_manager.read_config("data/config.yaml")  # Validation rules
+    posts = make_posts(count)  # Synthetic data
+    print(f"Benchmark: {count} posts")  # Debug
+
+    rejects.counts.clear()  # Drop counts from the import-time examples
+    output = io.StringIO()  # validate_data prints its error_summary
+    start = time.perf_counter()  # Start timer
+    with redirect_stdout(output):
+        scalar = pd.DataFrame(post_manager.validate_data(posts, config))  # Loop
+    scalar_time = time.perf_counter() - start  # Elapsed seconds
+    scalar_summary = {
+        reason: int(line.split(":")[1])
+        for line in output.getvalue().splitlines()
+        for reason in REASONS
+        if line.strip().startswith(reason + ":")
+    }  # "  missing_field: 123" lines
+
+    start = time.perf_counter()  # Start timer
+    frame, error_summary = validate_frame(posts, config)  # One frame, masks
+    frame_time = time.perf_counter() - start  # Elapsed seconds
+
+    df = pd.DataFrame(posts, dtype=object)  # Already columnar input
+    start = time.perf_counter()  # Start timer
+    validate_frame(df, config)  # Masks only
+    mask_time = time.perf_counter() - start  # Elapsed seconds
+    rejects.counts.clear()
+
+    print(f"validate_data + DataFrame: {scalar_time:.2f}s")  # Report
+    print(f"validate_frame from dicts: {frame_time:.2f}s")
+    print(f"validate_frame on a frame: {mask_time:.2f}s")
+    same_posts = scalar["id"].tolist() == frame["id"].tolist()  # Same rows
+    same_counts = scalar_summary == error_summary  # Same reasons and counts
+    print(f"Same valid posts: {same_posts}, same error counts: {same_counts}")
+    print(f"Error summary: {error_summary}")  # Report
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)  # Post count
@@ -0,0 +1,199 @@
+# File: de-onboarding/stub_server.py
+# Local stand-in for jsonplaceholder /posts and /comments: ETags, failures, throttling
+import sys  # For command-line arguments
+import json  # For request and response bodies
+import hashlib  # For ETags
+import time  # For injected latency
+import threading  # Server runs beside the client
+from urllib.parse import parse_qs  # For ?postId= and pagination
+from email.utils import formatdate  # For Last-Modified
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Standard library
+
+
+def make_posts(count):  # Same shape as jsonplaceholder posts
+    """Return count posts with userId, id, title and body, ten per user."""
+    return [
+        {
+            "userId": i // 10 + 1,
+            "id": i + 1,
+            "title": f"post {i + 1}",
+            "body": f"content of post {i + 1}",
+        }
+        for i in range(count)
+    ]  # List of post dicts
+
+
+def make_comments(post_id, count=5):  # Same shape as jsonplaceholder comments
+    """Return count comments of post post_id."""
+    return [
+        {
+            "postId": post_id,
+            "id": (post_id - 1) * count + i + 1,
+            "name": f"comment {i + 1} on post {post_id}",
+            "email": f"user{i + 1}@example.com",
+            "body": f"comment body {i + 1}",
+        }
+        for i in range(count)
+    ]  # List of comment dicts
+
+
+def paginate(items, query):  # json-server style slicing
+    """Return the slice of items selected by _page/_limit or _start/_end/_limit."""
+    params = {
+        key: int(values[0])
+        for key, values in parse_qs(query).items()
+        if key in ("_page", "_limit", "_start", "_end") and values[0].isdigit()
+    }
+    if "_page" in params:  # 1-based page of _limit items (json-server default 10)
+        limit = params.get("_limit", 10)
+        start = (max(params["_page"], 1) - 1) * limit
+        return items[start : start + limit]
+    start = params.get("_start", 0)  # Offset window
+    if "_end" in params:
+        return items[start : params["_end"]]
+    if "_limit" in params:
+        return items[start : start + params["_limit"]]
+    return items[start:]  # No pagination: everything
+
+
+class StubHandler(BaseHTTPRequestHandler):  # One instance per connection
+    """Serve /posts (GET/POST/PUT/PATCH/DELETE) and GET /comments like jsonplaceholder."""
+
+    protocol_version = "HTTP/1.1"  # Keep connections open between requests
+    disable_nagle_algorithm = True  # Headers and body are separate writes
+
+    def setup(self):  # Called once per TCP connection
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1  # Shows whether clients reuse sockets
+
+    def log_message(self, format, *args):  # Silence per-request access logs
+        pass
+
+    def send_json(self, status, data, headers=None):  # Content-Length for keep-alive
+        body = json.dumps(data).encode()  # Serialize
+        cacheable = self.command == "GET" and status == 200  # Validators for GETs
+        if cacheable:
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'  # Changes with body
+            if etag in self.headers.get("If-None-Match", ""):  # Client copy current
+                status, body = 304, b""  # Not Modified: headers only
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if cacheable:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", self.server.last_modified)
+        for name, value in (headers or {}).items():  # e.g. X-Total-Count
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.bytes_sent += len(body)  # Body bytes, for bandwidth checks
+
+    def read_json(self):  # Request body, if any
+        length = int(self.headers.get("Content-Length", 0))  # Bytes to read
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def handle_request(self, method):  # Shared by all do_* methods
+        server = self.server
+        body = self.read_json()  # Always drain the body so the socket stays usable
+        with server.lock:
+            server.requests += 1  # Request number, used for failure injection
+            failing = server.fail_every and server.requests % server.fail_every == 0
+            window = int(time.monotonic())  # Current second, for the rate limit
+            if window != server.window:  # New second, new budget
+                server.window, server.window_requests = window, 0
+            server.window_requests += 1
+            throttled = server.rate_limit and server.window_requests > server.rate_limit
+            server.throttled += bool(throttled)
+        if throttled:  # Over the per-second budget: refuse before doing any work
+            self.send_json(429, {"error": "slow down"}, {"Retry-After": "1"})
+            return
+        if server.latency:  # Simulated server work
+            time.sleep(server.latency)
+        if failing:  # Injected transient failure
+            self.send_json(503, {"error": "try again"})
+            return
+        path, _, query = self.path.partition("?")  # "/comments", "postId=1"
+        parts = path.strip("/").split("/")  # "posts/1" -> ["posts", "1"]
+        if parts == ["comments"] and method == "GET":  # Comments of one post
+            post_id = parse_qs(query).get("postId", ["0"])[0]  # "1"
+            found = post_id.isdigit() and 0 < int(post_id) <= len(server.posts)
+            self.send_json(200, make_comments(int(post_id)) if found else [])
+        elif parts[0] != "posts" or len(parts) > 2:  # Unknown resource
+            self.send_json(404, {})
+        elif len(parts) == 1 and method == "GET":  # List, optionally one page
+            total = {"X-Total-Count": str(len(server.posts))}  # Like json-server
+            self.send_json(200, paginate(server.posts, query), total)
+        elif len(parts) == 1 and method == "POST":  # Create
+            self.send_json(201, {**body, "id": len(server.posts) + 1})
+        elif len(parts) == 1:  # Other methods need an id
+            self.send_json(405, {})
+        elif method == "GET":  # One post
+            post_id = int(parts[1]) if parts[1].isdigit() else 0
+            found = 0 < post_id <= len(server.posts)
+            self.send_json(
+                200 if found else 404, server.posts[post_id - 1] if found else {}
+            )
+        elif method == "PUT":  # Replace
+            self.send_json(200, {**body, "id": int(parts[1])})
+        elif method == "PATCH":  # Partial update
+            self.send_json(200, {"userId": 1, "id": int(parts[1]), **body})
+        else:  # DELETE
+            self.send_json(200, {})
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_PUT(self):
+        self.handle_request("PUT")
+
+    def do_PATCH(self):
+        self.handle_request("PATCH")
+
+    def do_DELETE(self):
+        self.handle_request("DELETE")
+
+
+def start(posts=100, latency=0.0, fail_every=0, rate_limit=0):  # Background thread
+    """Start a stub on a free local port; return (server, base_url).
+
+    latency adds seconds of work per request; fail_every=N answers every N-th
+    request with 503 so retries can be exercised; rate_limit=N answers requests
+    beyond N per second with 429 and Retry-After. Call stop(server) when done.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)  # Port 0: any free
+    server.daemon_threads = True  # Do not block exit on open connections
+    server.posts = make_posts(posts)  # Served by GET /posts
+    server.latency = latency  # Seconds per request
+    server.fail_every = fail_every  # 0 disables failures
+    server.rate_limit = rate_limit  # Requests per second, 0 disables throttling
+    server.lock = threading.Lock()  # Guards the counters below
+    server.requests = 0  # Requests handled
+    server.connections = 0  # TCP connections accepted
+    server.bytes_sent = 0  # Response body bytes
+    server.throttled = 0  # Requests answered with 429
+    server.window, server.window_requests = 0, 0  # Rate-limit second and count
+    server.last_modified = formatdate(usegmt=True)  # Data never changes after start
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"  # Base URL
+
+
+def stop(server):  # Shut down and free the port
+    """Stop a server returned by start."""
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    posts = int(sys.argv[1]) if len(sys.argv) > 1 else 100  # Post count
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0  # Seconds
+    server, base_url = start(posts, latency)  # Serve until interrupted
+    print(f"Serving {len(server.posts)} posts at {base_url}/posts", flush=True)
+    try:
+        threading.Event().wait()  # Block the main thread
+    except KeyboardInterrupt:
+        stop(server)
@@ -0,0 +1,43 @@
+# File: de-onboarding/test_post_validator.py
+# Check validate_frame against utils.validate_post on batches missing whole keys
+import os  # For silencing prints
+from contextlib import redirect_stdout  # utils prints examples on import
+from post_validator import validate_frame  # Columnar validation
+
+with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+    import utils  # Scalar validate_post
+
+config = {
+    "required_fields": ["userId", "id", "title", "body"],
+    "min_user_id": 1,
+    "min_id": 1,
+}
+batches = [
+    [],  # No posts, no columns
+    [{"id": "0", "title": None}],  # userId and body absent from every post
+    [{"userId": 1, "id": 2}],  # title and body absent
+    [{"userId": 1, "id": 2, "title": "a", "body": "b"}, {"id": 3}],  # Partly absent
+]
+
+
+def test_absent_columns():  # Absent keys fail like missing fields, no KeyError
+    """Check valid ids and the error count match validate_post per post."""
+    for posts in batches:
+        expected = [post for post in posts if utils.validate_post(post, config)]
+        valid, error_summary = validate_frame(posts, config)
+        ids = valid["id"].tolist() if len(valid) else []
+        assert ids == [post["id"] for post in expected], posts
+        assert sum(error_summary.values()) == len(posts) - len(expected)
+
+
+def test_absent_unrequired_columns():  # validate_post raises KeyError here
+    """Check absent title and body fail as empty even when not required."""
+    loose = {"required_fields": ["userId", "id"], "min_user_id": 1, "min_id": 1}
+    valid, error_summary = validate_frame([{"userId": 1, "id": 2}], loose)
+    assert len(valid) == 0 and error_summary["empty_title_or_body"] == 1
+
+
+if __name__ == "__main__":
+    test_absent_columns()  # Run without pytest
+    test_absent_unrequired_columns()
+    print("All absent-column batches match validate_post")
@@ -1,3 +1,6 @@
+from logging_utils import logger, rejects  # Leveled, lazily formatted logs
+
+
 def clean_string(s):  # Clean string
     """Strip whitespace from string."""
     return s.strip() if isinstance(s, str) else ""
@@ -14,30 +17,34 @@ def validate_post(post, config):  # Validate post
     min_user_id = config["min_user_id"]  # Get minimum user ID
     min_id = config["min_id"]  # Get minimum ID
 
-    print(f"DEBUG: Validating post: {post}")  # Debug
+    logger.debug("DEBUG: Validating post: %s", post)  # Debug
     # Check required fields
     for field in required_fields:
         if field not in post or not post[field]:
-            print(f"DEBUG: Invalid: missing or empty {field}: {post}")  # Log invalid
+            logger.debug("DEBUG: Invalid: missing or empty %s: %s", field, post)
+            rejects.record("missing_field", post)  # Count reason
             return False
 
     # Validate userId
     user_id = post["userId"]
     if not is_integer(user_id) or int(user_id) < min_user_id:
-        print(f"DEBUG: Invalid: invalid userId: {post}")  # Log invalid
+        logger.debug("DEBUG: Invalid: invalid userId: %s", post)  # Log invalid
+        rejects.record("invalid_user_id", post)  # Count reason
         return False
 
     # Validate id
     post_id = post["id"]
     if not is_integer(post_id) or int(post_id) < min_id:
-        print(f"DEBUG: Invalid: invalid id: {post}")  # Log invalid
+        logger.debug("DEBUG: Invalid: invalid id: %s", post)  # Log invalid
+        rejects.record("invalid_id", post)  # Count reason
         return False
 
     # Validate title and body (ensure non-empty after cleaning)
     title = clean_string(post["title"])
     body = clean_string(post["body"])
     if not title or not body:
-        print(f"DEBUG: Invalid: empty title or body: {post}")  # Log invalid
+        logger.debug("DEBUG: Invalid: empty title or body: %s", post)  # Log invalid
+        rejects.record("empty_title_or_body", post)  # Count reason
         return False
 
     return True  # Valid post
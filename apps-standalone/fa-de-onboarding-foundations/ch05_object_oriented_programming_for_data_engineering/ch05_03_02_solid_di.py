@@ -1,6 +1,6 @@
 # File: de-onboarding/solid_di.py
-import pandas as pd  # For DataFrame operations
-import yaml  # For YAML parsing
+import schema_loader  # Typed, column-projected CSV loading
+import config_rules  # Cached, typed config.yaml rules
 import json  # For JSON output
 
 
@@ -12,7 +12,7 @@ class AbstractFetcher:  # Abstraction for Dependency Inversion
 class TransactionFetcher(AbstractFetcher):  # Concrete implementation
     def fetch_data(self, source):  # Method
         print(f"Fetching transactions from {source}")  # Debug
-        df = pd.read_csv(source)  # Load CSV
+        df = schema_loader.load_csv(source)  # Load product, price, quantity only
         data = df[["product", "price", "quantity"]].to_dict(
             orient="records"
         )  # type: ignore  # Convert to list of dicts
@@ -21,12 +21,11 @@ class TransactionFetcher(AbstractFetcher):  # Concrete implementation
 
 class TransactionValidator:  # Single responsibility: validate data
     def __init__(self, config_path):  # Constructor
-        with open(config_path, "r") as file:  # Open config
-            self.config = yaml.safe_load(file)  # Load YAML
-        print(f"Loaded config for validation: {self.config}")  # Debug
+        self.config = config_rules.load_rules(config_path)  # Parsed once per version
+        print(f"Loaded config for validation: {self.config.source}")  # Debug
 
     def validate(self, data):  # Validate data
-        prefix = self.config["product_prefix"]  # Get prefix
+        prefix = self.config.product_prefix  # Get prefix
         return [
             item
             for item in data
@@ -1,7 +1,12 @@
 # File: fetcher.py
 import pandas as pd  # For DataFrame operations
-import yaml  # For YAML parsing
-import utils  # Import utils module
+import config_rules  # Cached, typed config.yaml rules
+import rule_kernels  # Vectorized validation rules
+import topk  # For top products without a full sort
+import schema_loader  # Typed, column-projected CSV loading
+import csv_cache  # Memory-mapped columns for repeat loads
+import line_index  # For reading row slices through the offset index
+from logging_utils import logger  # Leveled, lazily formatted logs
 
 
 class ConfigReader:  # Single responsibility: read config
@@ -11,54 +16,54 @@ class ConfigReader:  # Single responsibility: read config
 
     def read_config(self):  # Read YAML
         print(f"Opening config: {self.config_path}")  # Debug
-        file = open(self.config_path, "r")  # Open file
-        config = yaml.safe_load(file)  # Parse YAML
-        file.close()  # Close file
-        print(f"Loaded config: {config}")  # Debug
-        return config  # Return config
+        config = config_rules.load_rules(self.config_path)  # Cached per version
+        print(f"Loaded config: {config.source}")  # Debug
+        return config  # Return SalesRules
 
 
 class TransactionFetcher:  # Single responsibility: fetch data
-    def fetch_data(self, csv_path):  # Simulate API fetch with CSV
+    def fetch_data(self, csv_path, rows=None, fields=None):  # Simulate API fetch
         print(f"Fetching data from: {csv_path}")  # Debug
-        df = pd.read_csv(csv_path)  # Load CSV
-        print("Fetched DataFrame:")  # Debug
-        print(df.head())  # Show first rows
+        if rows is None:  # Whole file, memory-mapped after the first load
+            df = csv_cache.load_csv(csv_path, fields)  # Needed columns, typed
+        else:  # rows=(start, stop) seeks via the line-offset index
+            df = schema_loader.load_csv(
+                line_index.open_rows(csv_path, rows[0], rows[1]), fields
+            )
+        logger.debug("Fetched DataFrame:\n%s", df.head())  # Show first rows
         return df  # Return DataFrame
 
 
 class TransactionValidator:  # Single responsibility: validate data
     def __init__(self, config):  # Constructor
-        self.config = config  # Store config
+        self.config = config_rules.as_rules(config)  # Store typed rules
 
     def validate_data(self, df):  # Validate DataFrame
         print("Validating data...")  # Debug
-        required_fields = self.config["required_fields"]  # Get fields
+        required_fields = self.config.required_fields  # Get fields
         missing_fields = [f for f in required_fields if f not in df.columns]
         if missing_fields:  # Check columns
             print(f"Missing columns: {missing_fields}")  # Log
             return pd.DataFrame()  # Return empty
 
-        # Filter valid records
+        # Filter valid records with whole-column masks
         df = df.dropna(subset=["product"])  # Drop missing product
-        df = df[
-            df["product"].str.startswith(self.config["product_prefix"])
-        ]  # Filter Halal
-        df = df[df["quantity"].apply(utils.is_integer)]  # Ensure integer quantity
-        df["quantity"] = df["quantity"].astype(int)  # Convert to int
-        df = df[df["quantity"] <= self.config["max_quantity"]]  # Filter quantity
-        df = df[df["quantity"] > 0]  # Filter positive quantity
-        df = df[df["price"].apply(utils.is_numeric_value)]  # Ensure numeric price
-        df = df[df["price"] > 0]  # Filter positive price
-        df = df[df["price"] >= self.config["min_price"]]  # Filter min price
-        df = df[
-            df["price"].apply(
-                lambda x: utils.apply_valid_decimals(x, self.config["max_decimals"])
-            )
-        ]  # Check decimals
+        price = rule_kernels.as_numeric(df["price"])  # Numeric price, NaN for text
+        quantity = rule_kernels.as_numeric(df["quantity"])  # Numeric quantity
+        valid = (
+            rule_kernels.prefix_mask(df["product"], self.config.product_prefix)
+            & rule_kernels.integer_mask(df["quantity"])  # Ensure integer quantity
+            & rule_kernels.range_mask(quantity, maximum=self.config.max_quantity)
+            & rule_kernels.positive_mask(quantity)  # Filter positive quantity
+            & rule_kernels.positive_mask(price)  # Filter positive price
+            & rule_kernels.range_mask(price, minimum=self.config.min_price)
+            & rule_kernels.decimals_mask(price, self.config.max_decimals)
+        )  # All rules in one pass per column
+        df = df[valid].assign(
+            price=price[valid], quantity=quantity[valid].astype(int)
+        )  # Keep valid rows with numeric columns
 
-        print("Validated DataFrame:")  # Debug
-        print(df)  # Show filtered
+        logger.debug("Validated DataFrame:\n%s", df)  # Rendered only if enabled
         return df  # Return validated
 
 
@@ -67,8 +72,10 @@ class TransactionProcessor(TransactionFetcher):  # Inherits fetcher
         self.config = config  # Store config
         self.validator = TransactionValidator(config)  # Create validator
 
-    def process_data(self, csv_path):  # Process data
-        df = self.fetch_data(csv_path)  # Fetch data
+    def process_data(self, csv_path, k=topk.TOP_K):  # Process data
+        df = self.fetch_data(
+            csv_path, fields=self.validator.config.required_fields
+        )  # Fetch only the columns the rules use
         df = self.validator.validate_data(df)  # Validate
         if df.empty:  # Check empty
             print("No valid data")  # Log
@@ -78,15 +85,13 @@ class TransactionProcessor(TransactionFetcher):  # Inherits fetcher
         df["amount"] = df["price"] * df["quantity"]  # Compute amount
         total_sales = df["amount"].sum()  # Total sales
         unique_products = df["product"].unique().tolist()  # Unique products
-        sales_by_product = df.groupby("product")["amount"].sum()  # Group
-        top_products = (
-            sales_by_product.sort_values(ascending=False).head(3).to_dict()  # type: ignore
-        )  # Top 3
+        sales_by_product = df.groupby("product", observed=True)["amount"].sum()
+        top_products = topk.top_k(sales_by_product, k)  # Top k, ties by name
 
         valid_sales = len(df)  # Count valid
         print(f"Valid sales: {valid_sales} records")  # Debug
         return {
-            "total_sales": float(total_sales),  # Convert for JSON
+            "total_sales": float(total_sales),  # Plain float for reports and JSON
             "unique_products": unique_products,  # Products
             "top_products": top_products,  # Top products
         }, valid_sales  # Return results
@@ -0,0 +1,119 @@
+# File: de-onboarding/json_export.py
+# Streaming JSON export: large lists and maps are written in chunks, compactly
+import gzip  # For optional .gz output
+import json  # For encoding values
+from itertools import islice  # For chunking iterables
+import numpy as np  # For NumPy scalar and array fast paths
+import pandas as pd  # For Series/Index/DataFrame checks
+
+CHUNK_ITEMS = 10000  # Items encoded per write
+FILE_BUFFER = 1 << 20  # 1 MB file buffer
+MAPS = (dict, pd.Series, pd.DataFrame)  # Written as JSON objects
+ARRAYS = (np.ndarray, pd.Index)  # Written as JSON lists via tolist()
+SEQUENCES = (list, tuple, set, frozenset)  # Python sequences
+
+
+def to_native(value):  # json "default" hook
+    """Convert NumPy/pandas values that json cannot encode to Python values."""
+    if isinstance(value, np.generic):  # np.int64, np.float32, np.bool_, ...
+        return value.item()
+    if hasattr(value, "tolist"):  # NumPy arrays, pandas Series/Index
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):  # Product sets
+        return list(value)
+    if hasattr(value, "isoformat"):  # pd.Timestamp, datetime, date
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+ENCODER = json.JSONEncoder(separators=(",", ":"), default=to_native)  # Compact
+
+
+def open_output(json_path, compress=None):  # Text file or gzip stream
+    """Open json_path for writing; gzip if compress is True or path ends in .gz."""
+    if compress is None:  # Decide from the file name
+        compress = json_path.endswith(".gz")
+    if compress:  # Compressed text stream
+        return gzip.open(json_path, "wt", encoding="utf-8", compresslevel=6)
+    return open(json_path, "w", buffering=FILE_BUFFER)  # Plain text file
+
+
+def _is_container(value):  # Values that are worth streaming
+    """Return True for maps and sequences, which are written in chunks."""
+    return isinstance(value, MAPS + ARRAYS + SEQUENCES)  # Not pandas scalars
+
+
+def _write_value(file, value):  # Stream containers, encode the rest
+    """Write one JSON value, streaming maps and sequences in chunks."""
+    if isinstance(value, MAPS):  # dict, Series or DataFrame
+        _write_map(file, value.items())
+    elif isinstance(value, ARRAYS):  # NumPy arrays, pandas Index
+        _write_array(file, np.asarray(value))
+    elif isinstance(value, SEQUENCES):  # Python sequences
+        _write_items(file, iter(value))
+    else:  # Scalars and small values
+        file.write(ENCODER.encode(value))
+
+
+def _encode_pairs(pairs):  # Encode a batch of scalar pairs
+    """Return '"k":v,...' for a dict of pairs, converting NumPy keys if needed."""
+    try:
+        return ENCODER.encode(pairs)[1:-1]  # C encoder, no per-item Python work
+    except TypeError:  # np.int64 and similar keys are not allowed by json
+        return ENCODER.encode({to_key(key): v for key, v in pairs.items()})[1:-1]
+
+
+def to_key(key):  # JSON object keys
+    """Convert a NumPy scalar key to a Python value json accepts as a key."""
+    return key.item() if isinstance(key, np.generic) else str(key)
+
+
+def _write_map(file, items):  # {"key":value,...}
+    """Write a JSON object from (key, value) pairs without building it first."""
+    file.write("{")  # Open object
+    sep = ""  # No comma before the first item
+    pending = {}  # Scalar pairs waiting to be encoded in one call
+    for key, value in items:  # One pair at a time
+        if _is_container(value):  # Large values stream on their own
+            if pending:  # Write scalars collected so far
+                file.write(sep + _encode_pairs(pending))
+                sep, pending = ",", {}
+            file.write(sep + _encode_pairs({key: 0})[:-1])  # '"key":'
+            _write_value(file, value)  # Nested values stream too
+            sep = ","
+        else:
+            pending[key] = value  # Batch scalars
+            if len(pending) >= CHUNK_ITEMS:  # Batch full
+                file.write(sep + _encode_pairs(pending))
+                sep, pending = ",", {}
+    if pending:  # Last batch
+        file.write(sep + _encode_pairs(pending))
+    file.write("}")  # Close object
+
+
+def _write_array(file, array):  # NumPy fast path
+    """Write a NumPy array as a JSON list, converting one chunk at a time."""
+    file.write("[")  # Open list
+    for start in range(0, len(array), CHUNK_ITEMS):  # Chunk by chunk
+        chunk = array[start : start + CHUNK_ITEMS].tolist()  # C-level conversion
+        file.write(("," if start else "") + ENCODER.encode(chunk)[1:-1])
+    file.write("]")  # Close list
+
+
+def _write_items(file, iterator):  # Python sequence path
+    """Write an iterator of small values as a JSON list, chunk by chunk."""
+    file.write("[")  # Open list
+    chunk = list(islice(iterator, CHUNK_ITEMS))  # First chunk
+    first = True  # No comma before the first chunk
+    while chunk:  # Until the iterator is exhausted
+        file.write(("" if first else ",") + ENCODER.encode(chunk)[1:-1])
+        chunk = list(islice(iterator, CHUNK_ITEMS))  # Next chunk
+        first = False
+    file.write("]")  # Close list
+
+
+def export_json(results, json_path, compress=None):  # Public entry point
+    """Write results to json_path as compact JSON, optionally gzip-compressed."""
+    with open_output(json_path, compress) as file:  # Buffered or gzip output
+        _write_value(file, results)  # Stream top-level containers
+        file.write("\n")  # End with a newline
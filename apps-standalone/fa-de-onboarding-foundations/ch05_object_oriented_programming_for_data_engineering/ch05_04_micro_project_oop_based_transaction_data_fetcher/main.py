@@ -1,15 +1,13 @@
 # File: de-onboarding/main.py
 import fetcher  # Import module
-import json  # For JSON export
+import json_export  # For streaming JSON export
 
 
 def export_results(results, json_path):  # Export results
     """Export results to JSON."""
     print(f"Writing to: {json_path}")  # Debug
     print(f"Results: {results}")  # Debug
-    file = open(json_path, "w")  # Open file
-    json.dump(results, file, indent=2)  # Write JSON
-    file.close()  # Close file
+    json_export.export_json(results, json_path)  # Compact, streamed; .gz compresses
     print(f"Exported to {json_path}")  # Confirm
 
 
@@ -0,0 +1,122 @@
+# File: de-onboarding/csv_cache.py
+# Columnar .npy cache for CSVs: parse once, memory-map on every later load
+import os  # For file size, mtime and paths
+import sys  # For command-line arguments
+import json  # For cache metadata
+import time  # For timing
+import numpy as np  # For .npy files
+import pandas as pd  # For DataFrame operations
+import schema_loader  # Typed loading on a cache miss
+
+
+def cache_dir(csv_path):  # Cache location
+    """Return the directory holding the cached columns for csv_path."""
+    return csv_path + ".cache"  # e.g. data/sales.csv.cache
+
+
+def _meta_path(csv_path):  # Metadata file, written last
+    """Return the path of the cache metadata file."""
+    return os.path.join(cache_dir(csv_path), "meta.json")
+
+
+def _column_path(csv_path, index, suffix):  # One file per column part
+    """Return the path of a cached column file."""
+    return os.path.join(cache_dir(csv_path), f"col{index}.{suffix}")
+
+
+def load_meta(csv_path, fields):  # Read metadata if still valid
+    """Return cache metadata, or None if missing, stale or built for other fields."""
+    try:
+        with open(_meta_path(csv_path), "r") as file:  # Read metadata
+            meta = json.load(file)
+    except (OSError, ValueError):  # No cache yet or half-written
+        return None
+    stat = os.stat(csv_path)  # Current CSV version
+    if (meta["size"], meta["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+        return None  # CSV changed since the cache was built
+    if meta["fields"] != sorted(fields):  # Cache holds other columns
+        return None
+    if meta.get("schema") != schema_loader.SCHEMA_VERSION:  # Parsed by older rules
+        return None
+    return meta  # Return metadata
+
+
+def write_cache(csv_path, df, fields, stat):  # Save typed columns
+    """Write each column of df as .npy (+ categories) and then the metadata.
+
+    stat is os.stat(csv_path) taken before df was parsed.
+    """
+    os.makedirs(cache_dir(csv_path), exist_ok=True)  # Create cache directory
+    columns = []  # Column metadata
+    for index, name in enumerate(df.columns):  # One file per column
+        column = df[name]  # Column to store
+        if isinstance(column.dtype, pd.CategoricalDtype) or column.dtype == object:
+            kind = "category" if column.dtype != object else "object"  # Restore as
+            values = column.astype("category")  # Strings stored once
+            np.save(_column_path(csv_path, index, "npy"), values.cat.codes.values)
+            with open(_column_path(csv_path, index, "json"), "w") as file:
+                json.dump(values.cat.categories.tolist(), file)  # Category labels
+        else:  # Numbers are stored as-is
+            kind = "numeric"
+            np.save(_column_path(csv_path, index, "npy"), column.values)
+        columns.append({"name": name, "kind": kind})  # Remember column
+
+    meta = {
+        "size": stat.st_size,  # CSV size when cached
+        "mtime_ns": stat.st_mtime_ns,  # CSV mtime when cached
+        "fields": sorted(fields),  # Requested columns
+        "schema": schema_loader.SCHEMA_VERSION,  # Parsing rules used
+        "columns": columns,  # Stored columns in order
+    }
+    with open(_meta_path(csv_path) + ".tmp", "w") as file:  # Metadata last
+        json.dump(meta, file)
+    os.replace(_meta_path(csv_path) + ".tmp", _meta_path(csv_path))  # Atomic
+
+
+def read_cache(csv_path, meta):  # Memory-map columns
+    """Return a DataFrame whose numeric columns are memory-mapped .npy files."""
+    data = {}  # Column name -> values
+    for index, column in enumerate(meta["columns"]):  # Stored order
+        values = np.load(_column_path(csv_path, index, "npy"), mmap_mode="r")
+        if column["kind"] == "numeric":  # Used directly, no parsing
+            data[column["name"]] = values
+            continue
+        with open(_column_path(csv_path, index, "json"), "r") as file:
+            categories = json.load(file)  # Category labels
+        values = pd.Categorical.from_codes(values, categories)  # -1 means NaN
+        data[column["name"]] = (
+            values if column["kind"] == "category" else values.astype(object)
+        )  # Object columns come back as objects
+    return pd.DataFrame(data, copy=False)  # Keep the memory maps
+
+
+def load_csv(csv_path, fields=None):  # Drop-in for schema_loader.load_csv
+    """Load csv_path through the cache, parsing the CSV only if it changed."""
+    fields = list(fields or schema_loader.SCHEMA)  # Requested columns
+    meta = load_meta(csv_path, fields)  # Valid cache?
+    if meta is not None:  # Warm load
+        return read_cache(csv_path, meta)
+    stat = os.stat(csv_path)  # Version being parsed
+    df = schema_loader.load_csv(csv_path, fields)  # Cold load: parse CSV
+    write_cache(csv_path, df, fields, stat)  # Next load is warm
+    return df  # Return parsed DataFrame
+
+
+def main():  # Compare cold and warm loads
+    """Print cold (parse) and warm (memory-map) load times for each CSV given."""
+    for csv_path in sys.argv[1:] or ["data/sales.csv"]:  # Default sample file
+        start = time.perf_counter()  # Start timer
+        schema_loader.load_csv(csv_path)  # Always parses
+        parse = time.perf_counter() - start  # Elapsed seconds
+        load_csv(csv_path)  # Make sure the cache exists
+        start = time.perf_counter()  # Start timer
+        df = load_csv(csv_path)  # Warm load
+        warm = time.perf_counter() - start  # Elapsed seconds
+        print(
+            f"{csv_path}: {len(df)} rows, parse {parse * 1000:.1f} ms, "
+            f"cached {warm * 1000:.1f} ms"
+        )  # Report
+
+
+if __name__ == "__main__":
+    main()  # Run main function
@@ -1,38 +1,49 @@
 # File: de-onboarding/main.py
 import pandas as pd
-import yaml
+import config_rules
 import json
+import json_export
 from processor import SalesProcessor
+import line_index
+import schema_loader
+import csv_cache
+from logging_utils import logger
 
 
 def load_config(config_path):  # Load YAML
-    """Load YAML configuration."""
+    """Load YAML configuration as cached config_rules.SalesRules."""
     print(f"Loading config: {config_path}")  # Debug
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    print(f"Config: {config}")  # Debug
+    config = config_rules.load_rules(config_path)  # Parsed once per file version
+    print(f"Config: {config.source}")  # Debug
     return config
 
 
-def load_data(csv_path, json_path):  # Load CSV and JSON
-    """Load sales CSV and mock API data."""
+def load_data(csv_path, json_path, rows=None, fields=None):  # Load CSV and JSON
+    """Load sales CSV and mock API data; rows=(start, stop) reads a CSV slice.
+
+    Only fields (default: product, price, quantity) are loaded, with typed columns.
+    """
     print(f"Loading CSV: {csv_path}")  # Debug
-    df_csv = pd.read_csv(csv_path)  # Load CSV
+    if rows is None:  # Whole file, memory-mapped after the first load
+        df_csv = csv_cache.load_csv(csv_path, fields)  # Load CSV
+    else:  # Seek straight to the slice via the line-offset index
+        df_csv = schema_loader.load_csv(
+            line_index.open_rows(csv_path, rows[0], rows[1]), fields
+        )
     print(f"Loading JSON: {json_path}")  # Debug
     with open(json_path, "r") as f:
         api_data = json.load(f)  # Load JSON
     df_api = pd.DataFrame(api_data)  # Convert to DataFrame
     df = pd.concat([df_csv, df_api], ignore_index=True)  # Combine
-    print("Combined DataFrame (first 3 rows):")  # Debug
-    print(df.head(3))  # Show first 3 rows
+    df = schema_loader.apply_schema(df)  # concat turns category back to object
+    logger.debug("Combined DataFrame (first 3 rows):\n%s", df.head(3))  # Debug
     return df
 
 
 def export_results(results, json_path):  # Export JSON
     """Export results to JSON."""
     print(f"Writing to: {json_path}")  # Debug
-    with open(json_path, "w") as f:
-        json.dump(results, f, indent=2)
+    json_export.export_json(results, json_path)  # Compact, streamed; .gz compresses
     print(f"Exported to {json_path}")  # Confirm
 
 
@@ -45,7 +56,7 @@ def main():  # Main function
     plot_path = "data/sales_summary.png"
 
     config = load_config(config_path)  # Load config
-    df = load_data(csv_path, json_path)  # Load data
+    df = load_data(csv_path, json_path, fields=config.required_fields)  # Load data
     processor = SalesProcessor(df, config)  # Initialize processor
     _ = processor.validate_data()  # Validate
     results = processor.compute_metrics()  # Compute metrics
@@ -0,0 +1,102 @@
+# File: de-onboarding/rule_kernels.py
+# Vectorized validation rules: whole-column masks instead of per-row .apply
+import sys  # For command-line arguments
+import time  # For benchmark timing
+import numpy as np  # For array math
+import pandas as pd  # For Series operations
+
+TOLERANCE = 1e-6  # Float noise allowed when checking decimal places
+
+
+def as_numeric(values):  # Column to numbers once
+    """Return values as a numeric Series; non-numeric entries become NaN."""
+    if pd.api.types.is_numeric_dtype(values):  # Already numeric, no copy
+        return values
+    return pd.to_numeric(values, errors="coerce")  # "24.99" -> 24.99, "x" -> NaN
+
+
+def digit_text_mask(values):  # Strings must be plain digits
+    """Return False where a value is a string other than digits ("1e2", "2.0").
+
+    Digits are those int() and float() accept, so "²" fails too. Non-string
+    values (numbers, NaN) pass; other rules check them.
+    """
+    if pd.api.types.is_numeric_dtype(values):  # No strings to check
+        return pd.Series(True, index=values.index)
+    mask = np.ones(len(values), dtype=bool)  # Numbers in a mixed column pass
+    if pd.api.types.infer_dtype(values, skipna=True) == "string":  # Text and NaN
+        text = values.notna().to_numpy()  # C-level scan, no per-value type()
+    else:  # Mixed column: exact per-value types
+        text = (values.map(type) == str).to_numpy()  # Positions of strings
+    strings = values.to_numpy(dtype=object)[text].astype(str)  # Unicode array
+    mask[text] = np.strings.isdecimal(np.strings.strip(strings))  # Vectorized
+    return pd.Series(mask, index=values.index)  # Aligned with values
+
+
+def integer_mask(values):  # Whole, non-negative numbers
+    """Return True where a value is a whole number >= 0 (2, "2" and 2.0).
+
+    Pass the raw column: strings are checked as text before they are
+    coerced, so "1e2" and "2.0" fail like str.isdigit() in utils.is_integer.
+    """
+    numbers = as_numeric(values)  # Numbers, NaN for text
+    whole = (numbers >= 0) & (numbers == np.floor(numbers))  # NaN compares False
+    return whole & digit_text_mask(values)  # Text must be digits too
+
+
+def decimals_mask(values, max_decimals):  # At most max_decimals places
+    """Return True where a number has at most max_decimals decimal places."""
+    scaled = as_numeric(values) * 10**max_decimals  # 24.99 -> 2499.0
+    return (scaled - scaled.round()).abs() < TOLERANCE  # NaN compares False
+
+
+def prefix_mask(values, prefix):  # String prefix
+    """Return True where a value is a string starting with prefix."""
+    return values.str.startswith(prefix, na=False)  # Missing/non-text -> False
+
+
+def range_mask(values, minimum=None, maximum=None):  # Inclusive bounds
+    """Return True where minimum <= value <= maximum (either bound optional)."""
+    values = as_numeric(values)  # Numbers, NaN for text
+    mask = values.notna()  # NaN is never in range
+    if minimum is not None:  # Lower bound
+        mask &= values >= minimum
+    if maximum is not None:  # Upper bound
+        mask &= values <= maximum
+    return mask  # Return mask
+
+
+def positive_mask(values):  # Strictly positive
+    """Return True where a value is a number greater than zero."""
+    return as_numeric(values) > 0  # NaN compares False
+
+
+def benchmark(rows=5000000):  # Compare with the .apply filters
+    """Print the time of the per-row .apply checks and of the kernels."""
+    import utils  # Per-row helpers from Chapter 3
+
+    df = pd.DataFrame(
+        {
+            "product": np.resize(["Halal Laptop", "Monitor", "Halal Mouse"], rows),
+            "price": np.resize([999.99, 24.999, 5.0, 49.99], rows),
+            "quantity": np.resize([2, 150, 10, 3], rows),
+        }
+    )  # Synthetic frame
+    print(f"Benchmark frame: {rows} rows")  # Debug
+
+    start = time.perf_counter()  # Start timer
+    old = df["quantity"].apply(utils.is_integer) & df["price"].apply(
+        lambda x: utils.apply_valid_decimals(x, 2)
+    )  # Per-row Python calls
+    apply_time = time.perf_counter() - start  # Elapsed seconds
+
+    start = time.perf_counter()  # Start timer
+    new = integer_mask(df["quantity"]) & decimals_mask(df["price"], 2)  # Columns
+    kernel_time = time.perf_counter() - start  # Elapsed seconds
+
+    print(f".apply: {apply_time:.2f}s, kernels: {kernel_time:.3f}s")  # Report
+    print(f"Speedup: {apply_time / kernel_time:.0f}x, same: {old.equals(new)}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000000)  # Row count
@@ -0,0 +1,61 @@
+# File: de-onboarding/sales_plot.py
+# Bar charts from per-product totals: aggregate first, draw at most TOP_N + 1 bars
+import sys  # For command-line arguments
+import time  # For benchmark timing
+import numpy as np  # For synthetic data
+import pandas as pd  # For grouping
+
+TOP_N = 10  # Products drawn individually; the rest share one "Other" bar
+OTHER = "Other"  # Label of the bucket for the remaining products
+
+
+def aggregate_amounts(df, top_n=TOP_N):  # Rows -> at most top_n + 1 totals
+    """Return a Series of amount per product: the top_n largest, then "Other"."""
+    totals = df.groupby("product", observed=True, sort=False)["amount"].sum()
+    totals = totals.sort_values(ascending=False, kind="stable")  # Largest first
+    if len(totals) <= top_n:  # Few products: no bucket needed
+        return totals
+    top = totals.iloc[:top_n]  # Products drawn by name
+    other = pd.Series([totals.iloc[top_n:].sum()], index=[OTHER])  # Remainder
+    return pd.concat([top.set_axis(top.index.astype(str)), other])  # One bar each
+
+
+def plot_amounts(totals, plot_path, title):  # Draw pre-aggregated bars
+    """Save a bar chart of totals to plot_path with the non-interactive backend."""
+    import matplotlib  # Imported only when a plot is requested
+
+    matplotlib.use("Agg")  # Render to files, never open a window
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(8, 6))  # Set figure size
+    plt.bar(totals.index.astype(str), totals.to_numpy())  # One bar per product
+    plt.title(title)  # Title
+    plt.xlabel("Product")  # X-axis label
+    plt.ylabel("Sales Amount ($)")  # Y-axis label
+    plt.xticks(rotation=45)  # Rotate x labels
+    plt.grid(True)  # Add grid
+    plt.tight_layout()  # Adjust layout
+    plt.savefig(plot_path, dpi=100)  # Save plot
+    plt.close()  # Close figure
+
+
+def benchmark(rows=1000000, plot_path="data/plot_benchmark.png"):  # Timing
+    """Print aggregation and render times for a synthetic frame of rows rows."""
+    df = pd.DataFrame(
+        {
+            "product": np.resize([f"Halal Product {i}" for i in range(50)], rows),
+            "amount": np.resize([999.99, 24.99, 5.0, 49.99], rows),
+        }
+    )  # Synthetic frame
+    start = time.perf_counter()  # Start timer
+    totals = aggregate_amounts(df)  # Rows -> bars
+    aggregate_time = time.perf_counter() - start  # Elapsed seconds
+    start = time.perf_counter()  # Start timer
+    plot_amounts(totals, plot_path, "Benchmark")  # Draw TOP_N + 1 bars
+    render_time = time.perf_counter() - start  # Elapsed seconds
+    print(f"{rows} rows -> {len(totals)} bars")  # Report
+    print(f"Aggregate: {aggregate_time:.3f}s, render: {render_time:.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)  # Row count
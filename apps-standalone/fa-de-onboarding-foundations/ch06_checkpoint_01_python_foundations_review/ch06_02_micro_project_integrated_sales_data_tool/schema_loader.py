@@ -0,0 +1,61 @@
+# File: de-onboarding/schema_loader.py
+# Typed CSV loading: only needed columns, categorical product, numeric coercion
+import sys  # For command-line arguments
+import pandas as pd  # For DataFrame operations
+import rule_kernels  # For the digits-only text check
+
+# Column -> dtype; numbers are float64 so invalid values can become NaN
+SCHEMA = {"product": "category", "price": "float64", "quantity": "float64"}
+INTEGER_COLUMNS = ("quantity",)  # Read as text, parsed only if plain digits
+SCHEMA_VERSION = 2  # Bumped when parsing changes, so cached columns are rebuilt
+
+
+def apply_schema(df):  # Cast known columns in place
+    """Cast schema columns present in df: category or numeric (invalid -> NaN)."""
+    for column, dtype in SCHEMA.items():  # Known columns only
+        if column not in df.columns:  # Validators report missing columns
+            continue
+        if dtype == "category":  # Repeated strings stored once
+            df[column] = df[column].astype("category")
+        elif column in INTEGER_COLUMNS:  # "2" -> 2.0; "1e2", "2.0" -> NaN
+            digits = rule_kernels.digit_text_mask(df[column])  # Checked as text
+            df[column] = df[column].where(digits).astype(dtype)  # C-level cast
+        else:  # "24.99" -> 24.99, "invalid" -> NaN
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype(dtype)
+    return df  # Return typed DataFrame
+
+
+def load_csv(source, fields=None, **kwargs):  # Schema-driven read_csv
+    """Read only fields (default: schema columns) from a path or text stream."""
+    fields = set(fields or SCHEMA)  # e.g. config.required_fields
+    df = pd.read_csv(
+        source,
+        usecols=lambda column: column in fields,  # Skip transaction_id, date, ...
+        dtype={
+            **{c: "category" for c, t in SCHEMA.items() if t == "category"},
+            **{c: str for c in INTEGER_COLUMNS},  # Checked as text in apply_schema
+        },
+        **kwargs,
+    )  # Strings for product are never materialized as objects
+    if isinstance(df, pd.DataFrame):  # chunksize returns a reader instead
+        return apply_schema(df)
+    return map(apply_schema, df)  # Type each chunk as it is read
+
+
+def memory_mb(df):  # Deep memory footprint
+    """Return the memory used by df in MB, including string contents."""
+    return df.memory_usage(deep=True).sum() / 1e6
+
+
+def memory_report(csv_path, fields=None):  # Compare with plain read_csv
+    """Print the footprint of plain read_csv and of load_csv for csv_path."""
+    plain = memory_mb(pd.read_csv(csv_path))  # All columns, inferred dtypes
+    typed = memory_mb(load_csv(csv_path, fields))  # Needed columns, schema dtypes
+    print(f"{csv_path}: plain {plain:.2f} MB, typed {typed:.2f} MB")  # Report
+    print(f"Reduction: {plain / typed:.1f}x")  # Ratio
+    return plain, typed  # Return both sizes
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:] or ["data/sales.csv"]:  # Default sample file
+        memory_report(path)  # Print report
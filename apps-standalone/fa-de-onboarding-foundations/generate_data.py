@@ -0,0 +1,305 @@
+# File: de-onboarding/generate_data.py
+# Synthetic sales.csv, transactions.csv and mock_api.json of any size for scale tests
+import os  # For output paths
+import json  # For the manifest
+import time  # For timing
+import argparse  # For command-line options
+from decimal import Decimal  # For exact manifest amounts
+import numpy as np  # For vectorized row generation
+import yaml  # For the validation rules
+
+CHUNK_ROWS = 250000  # Rows generated and written per step
+FILES = ("sales", "transactions", "mock_api")  # Outputs, same rows in each
+BASE_NAMES = [
+    "Laptop",
+    "Mouse",
+    "Keyboard",
+    "Monitor",
+    "Headphones",
+    "Webcam",
+    "Speaker",
+    "Tablet",
+    "Phone",
+    "Charger",
+]  # First products; the rest are "Product <n>"
+
+# Row classes: valid rows plus one class per failure the validators check
+VALID = 0  # Passes every rule
+MISSING_PRODUCT = 1  # Empty product
+BAD_PREFIX = 2  # Product without the configured prefix
+BAD_DECIMALS = 3  # Price with one decimal too many, e.g. 24.995
+NEGATIVE_PRICE = 4  # Price below zero, e.g. -24.99
+TOO_MANY = 5  # Quantity above max_quantity
+CLASS_NAMES = (
+    "valid",
+    "missing_product",
+    "bad_prefix",
+    "bad_decimals",
+    "negative_price",
+    "too_many",
+)  # Index is the class code
+
+
+def load_rules(config_path):  # Rules the generated data must respect
+    """Return min_price, max_quantity, product_prefix and max_decimals."""
+    with open(config_path, "r") as file:  # Same config.yaml as the pipelines
+        config = yaml.safe_load(file)
+    return {
+        "min_price": float(config.get("min_price", 10.0)),
+        "max_quantity": int(config.get("max_quantity", 100)),
+        "product_prefix": config.get("product_prefix", "Halal"),
+        "max_decimals": int(config.get("max_decimals", 2)),
+    }
+
+
+def format_prices(mills, decimals):  # Vectorized price text
+    """Return prices given in thousandths as byte strings with decimals places."""
+    whole = np.abs(mills) // 1000  # Units
+    fraction = (np.abs(mills) % 1000) // 10 ** (3 - decimals)  # 99 or 995
+    price = np.strings.add(
+        np.strings.add(whole.astype("S"), b"."),
+        np.strings.zfill(fraction.astype("S"), decimals),
+    )  # "24.99"
+    return np.where(mills < 0, np.strings.add(b"-", price), price)  # Sign
+
+
+def make_catalog(rng, products, rules):  # Product names and list prices
+    """Return (names, bare names, price mills, price text) arrays for products."""
+    bare = BASE_NAMES[:products] + [
+        f"Product {i}" for i in range(len(BASE_NAMES), products)
+    ]  # Names without the prefix
+    names = [f"{rules['product_prefix']} {name}" for name in bare]  # Valid names
+    lowest = max(1, int(np.ceil(rules["min_price"] * 100)))  # Cheapest valid price
+    cents = rng.integers(lowest, max(lowest + 1, 100000), products)  # .. 999.99
+    mills = cents * 10  # Thousandths: 24990 for 24.99
+    prices = format_prices(mills, rules["max_decimals"])  # Formatted once
+    return np.array(names, dtype="S"), np.array(bare, dtype="S"), mills, prices
+
+
+def product_cdf(products, zipf):  # Popularity of each product
+    """Return the cumulative Zipf(zipf) distribution over products (0 = uniform)."""
+    weights = 1.0 / np.arange(1, products + 1) ** zipf  # Rank 1 is the most popular
+    cdf = np.cumsum(weights)  # Running total
+    return cdf / cdf[-1]  # Normalize to 1
+
+
+def class_probabilities(invalid):  # Row class mix
+    """Return the probability of each class from {class name: ratio}."""
+    probs = np.array([invalid.get(name, 0.0) for name in CLASS_NAMES])  # Invalid
+    if probs.sum() > 1:  # Ratios must leave room for valid rows
+        raise ValueError(f"Invalid ratios add up to {probs.sum()}, more than 1")
+    probs[VALID] = 1 - probs.sum()  # Remaining rows are valid
+    return probs  # Return probabilities
+
+
+def make_chunk(rng, catalog, cdf, probs, rules, count):  # One block of rows
+    """Return the columns of count rows as byte-string and number arrays."""
+    names, bare, list_mills, list_prices = catalog  # Product catalog
+    index = np.minimum(np.searchsorted(cdf, rng.random(count)), len(cdf) - 1)
+    kind = rng.choice(len(CLASS_NAMES), count, p=probs).astype(np.uint8)  # Classes
+    max_quantity = rules["max_quantity"]  # Largest valid quantity
+
+    product = names[index]  # Lookups, no per-row formatting
+    product[kind == BAD_PREFIX] = bare[index[kind == BAD_PREFIX]]  # "Mouse"
+    product[kind == MISSING_PRODUCT] = b""  # Empty product
+    quantity = rng.integers(1, max_quantity + 1, count)  # Valid quantities
+    too_many = kind == TOO_MANY  # Rows over the limit
+    quantity[too_many] = rng.integers(
+        max_quantity + 1, 2 * max_quantity + 1, too_many.sum()
+    )  # e.g. 150
+
+    mills = list_mills[index]  # Price in thousandths: 24990 for 24.99
+    price = list_prices[index].astype("S12")  # Room for "-" and a third decimal
+    bad_decimals = kind == BAD_DECIMALS  # Rows with a third decimal
+    mills[bad_decimals] += rng.integers(1, 10, bad_decimals.sum())  # 24.995
+    mills[kind == NEGATIVE_PRICE] *= -1  # -24.99
+    odd = bad_decimals | (kind == NEGATIVE_PRICE)  # Formatted per row
+    decimals = rules["max_decimals"] + bad_decimals[odd]  # 2 or 3
+    for places in (rules["max_decimals"], rules["max_decimals"] + 1):
+        rows = np.flatnonzero(odd)[decimals == places]  # Rows with this width
+        if len(rows):  # np.strings cannot size an empty result
+            price[rows] = format_prices(mills[rows], places)  # 24.995, -24.99
+    return {
+        "kind": kind,
+        "product": product,
+        "price": price,
+        "quantity": quantity,
+        "mills": mills,
+    }
+
+
+def join_columns(*columns):  # Vectorized "a,b,c\n"
+    """Return one bytes object with the columns joined by commas, one row per line."""
+    line = columns[0]  # First column
+    for column in columns[1:]:  # Append the rest
+        line = np.strings.add(np.strings.add(line, b","), column)
+    return b"\n".join(line.tolist()) + b"\n"  # One write per chunk
+
+
+def sales_lines(chunk, numbers):  # sales.csv rows
+    """Return product,price,quantity lines for a chunk."""
+    return join_columns(chunk["product"], chunk["price"], numbers[chunk["quantity"]])
+
+
+def transaction_lines(chunk, first_id, width, dates, rng, numbers):  # CSV rows
+    """Return transaction_id,product,price,quantity,date lines for a chunk."""
+    count = len(chunk["kind"])  # Rows in chunk
+    ids = np.arange(first_id, first_id + count).astype("S")  # 1, 2, ...
+    ids = np.strings.add(b"T", np.strings.zfill(ids, width))  # T001, T002, ...
+    day = dates[rng.integers(0, len(dates), count)]  # 2023-10-01
+    return join_columns(
+        ids, chunk["product"], chunk["price"], numbers[chunk["quantity"]], day
+    )
+
+
+def api_records(chunk, numbers):  # mock_api.json records
+    """Return the chunk as comma-separated JSON objects (no brackets)."""
+    product = np.strings.add(np.strings.add(b'"', chunk["product"]), b'"')
+    product = np.where(chunk["kind"] == MISSING_PRODUCT, b"null", product)
+    record = np.strings.add(b'{"product":', product)  # {"product":"Halal Mouse"
+    record = np.strings.add(np.strings.add(record, b',"price":'), chunk["price"])
+    record = np.strings.add(
+        np.strings.add(record, b',"quantity":'), numbers[chunk["quantity"]]
+    )
+    return b",\n".join(np.strings.add(record, b"}").tolist())  # One per line
+
+
+def generate(
+    out_dir,
+    rows,
+    products=1000,
+    zipf=1.1,
+    invalid=None,
+    start_date="2023-10-01",
+    end_date="2023-12-31",
+    config_path="data/config.yaml",
+    files=FILES,
+    seed=0,
+):  # Write all outputs chunk by chunk
+    """Write rows rows to sales.csv, transactions.csv and mock_api.json in out_dir.
+
+    Every file holds the same rows. A manifest.json records the row count and
+    exact amount (price * quantity) of each class, so any pipeline can be
+    checked against the rows its rules accept.
+    """
+    rules = load_rules(config_path)  # Same limits as the validators
+    rng = np.random.default_rng(seed)  # Reproducible output
+    date_rng = np.random.default_rng(
+        [seed, 1]
+    )  # Own stream: rows don't depend on files
+    catalog = make_catalog(rng, products, rules)  # Names and prices
+    cdf = product_cdf(products, zipf)  # Product popularity
+    probs = class_probabilities(invalid or {})  # Class mix
+    dates = np.arange(
+        np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1
+    ).astype(
+        "S"
+    )  # Every date in the range, formatted once
+    numbers = np.arange(2 * rules["max_quantity"] + 1).astype("S")  # Quantity text
+    width = max(3, len(str(rows)))  # T001 for small files, like the fixtures
+    os.makedirs(out_dir, exist_ok=True)  # Create output directory
+
+    outputs = {}  # File name -> open binary file
+    if "sales" in files:
+        outputs["sales"] = open(os.path.join(out_dir, "sales.csv"), "wb")
+        outputs["sales"].write(b"product,price,quantity\n")  # Header
+    if "transactions" in files:
+        outputs["transactions"] = open(os.path.join(out_dir, "transactions.csv"), "wb")
+        outputs["transactions"].write(b"transaction_id,product,price,quantity,date\n")
+    if "mock_api" in files:
+        outputs["mock_api"] = open(os.path.join(out_dir, "mock_api.json"), "wb")
+        outputs["mock_api"].write(b"[\n")  # Open JSON list
+
+    counts = [0] * len(CLASS_NAMES)  # Rows per class
+    amounts = [0] * len(CLASS_NAMES)  # Amount per class in thousandths
+    for first in range(0, rows, CHUNK_ROWS):  # One chunk at a time
+        count = min(CHUNK_ROWS, rows - first)  # Rows in this chunk
+        chunk = make_chunk(rng, catalog, cdf, probs, rules, count)  # Generate
+        if "sales" in outputs:
+            outputs["sales"].write(sales_lines(chunk, numbers))
+        if "transactions" in outputs:
+            outputs["transactions"].write(
+                transaction_lines(chunk, first + 1, width, dates, date_rng, numbers)
+            )
+        if "mock_api" in outputs:
+            records = api_records(chunk, numbers)  # JSON objects
+            outputs["mock_api"].write((b",\n" if first else b"") + records)
+        amount = chunk["mills"] * chunk["quantity"]  # Exact int64 per row
+        for code in range(len(CLASS_NAMES)):  # Totals per class
+            mask = chunk["kind"] == code  # Rows of this class
+            counts[code] += int(mask.sum())  # Row count
+            amounts[code] += int(amount[mask].sum())  # Python int, never overflows
+
+    if "mock_api" in outputs:
+        outputs["mock_api"].write(b"\n]\n")  # Close JSON list
+    for file in outputs.values():  # Flush and close every output
+        file.close()
+
+    manifest = {
+        "rows": rows,
+        "products": products,
+        "zipf": zipf,
+        "seed": seed,
+        "rules": rules,
+        "files": sorted(outputs),
+        "classes": {
+            name: {
+                "rows": counts[code],
+                "amount": str(Decimal(amounts[code]).scaleb(-3)),
+            }
+            for code, name in enumerate(CLASS_NAMES)
+        },  # Exact amount as a decimal string
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w") as file:
+        json.dump(manifest, file, indent=2)  # Expected results
+    return manifest  # Return manifest
+
+
+def parse_args():  # Command-line options
+    """Return parsed command-line options."""
+    parser = argparse.ArgumentParser(description="Generate synthetic sales data")
+    parser.add_argument("rows", type=int, help="rows per file")
+    parser.add_argument("--out", default="data/generated", help="output directory")
+    parser.add_argument("--products", type=int, default=1000, help="cardinality")
+    parser.add_argument("--zipf", type=float, default=1.1, help="skew, 0 = uniform")
+    for name in CLASS_NAMES[1:]:  # One ratio per failure class
+        parser.add_argument(
+            "--" + name.replace("_", "-"),
+            type=float,
+            default=0.01,
+            help=f"ratio of {name} rows",
+        )
+    parser.add_argument("--start-date", default="2023-10-01", help="first date")
+    parser.add_argument("--end-date", default="2023-12-31", help="last date")
+    parser.add_argument("--config", default="data/config.yaml", help="rules")
+    parser.add_argument("--files", default=",".join(FILES), help="outputs to write")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    return parser.parse_args()
+
+
+def main():  # Main function
+    """Generate the files and print a summary."""
+    args = parse_args()  # Options
+    invalid = {name: getattr(args, name) for name in CLASS_NAMES[1:]}  # Ratios
+    start = time.perf_counter()  # Start timer
+    manifest = generate(
+        args.out,
+        args.rows,
+        products=args.products,
+        zipf=args.zipf,
+        invalid=invalid,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        config_path=args.config,
+        files=args.files.split(","),
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - start  # Elapsed seconds
+    print(f"Wrote {manifest['files']} to {args.out}")  # Report
+    print(f"{args.rows:,} rows in {elapsed:.1f}s ({args.rows / elapsed:,.0f} rows/sec)")
+    for name, stats in manifest["classes"].items():  # Rows per class
+        print(f"{name}: {stats['rows']:,} rows, amount {stats['amount']}")
+
+
+if __name__ == "__main__":
+    main()  # Run main function